@@ -0,0 +1,64 @@
+import os
+import threading
+from collections import OrderedDict
+import pygame
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AssetCache:
+    """
+    Process-wide image cache.
+    Every source file is decoded once; scaled variants are cached by (file, w, h)
+    with LRU eviction, so all buildings of one size share a single surface.
+    Files can be decoded ahead of time on a worker thread (decode); the main
+    thread only converts them to the display format on first use.
+    """
+
+    def __init__(self, max_scaled=128):
+        self.max_scaled = max_scaled
+        self.images = {}  # file -> decoded Surface
+        self.scaled = OrderedDict()  # (file, w, h) -> scaled Surface
+        self.decoded = {}  # file -> Surface decoded by a worker, not yet converted
+        self.lock = threading.Lock()  # Guards `decoded`
+
+    def load(self, file):
+        """Decoded image (converted to the display format); raises if the file can't be loaded"""
+        image = self.images.get(file)
+        if image is None:
+            with self.lock:
+                image = self.decoded.pop(file, None)
+            if image is None:
+                image = pygame.image.load(os.path.join(ASSET_DIR, file))
+            image = image.convert()
+            self.images[file] = image
+        return image
+
+    def decode(self, file):
+        """Decode an image without converting it (safe on a worker thread, errors are ignored here)"""
+        with self.lock:
+            if file in self.images or file in self.decoded:
+                return
+        try:
+            image = pygame.image.load(os.path.join(ASSET_DIR, file))
+        except (pygame.error, FileNotFoundError):
+            return  # load() reports it when the image is actually needed
+        with self.lock:
+            self.decoded[file] = image
+
+    def scaled_image(self, file, w, h):
+        """Image scaled to (w, h), shared between callers - do not draw onto it"""
+        key = (file, w, h)
+        image = self.scaled.get(key)
+        if image is not None:
+            self.scaled.move_to_end(key)
+            return image
+
+        image = pygame.transform.scale(self.load(file), (w, h))
+        self.scaled[key] = image
+        if len(self.scaled) > self.max_scaled:
+            self.scaled.popitem(last=False)  # Drop least recently used
+        return image
+
+
+assets = AssetCache()
@@ -0,0 +1,231 @@
+import os
+import math
+import threading
+from array import array
+import pygame
+from settings import *
+
+AUDIO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AudioManager:
+    """
+    Background music without blocking startup.
+    Menu and match tracks are streamed through pygame.mixer.music (only the file is
+    opened, nothing is decoded up front). The quiet second match layer has to play
+    alongside the stream, so it is a Sound - decoded on a worker thread the first
+    time it is needed, and never if sounds are not owned or not active.
+    Transitions never wait: a track requested while the stream is still fading out
+    is started by update() once the fade has finished.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        # Streamed tracks: name -> (file, volume)
+        self.tracks = {
+            'menu': ("start.mp3", 0.5),  # Plays in start screen
+            'match': ("Background.mp3", 0.5),  # Plays during gameplay
+        }
+        self.current = None  # Name of the track loaded into mixer.music
+        self.fading_until = 0  # Ticks when the running fade-out of the stream ends
+        self.pending = None  # (name, fade_in_ms) to start after the fade-out
+
+        # Second match sound layer (sound2.mp3) - plays parallel to match music at 75% quieter
+        self.layer_file = "sound2.mp3"
+        self.layer_volume = 0.125  # 0.5 * 0.25 = 0.125 (75% leiser als normal)
+        self.layer_sound = None
+        self.layer_state = 'unloaded'  # unloaded -> loading -> ready | missing
+        self.layer_lock = threading.Lock()
+
+        for name, (file, volume) in self.tracks.items():
+            if not os.path.exists(os.path.join(AUDIO_DIR, file)):
+                print(f"[INFO] Musik '{file}' nicht gefunden, '{name}' bleibt stumm")
+
+    @property
+    def enabled(self):
+        """Music only plays if sounds are owned and active"""
+        return self.game.sounds_owned and self.game.sounds_active
+
+    def play(self, name, fade_ms=0):
+        """Start streaming a track in a loop (no-op if it is already playing)"""
+        if not self.enabled:
+            return
+        if pygame.time.get_ticks() < self.fading_until:
+            # Loading now would cut the fade-out short - start in update() instead
+            self.pending = (name, fade_ms)
+            return
+        if self.current == name and pygame.mixer.music.get_busy():
+            return
+        file, volume = self.tracks[name]
+        try:
+            pygame.mixer.music.load(os.path.join(AUDIO_DIR, file))
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1, fade_ms=fade_ms)
+            self.current = name
+            print(f"[OK] Musik '{file}' gestartet (Stream)")
+        except (pygame.error, FileNotFoundError) as e:
+            self.current = None
+            print(f"[INFO] Konnte Musik '{file}' nicht abspielen: {e}")
+
+    def stop(self, fade_ms=0):
+        """Stop the streamed track, optionally fading it out (returns immediately)"""
+        self.pending = None
+        if fade_ms and self.current is not None:
+            pygame.mixer.music.fadeout(fade_ms)
+            self.fading_until = pygame.time.get_ticks() + fade_ms
+        else:
+            pygame.mixer.music.stop()
+            self.fading_until = 0
+        self.current = None
+
+    def crossfade(self, name, fade_out_ms, fade_in_ms):
+        """Fade the current track out, then fade `name` in - without blocking"""
+        if self.current == name:
+            return
+        if self.current is not None:
+            self.stop(fade_ms=fade_out_ms)
+        self.play(name, fade_ms=fade_in_ms)
+
+    def update(self):
+        """Start a track that was waiting for a fade-out (call once per frame)"""
+        if self.pending and pygame.time.get_ticks() >= self.fading_until:
+            name, fade_ms = self.pending
+            self.pending = None
+            self.fading_until = 0
+            self.play(name, fade_ms=fade_ms)
+
+    def preload_layer(self):
+        """Decode the match layer on a worker thread (only once, only if it can be played)"""
+        with self.layer_lock:
+            if self.layer_state != 'unloaded' or not self.enabled:
+                return
+            self.layer_state = 'loading'
+        threading.Thread(target=self._load_layer, daemon=True).start()
+
+    def _load_layer(self):
+        try:
+            sound = pygame.mixer.Sound(os.path.join(AUDIO_DIR, self.layer_file))
+            sound.set_volume(self.layer_volume)
+            state = 'ready'
+            print(f"[OK] Match-Sound-Layer-2 '{self.layer_file}' geladen (75% leiser)")
+        except (pygame.error, FileNotFoundError) as e:
+            sound = None
+            state = 'missing'
+            print(f"[INFO] Konnte Match-Sound-Layer-2 nicht laden: {e}")
+        with self.layer_lock:
+            self.layer_sound = sound
+            self.layer_state = state
+
+    def play_layer(self, fade_ms=0):
+        """Start the match layer if it has finished decoding (otherwise start decoding it)"""
+        if not self.enabled:
+            return
+        with self.layer_lock:
+            sound = self.layer_sound if self.layer_state == 'ready' else None
+        if sound is None:
+            self.preload_layer()
+            return
+        sound.play(-1, fade_ms=fade_ms)
+
+    def stop_layer(self, fade_ms=0):
+        with self.layer_lock:
+            sound = self.layer_sound
+        if sound is not None:
+            if fade_ms:
+                sound.fadeout(fade_ms)
+            else:
+                sound.stop()
+
+
+class SoundEffects:
+    """
+    Short in-game sound effects on a fixed pool of reserved mixer channels.
+    Every sample is decoded (or synthesized) once at startup; play() only hands it
+    to a channel, so it never blocks the game loop. When all channels are busy the
+    oldest voice is stolen, and each effect has a minimum interval so a grenade
+    killing ten enemies plays one kill sound instead of ten.
+    """
+
+    # name -> (file, fallback tone in Hz, fallback length in ms, volume, min interval in ms)
+    EFFECTS = {
+        'hit': ("sfx_hit.wav", 900, 30, 0.25, 60),
+        'kill': ("sfx_kill.wav", 400, 100, 0.5, 80),  # Same tone as the old winsound beep
+        'explosion': ("sfx_explosion.wav", 90, 250, 0.6, 150),
+    }
+
+    def __init__(self, game, channels=SFX_CHANNELS):
+        self.game = game
+        self.sounds = {}  # name -> Sound
+        self.min_interval = {}  # name -> ms
+        self.last_played = {}  # name -> ticks
+        self.channels = []
+        self.started = []  # Ticks when each pool channel was last started (for voice stealing)
+
+        if not pygame.mixer.get_init():
+            print("[INFO] Kein Audio-Geraet, Soundeffekte deaktiviert")
+            return
+        # Reserve the first channels for effects so the music layer can't occupy them
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels + 2))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.started = [0] * channels
+
+        for name, (file, freq, length, volume, interval) in self.EFFECTS.items():
+            sound = self._load(file) or self._tone(freq, length)
+            if sound is not None:
+                sound.set_volume(volume)
+                self.sounds[name] = sound
+            self.min_interval[name] = interval
+
+    @property
+    def enabled(self):
+        return self.game.sounds_owned and self.game.sounds_active
+
+    def _load(self, file):
+        path = os.path.join(AUDIO_DIR, file)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"[INFO] Konnte Soundeffekt '{file}' nicht laden: {e}")
+            return None
+
+    def _tone(self, freq, length):
+        """Short sine beep with a linear fade-out, built in the mixer's own format"""
+        rate, size, channels = pygame.mixer.get_init()
+        if abs(size) != 16:
+            return None  # Only 16-bit mixers are supported for synthesized tones
+        count = rate * length // 1000
+        samples = array('h')
+        for i in range(count):
+            value = int(12000 * (1 - i / count) * math.sin(2 * math.pi * freq * i / rate))
+            samples.extend([value] * channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    def play(self, name):
+        """Play an effect on a pool channel (returns immediately, may drop or steal a voice)"""
+        if not self.channels or not self.enabled:
+            return
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        now = pygame.time.get_ticks()
+        if now - self.last_played.get(name, -self.min_interval[name]) < self.min_interval[name]:
+            return  # Rate limited
+        self.last_played[name] = now
+
+        index = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = i
+                break
+        if index is None:
+            # All voices busy - steal the one that has been playing longest
+            index = min(range(len(self.channels)), key=self.started.__getitem__)
+        self.channels[index].play(sound)
+        self.started[index] = now
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
@@ -0,0 +1,60 @@
+"""
+Headless benchmark of a team match (25vs25 by default).
+Builds the match without a window or sound device, steps events/update/draw for
+a fixed number of frames and compares the frame times against the FPS budget.
+
+    python benchmark.py [frames] [team_size]
+"""
+import os
+import sys
+import time
+
+# Must be set before pygame opens the display / audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from settings import FPS, TEAM_SIZE_MAX
+from main import Game
+
+WARMUP_FRAMES = 60  # Not measured: first paths, flow fields and surface caches are built here
+
+
+def run_benchmark(frames=600, team_size=25):
+    game = Game()
+    game.game_mode = 'team5v5'
+    game.team_size = max(1, min(TEAM_SIZE_MAX, team_size))
+    game.setup_match()
+    game.playing = True
+    game.dt = 1 / FPS  # Fixed step so every run simulates the same amount of game time
+
+    frame_times = []
+    for frame in range(WARMUP_FRAMES + frames):
+        start = time.perf_counter()
+        game.events()
+        game.update()
+        game.draw()
+        if frame >= WARMUP_FRAMES:
+            frame_times.append((time.perf_counter() - start) * 1000)
+
+    frame_times.sort()
+    budget = 1000 / FPS
+    average = sum(frame_times) / len(frame_times)
+    p95 = frame_times[int(len(frame_times) * 0.95) - 1]
+    over_budget = sum(1 for ms in frame_times if ms > budget)
+    print(f"[BENCH] {game.team_size}vs{game.team_size}, {len(frame_times)} Frames "
+          f"({len(game.team_allies)} blau, {len(game.team_enemies)} rot, {len(game.projectiles)} Projektile am Ende)")
+    print(f"[BENCH] Frame-Zeit: Schnitt {average:.2f} ms, 95% {p95:.2f} ms, max {frame_times[-1]:.2f} ms "
+          f"(Budget {budget:.1f} ms bei {FPS} FPS)")
+    print(f"[BENCH] {over_budget} von {len(frame_times)} Frames über dem Budget")
+    met = p95 <= budget
+    print(f"[BENCH] {'OK' if met else 'ZU LANGSAM'}: 95% der Frames {'innerhalb' if met else 'ausserhalb'} des Budgets")
+    return met
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    team_size = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    met = run_benchmark(frames, team_size)
+    pygame.quit()
+    sys.exit(0 if met else 1)
@@ -0,0 +1,141 @@
+"""
+Array-backed crowd simulation for peaceful civilians.
+All civilians are moved in one batched NumPy step per frame: wander direction
+changes, boids-style separation and wall collision against the nav occupancy grid.
+The sprites only mirror the simulated positions so projectiles, line-of-sight checks
+and drawing keep working unchanged.
+"""
+
+import pygame
+from settings import *
+from sprites import Civilian
+vec = pygame.math.Vector2
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class CrowdCivilian(Civilian):
+    """Civilian whose movement is simulated by CivilianCrowd instead of per-sprite updates"""
+
+    def update(self):
+        pass  # Moved in batch by CivilianCrowd.update
+
+
+class CivilianCrowd:
+    """Batched wander + local avoidance for all civilians (requires numpy)"""
+
+    def __init__(self, game, pathfinding_grid, separation_radius=60, separation_strength=1.5):
+        self.game = game
+        self.grid = pathfinding_grid
+        self.separation_radius = separation_radius
+        self.separation_strength = separation_strength
+        self.speed = ENEMY_SPEED * 0.3  # Slower than enemies (same as Civilian)
+        self.rng = np.random.default_rng()
+
+        self.agents = []  # CrowdCivilian sprites, agent i <-> row i of the arrays
+        self.pos = np.zeros((0, 2))
+        self.wander_dir = np.zeros((0, 2))
+        self.next_turn = np.zeros(0)  # ms timestamp of the next wander direction change
+        self.occupancy = None
+        self.refresh_occupancy()
+
+    def refresh_occupancy(self):
+        """Copy the nav grid into a boolean array (called when walls change)"""
+        self.occupancy = np.array(self.grid.grid, dtype=bool)
+
+    def spawn(self, x, y):
+        """Create a civilian sprite and its simulation row"""
+        civilian = CrowdCivilian(self.game, x, y)
+        now = pygame.time.get_ticks()
+        self.agents.append(civilian)
+        self.pos = np.vstack([self.pos, [x, y]])
+        self.wander_dir = np.vstack([self.wander_dir, self._random_directions(1)])
+        self.next_turn = np.append(self.next_turn, now + self.rng.integers(3000, 5001))
+        return civilian
+
+    def _random_directions(self, count):
+        dirs = self.rng.uniform(-1, 1, (count, 2))
+        lengths = np.linalg.norm(dirs, axis=1, keepdims=True)
+        return np.divide(dirs, lengths, out=np.zeros_like(dirs), where=lengths > 0)
+
+    def _drop_dead(self):
+        """Remove rows of civilians that were killed since the last frame"""
+        alive = np.array([agent.alive() for agent in self.agents], dtype=bool)
+        if alive.all():
+            return
+        self.agents = [agent for agent, keep in zip(self.agents, alive) if keep]
+        self.pos = self.pos[alive]
+        self.wander_dir = self.wander_dir[alive]
+        self.next_turn = self.next_turn[alive]
+
+    def _blocked(self, xs, ys):
+        """For each agent rect at (xs, ys), True if any of its corners lies in a blocked nav cell"""
+        cell = self.grid.cell_size
+        max_x = self.grid.grid_width - 1
+        max_y = self.grid.grid_height - 1
+        blocked = np.zeros(len(xs), dtype=bool)
+        for cx, cy in ((0, 0), (PLAYER_SIZE - 1, 0), (0, PLAYER_SIZE - 1), (PLAYER_SIZE - 1, PLAYER_SIZE - 1)):
+            gx = np.clip(((xs + cx) // cell).astype(int), 0, max_x)
+            gy = np.clip(((ys + cy) // cell).astype(int), 0, max_y)
+            blocked |= self.occupancy[gy, gx]
+        return blocked
+
+    def update(self, dt, now):
+        self._drop_dead()
+        count = len(self.agents)
+        if count == 0:
+            return
+
+        # Batched wander direction changes (every 3-5 seconds per civilian)
+        turning = self.next_turn <= now
+        turn_count = int(turning.sum())
+        if turn_count:
+            self.wander_dir[turning] = self._random_directions(turn_count)
+            self.next_turn[turning] = now + self.rng.integers(3000, 5001, turn_count)
+
+        # Boids-style separation: push away from civilians closer than separation_radius
+        desired = self.wander_dir.copy()
+        if count > 1:
+            diff = self.pos[:, None, :] - self.pos[None, :, :]
+            dist = np.sqrt((diff ** 2).sum(axis=2))
+            close = (dist > 0) & (dist < self.separation_radius)
+            weight = np.zeros_like(dist)
+            weight[close] = (self.separation_radius - dist[close]) / (dist[close] * self.separation_radius)
+            separation = (diff * weight[:, :, None]).sum(axis=1)
+            desired += separation * self.separation_strength
+        lengths = np.linalg.norm(desired, axis=1, keepdims=True)
+        desired = np.divide(desired, lengths, out=np.zeros_like(desired), where=lengths > 0)
+        step = desired * self.speed * dt
+
+        # Move per axis against the occupancy grid and bounce off walls
+        # (agents that start inside a blocked cell may always move, so they can escape)
+        stuck = self._blocked(self.pos[:, 0], self.pos[:, 1])
+        new_x = self.pos[:, 0] + step[:, 0]
+        hit_x = self._blocked(new_x, self.pos[:, 1]) & ~stuck
+        self.pos[:, 0] = np.where(hit_x, self.pos[:, 0], new_x)
+        self.wander_dir[hit_x, 0] *= -1
+
+        new_y = self.pos[:, 1] + step[:, 1]
+        hit_y = self._blocked(self.pos[:, 0], new_y) & ~stuck
+        self.pos[:, 1] = np.where(hit_y, self.pos[:, 1], new_y)
+        self.wander_dir[hit_y, 1] *= -1
+
+        # Boundary checks (bounce off map edges)
+        for axis, limit in ((0, MAP_WIDTH - PLAYER_SIZE), (1, MAP_HEIGHT - PLAYER_SIZE)):
+            out = (self.pos[:, axis] < 0) | (self.pos[:, axis] > limit)
+            self.wander_dir[out, axis] *= -1
+            np.clip(self.pos[:, axis], 0, limit, out=self.pos[:, axis])
+
+        # Mirror positions onto the sprites
+        for agent, (x, y), (vx, vy) in zip(self.agents, self.pos.tolist(), (desired * self.speed).tolist()):
+            agent.pos.x = x
+            agent.pos.y = y
+            agent.vel.x = vx
+            agent.vel.y = vy
+            agent.rect.x = int(x)
+            agent.rect.y = int(y)
@@ -0,0 +1,185 @@
+import math
+import random
+import pygame
+from settings import *
+
+
+class EffectTemplates:
+    """
+    Effect surfaces built once at startup (hit marker, kill animations).
+    Effects reference these prebuilt images instead of creating fonts and drawing
+    circles per hit; each instance only fades with its own alpha.
+    """
+
+    def __init__(self):
+        # SysFont does a system font lookup, so it must not run per hit
+        self.hit_font = pygame.font.SysFont("Arial", 24, bold=True)
+        self.rip_font = pygame.font.SysFont("Arial", 10, bold=True)
+        self.surfaces = {
+            'hit': self._build_hit_marker(),
+            'bloodsplat': self._build_bloodsplat(),
+            'flowers': self._build_flowers(),
+            'gravestone': self._build_gravestone(),
+        }
+
+    def get(self, name):
+        return self.surfaces[name]
+
+    def _build_hit_marker(self):
+        # Larger surface for better visibility
+        image = pygame.Surface((60, 40))
+        image.fill(DARK_GREY)  # Background color (transparent effect)
+        image.set_colorkey(DARK_GREY)  # Make background transparent
+
+        # Draw white background circle for contrast
+        pygame.draw.circle(image, WHITE, (30, 20), 25)  # White background
+        pygame.draw.circle(image, BLACK, (30, 20), 25, 2)  # Black border
+
+        # Draw "HIT!" text - larger and bolder
+        text = self.hit_font.render("HIT!", True, RED)
+        text_rect = text.get_rect(center=(30, 20))
+        image.blit(text, text_rect)
+        return image
+
+    def _kill_surface(self, size=50):
+        image = pygame.Surface((size, size))
+        image.set_colorkey((0, 0, 0))  # Make black transparent
+        image.fill((0, 0, 0))
+        return image
+
+    def _build_bloodsplat(self, size=50):
+        # Red splat
+        image = self._kill_surface(size)
+        pygame.draw.circle(image, (180, 0, 0), (size//2, size//2), size//2)
+        # Add some irregular spots
+        pygame.draw.circle(image, (150, 0, 0), (size//3, size//3), size//4)
+        pygame.draw.circle(image, (200, 20, 20), (size*2//3, size*2//3), size//5)
+        return image
+
+    def _build_flowers(self, size=50):
+        # Colorful flowers
+        image = self._kill_surface(size)
+        colors = [(255, 100, 200), (255, 255, 100), (100, 200, 255), (200, 100, 255)]
+        positions = [(15, 15), (35, 15), (15, 35), (35, 35), (25, 25)]
+        for pos, color in zip(positions, colors):
+            pygame.draw.circle(image, color, pos, 8)
+            pygame.draw.circle(image, (255, 255, 0), pos, 3)  # Yellow center
+        return image
+
+    def _build_gravestone(self, size=50):
+        # Gray gravestone
+        image = self._kill_surface(size)
+        # Draw tombstone shape
+        pygame.draw.rect(image, (100, 100, 100), (12, 15, 26, 30))
+        pygame.draw.ellipse(image, (100, 100, 100), (12, 10, 26, 20))
+        # Add "RIP" text
+        rip_text = self.rip_font.render("RIP", True, (50, 50, 50))
+        image.blit(rip_text, (17, 25))
+        return image
+
+
+class EffectSystem:
+    """
+    Batched short-lived effects: hit markers, kill animations and explosion particles.
+    Effects are rows in parallel arrays (position, velocity, template id, spawn time,
+    lifetime) instead of sprites; one update moves and expires all of them and the
+    camera draws them in one pass using pre-faded copies of the templates.
+    """
+
+    def __init__(self, templates, kill_animations, alpha_steps=16):
+        self.alpha_steps = alpha_steps
+        self.kill_animations = kill_animations
+
+        # Per template id: pre-faded surfaces, fraction of lifetime before fading starts, render layer
+        self.template_ids = {}
+        self.faded = []
+        self.fade_start = []
+        self.layers = []
+        self._register('hit', templates.get('hit'), 0.0, LAYER_EFFECTS)
+        for name in ('bloodsplat', 'flowers', 'gravestone'):
+            self._register(name, templates.get(name), 0.7, LAYER_DECALS)  # Fade out in last 30%
+        for name, color, size in (('spark', (255, 200, 50), 6), ('flame', (255, 120, 0), 8), ('smoke', (90, 90, 90), 10)):
+            particle = pygame.Surface((size, size))
+            particle.fill(color)
+            self._register(name, particle, 0.0, LAYER_EFFECTS)
+
+        # Effect rows
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.template = []
+        self.spawn_time = []
+        self.lifetime = []
+
+    def _register(self, name, surface, fade_start, layer):
+        steps = []
+        for step in range(self.alpha_steps):
+            faded = surface.copy()
+            faded.set_alpha(int(255 * step / (self.alpha_steps - 1)))
+            steps.append(faded)
+        self.template_ids[name] = len(self.faded)
+        self.faded.append(steps)
+        self.fade_start.append(fade_start)
+        self.layers.append(layer)
+
+    def spawn(self, name, x, y, lifetime, vx=0.0, vy=0.0):
+        """Add an effect centered at (x, y); velocity in pixels per second"""
+        self.x.append(float(x))
+        self.y.append(float(y))
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.template.append(self.template_ids[name])
+        self.spawn_time.append(pygame.time.get_ticks())
+        self.lifetime.append(lifetime)
+
+    def hit_marker(self, x, y):
+        self.spawn('hit', x, y, 400)  # Show for 400ms
+
+    def kill_animation(self, x, y, anim_type):
+        self.spawn(anim_type, x, y, self.kill_animations[anim_type]['duration'])
+
+    def explosion(self, x, y, radius):
+        """Burst of particles flying out to roughly the explosion radius"""
+        for _ in range(24):
+            angle = random.uniform(0, 2 * math.pi)
+            lifetime = random.randint(300, 600)
+            speed = random.uniform(0.3, 1.0) * radius / (lifetime / 1000)
+            name = random.choice(('spark', 'flame', 'flame', 'smoke'))
+            self.spawn(name, x, y, lifetime, math.cos(angle) * speed, math.sin(angle) * speed)
+
+    def update(self, dt, now):
+        """Move particles and drop expired effects"""
+        keep = [now - spawn <= life for spawn, life in zip(self.spawn_time, self.lifetime)]
+        if not all(keep):
+            for column in (self.x, self.y, self.vx, self.vy, self.template, self.spawn_time, self.lifetime):
+                column[:] = [value for value, alive in zip(column, keep) if alive]
+        for i, (vx, vy) in enumerate(zip(self.vx, self.vy)):
+            if vx or vy:
+                self.x[i] += vx * dt
+                self.y[i] += vy * dt
+
+    def clear(self):
+        for column in (self.x, self.y, self.vx, self.vy, self.template, self.spawn_time, self.lifetime):
+            column.clear()
+
+    def screen_rects(self, offset_x, offset_y):
+        """Screen rects of all live effects (they fade every frame, so they are always dirty)"""
+        rects = []
+        for x, y, template in zip(self.x, self.y, self.template):
+            w, h = self.faded[template][0].get_size()
+            rects.append(pygame.Rect(int(x) - w // 2 - offset_x, int(y) - h // 2 - offset_y, w, h))
+        return rects
+
+    def draw(self, surface, offset_x, offset_y, layer, now):
+        """Draw all effects of one render layer"""
+        last_step = self.alpha_steps - 1
+        for x, y, template, spawn, life in zip(self.x, self.y, self.template, self.spawn_time, self.lifetime):
+            if self.layers[template] != layer:
+                continue
+            progress = min(1.0, (now - spawn) / life) if life else 1.0
+            fade_start = self.fade_start[template]
+            opacity = 1.0 if progress <= fade_start else 1.0 - (progress - fade_start) / (1.0 - fade_start)
+            image = self.faded[template][int(opacity * last_step + 0.5)]
+            w, h = image.get_size()
+            surface.blit(image, (int(x) - w // 2 - offset_x, int(y) - h // 2 - offset_y))
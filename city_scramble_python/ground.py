@@ -0,0 +1,132 @@
+import os
+import struct
+import pygame
+from settings import *
+from assets import assets, ASSET_DIR
+
+GROUND_CACHE_DIR = os.path.join(ASSET_DIR, ".ground_cache")
+_RAW_HEADER = struct.Struct("<II")  # width, height
+
+
+def _raw_cache_path(img_file):
+    """Cache file for a texture, keyed by the source's mtime and size so edits invalidate it"""
+    stat = os.stat(os.path.join(ASSET_DIR, img_file))
+    name = os.path.splitext(os.path.basename(img_file))[0]
+    return os.path.join(GROUND_CACHE_DIR, f"{name}_{int(stat.st_mtime)}_{stat.st_size}.raw")
+
+
+def load_texture(img_file):
+    """
+    Decoded design texture. With GROUND_DISK_CACHE the decoded pixels are also
+    written to .ground_cache/ as raw RGB, which later game starts read back
+    without running the image decoder.
+    """
+    if not GROUND_DISK_CACHE:
+        return assets.load(img_file)
+    try:
+        raw_path = _raw_cache_path(img_file)
+    except OSError:
+        return assets.load(img_file)  # Let the asset cache report the missing file
+
+    try:
+        with open(raw_path, 'rb') as f:
+            width, height = _RAW_HEADER.unpack(f.read(_RAW_HEADER.size))
+            pixels = f.read()
+        return pygame.image.frombytes(pixels, (width, height), 'RGB').convert()
+    except (OSError, struct.error, ValueError, pygame.error):
+        pass  # Not cached yet (or unreadable) - decode the source
+
+    texture = assets.load(img_file)
+    try:
+        os.makedirs(GROUND_CACHE_DIR, exist_ok=True)
+        tmp_path = raw_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_RAW_HEADER.pack(*texture.get_size()))
+            f.write(pygame.image.tobytes(texture, 'RGB'))
+        os.replace(tmp_path, raw_path)  # Never leave a half-written cache file behind
+    except OSError as e:
+        print(f"[INFO] Konnte Textur-Cache nicht schreiben: {e}")
+    return texture
+
+
+class GroundChunks:
+    """
+    Ground texture of one design, stored as fixed-size chunks.
+    Chunks are rendered lazily the first time the camera sees them and are kept
+    for the lifetime of the process, so later matches with the same design reuse them
+    (only a design change builds a new set).
+    """
+
+    def __init__(self, design_id, design_info, chunk_size=GROUND_CHUNK_SIZE):
+        self.design_id = design_id
+        self.chunk_size = chunk_size
+        self.color = design_info['color']
+        self.texture = None
+        self.chunks = {}  # (chunk_x, chunk_y) -> Surface
+
+        img_file = design_info['img']
+        if img_file:
+            try:
+                self.texture = load_texture(img_file)
+                print(f"[OK] Design-Textur '{img_file}' erfolgreich geladen")
+            except Exception as e:
+                print(f"[FEHLER] Konnte {img_file} nicht laden: {e}")
+
+    def chunk_rect(self, chunk_x, chunk_y):
+        """World rect covered by a chunk (edge chunks are cut at the map border)"""
+        x = chunk_x * self.chunk_size
+        y = chunk_y * self.chunk_size
+        return pygame.Rect(x, y, min(self.chunk_size, MAP_WIDTH - x), min(self.chunk_size, MAP_HEIGHT - y))
+
+    def chunks_in(self, rect):
+        """Chunk coordinates overlapping a world rect (clipped to the map)"""
+        rect = rect.clip(pygame.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT))
+        if not rect.width or not rect.height:
+            return []
+        x1, y1 = rect.left // self.chunk_size, rect.top // self.chunk_size
+        x2, y2 = (rect.right - 1) // self.chunk_size, (rect.bottom - 1) // self.chunk_size
+        return [(cx, cy) for cy in range(y1, y2 + 1) for cx in range(x1, x2 + 1)]
+
+    def get(self, chunk_x, chunk_y):
+        """Ground surface of a chunk, rendered on first use"""
+        chunk = self.chunks.get((chunk_x, chunk_y))
+        if chunk is None:
+            rect = self.chunk_rect(chunk_x, chunk_y)
+            chunk = pygame.Surface(rect.size).convert()
+            if self.texture:
+                # Tile the texture aligned to world coordinates so chunk borders are seamless
+                tex_w, tex_h = self.texture.get_size()
+                for x in range(-(rect.x % tex_w), rect.width, tex_w):
+                    for y in range(-(rect.y % tex_h), rect.height, tex_h):
+                        chunk.blit(self.texture, (x, y))
+            else:
+                chunk.fill(self.color)
+            self.chunks[(chunk_x, chunk_y)] = chunk
+        return chunk
+
+
+# Process-wide cache: design id -> GroundChunks
+_ground_cache = {}
+
+
+def get_ground(design_id, design_info):
+    """Chunked ground of a design, shared across matches"""
+    ground = _ground_cache.get(design_id)
+    if ground is None:
+        ground = GroundChunks(design_id, design_info)
+        _ground_cache[design_id] = ground
+    return ground
+
+
+def preload_ground(design_id, design_info):
+    """Decode a design texture on a worker thread unless it is already cached (in memory or on disk)"""
+    img_file = design_info['img']
+    if not img_file or design_id in _ground_cache:
+        return
+    if GROUND_DISK_CACHE:
+        try:
+            if os.path.exists(_raw_cache_path(img_file)):
+                return
+        except OSError:
+            return
+    assets.decode(img_file)
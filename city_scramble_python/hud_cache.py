@@ -0,0 +1,62 @@
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, text, color).
+    HUD values like score, weapon and timer change rarely compared to the frame rate,
+    so most frames reuse the surface from the previous one.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (font, text, color) -> Surface
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)  # Drop least recently used
+        return surface
+
+    def panel(self, size, color, alpha=None):
+        """Plain (optionally translucent) rectangle, e.g. the tutorial message bar"""
+        key = ('panel', tuple(size), tuple(color), alpha)
+        surface = self.entries.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            self.entries[key] = surface
+        self.entries.move_to_end(key)
+        return surface
+
+
+class HealthBarCache:
+    """Pre-rendered health bars per (width, filled pixels); the fill is quantized to whole pixels"""
+
+    def __init__(self, height=5, back_color=(200, 0, 0), fill_color=(0, 200, 0)):
+        self.height = height
+        self.back_color = back_color
+        self.fill_color = fill_color
+        self.bars = {}  # (width, filled) -> Surface
+
+    def get(self, width, current_hp, max_hp):
+        filled = max(0, min(width, int(width * (current_hp / max_hp))))
+        key = (width, filled)
+        bar = self.bars.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, self.height))
+            bar.fill(self.back_color)  # Background (Red)
+            if filled:
+                bar.fill(self.fill_color, (0, 0, filled, self.height))  # Foreground (Green)
+            self.bars[key] = bar
+        return bar
@@ -2,12 +2,21 @@ import pygame
 import sys
 import random
 import json
-import os
 from menu_system import MenuManager
 from settings import *
 from sprites import *
-from pathfinding import PathfindingGrid
 from spatial_hash import SpatialHash
+from neighbor_index import NeighborIndex
+from squad import SquadCoordinator
+from perception import LineOfSightCache
+from crowd import CivilianCrowd, NUMPY_AVAILABLE
+from uprising import UprisingWave
+from hud_cache import TextCache, HealthBarCache
+from effects import EffectTemplates, EffectSystem
+from palette import RainbowSurfaces
+from minimap import Minimap
+from preload import MatchPreloader
+from audio import AudioManager, SoundEffects
 from data_manager import DataManager
 from network import ensure_server, GameClient, get_local_ip
 
@@ -23,20 +32,18 @@ class Game:
         self.small_font = pygame.font.SysFont("Arial", 18)  # For shop subtexts
         self.medium_font = pygame.font.SysFont("Arial", 26)  # Smaller for compact buttons
         self.large_font = pygame.font.SysFont("Arial", 48)
+        # Rendered HUD text and health bars, reused while values don't change
+        self.text_cache = TextCache()
+        self.health_bars = HealthBarCache()
+        # Hit marker / kill animation surfaces, built once
+        self.effect_templates = EffectTemplates()
+        # Pre-filled rainbow bullet surfaces shared by all rainbow projectiles
+        self.rainbow_projectiles = RainbowSurfaces((10, 10))
         
         self.menu_manager = MenuManager(self)
         self.running = True
         # Default maximum number of enemies; can be changed in the start menu
         self.max_enemies = 7
-        # Sound effects using Windows beep (simple but works)
-        self.sounds_enabled = False
-        try:
-            import winsound
-            self.winsound = winsound
-        except ImportError:
-            self.sounds_enabled = False
-            print("Sound not available on this system")
-        
         # Data Manager initialization
         self.data_manager = DataManager()
         
@@ -55,6 +62,7 @@ class Game:
         self.ai_aim_difficulty = self.data_manager.get('ai_aim_difficulty', 'normal')
         self.ai_dodge_difficulty = self.data_manager.get('ai_dodge_difficulty', 'normal')
         self.game_mode = self.data_manager.get('game_mode', 'classic')
+        self.team_size = max(1, min(TEAM_SIZE_MAX, self.data_manager.get('team_size', TEAM_SIZE_DEFAULT)))
         self.tutorial_completed = self.data_manager.get('tutorial_completed', False)
         self.sounds_owned = self.data_manager.get('sounds_owned', False)
         self.sounds_active = self.data_manager.get('sounds_active', False)
@@ -67,10 +75,10 @@ class Game:
         
         # Design configuration
         self.designs = {
-            'classic': {'name': 'Klassisch', 'img': None, 'color': DARK_GREY},
-            'desert': {'name': 'Wüste', 'img': 'sand.webp', 'color': (235, 215, 175)},
-            'grass': {'name': 'Wiese', 'img': 'grass.png', 'color': (50, 150, 50)},
-            'winter': {'name': 'Winter', 'img': 'snow.png', 'color': (200, 230, 255)}
+            'classic': {'name': 'Klassisch', 'img': None, 'color': DARK_GREY, 'house': 'haus.jpg'},
+            'desert': {'name': 'Wüste', 'img': 'sand.webp', 'color': (235, 215, 175), 'house': 'house_desert.png'},
+            'grass': {'name': 'Wiese', 'img': 'grass.png', 'color': (50, 150, 50), 'house': 'house_grass.png'},
+            'winter': {'name': 'Winter', 'img': 'snow.png', 'color': (200, 230, 255), 'house': 'house_winter.png'}
         }
         
         # Weapon upgrade system (only for player)
@@ -112,61 +120,45 @@ class Game:
             'gravestone': {'name': 'Grabstein', 'duration': 2500, 'cost': 500000}  # 2.5 sec
         }
         
-        # Music setup - separate files for menu and match
-        # Menu music (start.mp3) - plays in start screen
-        self.menu_music_file = os.path.join(os.path.dirname(__file__), "start.mp3")
-        self.menu_music_loaded = False
-        self.menu_music = None
-        
-        # Match music (Background.mp3) - plays during gameplay
-        self.match_music_file = os.path.join(os.path.dirname(__file__), "Background.mp3")
-        self.match_music_loaded = False
-        
-        # Second match sound layer (sound2.mp3) - plays parallel to match music at 75% quieter
-        self.match_sound2_file = os.path.join(os.path.dirname(__file__), "sound2.mp3")
-        self.match_sound2_loaded = False
-        self.match_sound2 = None
-        
-        # Try to load menu music (optional - game works without it)
-        try:
-            self.menu_music = pygame.mixer.Sound(self.menu_music_file)
-            self.menu_music.set_volume(0.5)
-            self.menu_music_loaded = True
-            # Only play if owned and active
-            if self.sounds_owned and self.sounds_active:
-                self.menu_music.play(-1)
-                print(f"[OK] Menue-Musik '{self.menu_music_file}' erfolgreich geladen und gestartet")
-            else:
-                print(f"[OK] Menue-Musik '{self.menu_music_file}' geladen (stumm, da nicht gekauft/aktiv)")
-        except (pygame.error, FileNotFoundError) as e:
-            self.menu_music_loaded = False
-            print(f"[INFO] Konnte Menue-Musik nicht laden: {e}")
-            print(f"       Optional: Fuege 'start.mp3' zum Verzeichnis hinzu fuer Menue-Musik")
-        
-        # Load match music (will be played via pygame.mixer.music)
-        try:
-            pygame.mixer.music.load(self.match_music_file)
-            pygame.mixer.music.set_volume(0.5)
-            self.match_music_loaded = True
-            print(f"[OK] Match-Musik '{self.match_music_file}' erfolgreich geladen")
-        except (pygame.error, FileNotFoundError) as e:
-            self.match_music_loaded = False
-            print(f"[FEHLER] Konnte Match-Musik nicht laden: {e}")
-            print(f"         Gesuchter Pfad: {self.match_music_file}")
-        
-        # Load second match sound layer (optional - plays parallel at 25% volume = 75% quieter)
-        try:
-            self.match_sound2 = pygame.mixer.Sound(self.match_sound2_file)
-            self.match_sound2.set_volume(0.125)  # 0.5 * 0.25 = 0.125 (75% leiser als normal)
-            self.match_sound2_loaded = True
-            print(f"[OK] Match-Sound-Layer-2 '{self.match_sound2_file}' geladen (75% leiser)")
-        except (pygame.error, FileNotFoundError) as e:
-            self.match_sound2_loaded = False
-            print(f"[INFO] Konnte Match-Sound-Layer-2 nicht laden: {e}")
-            print(f"       Optional: Fuege 'sound2.mp3' zum Verzeichnis hinzu")
+        # Next match layout, generated in the background while the menus are open
+        self.preloader = MatchPreloader(self)
+        # Music: tracks are streamed and only opened when first played, so startup doesn't wait on audio
+        self.audio = AudioManager(self)
+        # Sound effects (preloaded, played on a reserved channel pool)
+        self.sfx = SoundEffects(self)
+        self.audio.preload_layer()  # Decodes the match layer in the background (if sounds are active)
 
     def new(self, tutorial_mode=False):
         # Start a new game
+        self.setup_match(tutorial_mode)
+
+        # Sanfter Übergang: Menü-Musik ausblenden (1.5s), Match-Musik einblenden (2s)
+        # und parallel den zweiten Sound-Layer (75% leiser) - nur wenn gekauft und aktiv.
+        # Läuft nebenher, das Match startet sofort.
+        self.audio.crossfade('match', fade_out_ms=1500, fade_in_ms=2000)
+        self.audio.play_layer(fade_ms=2000)
+
+        self.run()
+
+        if DEBUG_STATS:
+            los_stats = self.los_cache.stats()
+            print(f"[Perception] LOS cache: {los_stats['hits']} hits, {los_stats['misses']} misses "
+                  f"({los_stats['hit_rate']:.0%} hit rate)")
+        
+        # Add score to total score and save (unless in tutorial)
+        if not self.tutorial_mode:
+            self.total_score += self.score
+            self.save_total_score()
+            print(f"[DataManager] Match score {self.score} added to total score. Total: {self.total_score}")
+
+        # Fade-Out beider Match-Sounds nach Match-Ende (2 Sekunden)
+        self.audio.stop(fade_ms=2000)  # 2000ms = 2 Sekunden
+        self.audio.stop_layer(fade_ms=2000)
+        print("[OK] Match-Musik und Sound-Layer-2 werden ausgeblendet (2s)...")
+        # Menü-Musik wird in show_start_screen() wieder gestartet, sobald das Fade-Out fertig ist
+
+    def setup_match(self, tutorial_mode=False):
+        """Build the world of a new match (sprites, map, AI) without starting the game loop"""
         self.tutorial_mode = tutorial_mode
         self.tutorial_step = 0
         self.tutorial_progress = 0
@@ -175,6 +167,8 @@ class Game:
         self.tutorial_message = ""
         
         self.all_sprites = CameraGroup(self)  # Use CameraGroup
+        self.minimap = Minimap(self)
+        self.effects = EffectSystem(self.effect_templates, self.kill_animations)
         self.walls = pygame.sprite.Group()
         self.projectiles = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
@@ -183,6 +177,14 @@ class Game:
         self.civilians = pygame.sprite.Group()  # Peaceful civilians
         self.uprising_civilians = pygame.sprite.Group()  # Angry civilians from uprising
 
+        # Perception cache for AI line-of-sight checks (invalidated when walls change)
+        self.los_cache = LineOfSightCache(cell_size=40, ttl=250)
+        # Navigation data is built once all obstacles exist (see below)
+        self.nav_ready = False
+        self.tactical_map = None
+        self.civilian_crowd = None  # Created in spawn_civilians
+        self.uprising_waves = []  # Staged uprising spawns
+
         # Team mode groups
         self.team_allies = pygame.sprite.Group()  # Blue team (player + 4 AI)
         self.team_enemies = pygame.sprite.Group()  # Red team (5 AI)
@@ -193,41 +195,14 @@ class Game:
             self.team_red_score = 0
             self.match_start_time = pygame.time.get_ticks()
             self.match_duration = 180000  # 3 minutes in milliseconds
-            self.team_respawn_queue = []  # (respawn_time, team, x, y)
-
-            # Blue team spawn point (bottom-right)
-            blue_spawn_x = MAP_WIDTH - 200
-            blue_spawn_y = MAP_HEIGHT - 200
-
-            # Red team spawn point (top-left)
-            red_spawn_x = 100
-            red_spawn_y = 100
+            self.team_respawn_queue = []  # (respawn_time, team, member_index)
 
-            # Create player (blue team)
+            # Create player (blue team) - AI members spawn in formation once the map exists
+            blue_spawn_x, blue_spawn_y = TEAM_SPAWNS['blue']
             self.player = Player(self, blue_spawn_x, blue_spawn_y)
             self.player.team = 'blue'
             self.player.image.fill((50, 50, 255))  # Blue color
             self.team_allies.add(self.player)
-
-            # Create 4 blue AI teammates (always 4, regardless of max_enemies setting)
-            for i in range(4):
-                offset_x = random.randint(-100, 100)
-                offset_y = random.randint(-100, 100)
-                x = max(50, min(MAP_WIDTH - 50, blue_spawn_x + offset_x))
-                y = max(50, min(MAP_HEIGHT - 50, blue_spawn_y + offset_y))
-                TeamAI(self, x, y, team='blue', member_index=i+1)
-
-            # Create 5 red AI enemies (always 5, regardless of max_enemies setting)
-            for i in range(5):
-                offset_x = random.randint(-100, 100)
-                offset_y = random.randint(-100, 100)
-                x = max(50, min(MAP_WIDTH - 50, red_spawn_x + offset_x))
-                y = max(50, min(MAP_HEIGHT - 50, red_spawn_y + offset_y))
-                red_ai = TeamAI(self, x, y, team='red', member_index=i)
-                print(f"DEBUG: Created red TeamAI #{i+1}, in team_enemies: {red_ai in self.team_enemies.sprites()}")
-
-            print(f"DEBUG: Total team_enemies: {len(self.team_enemies)}")
-            print(f"DEBUG: Total team_allies: {len(self.team_allies)}")
         else:
             # Normal spawn for non-team modes
             self.player = Player(self, MAP_WIDTH - 100, MAP_HEIGHT - 100)  # Spawn in bottom-right corner
@@ -240,25 +215,26 @@ class Game:
         # Track total enemy count pickups (max 10)
         if not hasattr(self, 'enemy_count_pickups'):
             self.enemy_count_pickups = 0
+
+        # Running totals for the KI-Upgrades display (stored upgrades survive respawns)
+        self.upgrade_totals = {
+            'fire_rate': sum(u.get('fire_rate_bonus', 0) for u in self.enemy_upgrades.values()) // 100,
+            'health': sum(u.get('health_pickups', 0) for u in self.enemy_upgrades.values()),
+        }
         
+        # Buildings, nav grid and spawn points - usually prepared while the menu was open
+        layout = self.preloader.take(tutorial_mode)
+
         # Initial Enemies (use max_enemies) - SKIP IN TUTORIAL AND TEAM MODE
-        if not self.tutorial_mode and self.game_mode != 'team5v5':
-            for i in range(self.max_enemies):
-                while True:
-                    # Spawn in top-left corner area
-                    x = random.randint(0, MAP_WIDTH // 4)
-                    y = random.randint(0, MAP_HEIGHT // 4)
-                    rect = pygame.Rect(x, y, ENEMY_SIZE, ENEMY_SIZE)
-                    if not any(wall.rect.colliderect(rect) for wall in self.walls):
-                        enemy = Enemy(self, x, y)
-                        enemy.enemy_index = i  # Assign unique index
-                        # Restore upgrades if they exist
-                        if i in self.enemy_upgrades:
-                            if 'fire_rate_bonus' in self.enemy_upgrades[i]:
-                                enemy.fire_rate_bonus = self.enemy_upgrades[i]['fire_rate_bonus']
-                            if 'health_pickups' in self.enemy_upgrades[i]:
-                                enemy.health_pickups = self.enemy_upgrades[i]['health_pickups']
-                        break
+        for i, (x, y) in enumerate(layout.enemy_spawns):
+            enemy = Enemy(self, x, y)
+            enemy.enemy_index = i  # Assign unique index
+            # Restore upgrades if they exist
+            if i in self.enemy_upgrades:
+                if 'fire_rate_bonus' in self.enemy_upgrades[i]:
+                    enemy.fire_rate_bonus = self.enemy_upgrades[i]['fire_rate_bonus']
+                if 'health_pickups' in self.enemy_upgrades[i]:
+                    enemy.health_pickups = self.enemy_upgrades[i]['health_pickups']
 
         # Obstacle respawn queue: list of (respawn_time, x, y, w, h)
         self.obstacle_respawn_queue = []
@@ -267,54 +243,26 @@ class Game:
         # Items should not spawn in these zones until building respawns
         self.destroyed_building_zones = []
 
-        if self.game_mode == 'team5v5':
-            # FIXED MAP LAYOUT FOR 5VS5
-            # Create defensive cover around Blue spawn (Bottom-Right)
-            blue_base_x = MAP_WIDTH - 200
-            blue_base_y = MAP_HEIGHT - 200
-            
-            # Defensive walls (U-shape pointing towards center)
-            # Top wall
-            Obstacle(self, blue_base_x - 300, blue_base_y - 200, 400, 50)
-            # Left wall
-            Obstacle(self, blue_base_x - 300, blue_base_y - 200, 50, 400)
-            # Bottom wall
-            Obstacle(self, blue_base_x - 300, blue_base_y + 150, 400, 50)
-            
-            # Some scattered cover in the middle field
-            Obstacle(self, MAP_WIDTH // 2 - 100, MAP_HEIGHT // 2 - 100, 200, 200) # Center block
-            Obstacle(self, MAP_WIDTH // 2 - 400, MAP_HEIGHT // 2 + 200, 100, 100)
-            Obstacle(self, MAP_WIDTH // 2 + 300, MAP_HEIGHT // 2 - 300, 100, 100)
-            
-            # Create defensive cover around Red spawn (Top-Left)
-            red_base_x = 100
-            red_base_y = 100
-            
-            # Defensive walls (U-shape pointing towards center)
-            # Bottom wall
-            Obstacle(self, red_base_x + 100, red_base_y + 300, 400, 50)
-            # Right wall
-            Obstacle(self, red_base_x + 450, red_base_y + 100, 50, 400)
-            # Top wall
-            Obstacle(self, red_base_x + 100, red_base_y - 100, 400, 50)
-
-        else:
-            # Create some obstacles (randomly scattered for now)
-            # In tutorial, create a controlled environment (or just fewer obstacles)
-            num_obstacles = 5 if self.tutorial_mode else 20
-            for _ in range(num_obstacles):
-                x = random.randint(0, MAP_WIDTH - 100)
-                y = random.randint(0, MAP_HEIGHT - 100)
-                w = random.randint(50, 200)
-                h = random.randint(50, 200)
-                # Ensure not spawning on player in tutorial
-                if self.tutorial_mode:
-                    if abs(x - self.player.pos.x) < 300 and abs(y - self.player.pos.y) < 300:
-                        continue
-                Obstacle(self, x, y, w, h)
+        # Buildings of the layout (fixed cover in team mode, random otherwise)
+        for x, y, w, h in layout.obstacles:
+            Obstacle(self, x, y, w, h)
 
-        # Initialize pathfinding grid after all obstacles are created
-        self.pathfinding_grid = PathfindingGrid(MAP_WIDTH, MAP_HEIGHT, self.walls, cell_size=40)
+        if self.game_mode == 'team5v5':
+            # Spawn formations sized to the configured team size (player is blue member 0)
+            self.team_spawn_slots = {
+                team: self.team_formation(spawn[0], spawn[1], self.team_size)
+                for team, spawn in TEAM_SPAWNS.items()
+            }
+            for i, (x, y) in enumerate(self.team_spawn_slots['blue'][1:]):
+                TeamAI(self, x, y, team='blue', member_index=i + 1)
+            for i, (x, y) in enumerate(self.team_spawn_slots['red']):
+                TeamAI(self, x, y, team='red', member_index=i)
+
+        # Navigation data was built from the same rects as the obstacles above
+        self.pathfinding_grid = layout.pathfinding_grid
+        self.free_space_samples = layout.free_space_samples
+        self.tactical_map = layout.tactical_map
+        self.nav_ready = True
         
         # Initialize Spatial Hash Grid for Collision Optimization
         self.spatial_hash = SpatialHash(cell_size=100)
@@ -322,6 +270,11 @@ class Game:
         for wall in self.walls:
             self.spatial_hash.add(wall)
 
+        # Nearest-neighbour index for AI queries (rebuilt every frame in update)
+        self.neighbor_index = NeighborIndex(cell_size=200)
+        # Squad layer: group decisions once per squad per think tick
+        self.squads = SquadCoordinator(self)
+
         # Spawn weapons - SKIP IN TUTORIAL (spawned by script)
         if not self.tutorial_mode:
             self.spawn_weapons()
@@ -335,51 +288,6 @@ class Game:
         self.last_enemy_spawn = pygame.time.get_ticks()
         self.last_weapon_spawn = pygame.time.get_ticks()
         self.last_upgrade_spawn = pygame.time.get_ticks()  # For AI upgrades
-        
-        
-        # Sanfter Übergang: Menü-Musik ausblenden, Match-Musik einblenden
-        if self.menu_music_loaded and self.menu_music:
-            # Fade-Out der Menü-Musik über 1.5 Sekunden
-            self.menu_music.fadeout(1500)  # 1500ms = 1.5 Sekunden
-            print("[OK] Menue-Musik wird ausgeblendet (1.5s)...")
-            # Kurze Pause, damit Fade-Out abgeschlossen wird
-            pygame.time.wait(1500)
-        
-        # Starte Match-Musik nur wenn gekauft und aktiv
-        if self.match_music_loaded and self.sounds_owned and self.sounds_active:
-            try:
-                # Starte Match-Musik mit Fade-In über 2 Sekunden
-                pygame.mixer.music.play(-1, fade_ms=2000)  # fade_ms = 2000ms Fade-In
-                print("[OK] Match-Musik wird eingeblendet (2s) und laeuft in Dauerschleife")
-            except Exception as e:
-                print(f"[FEHLER] Fehler beim Starten der Match-Musik: {e}")
-        else:
-            print("[INFO] Match-Musik nicht geladen oder nicht gekauft, spiele ohne Musik")
-        
-        # Starte parallel den zweiten Sound-Layer (75% leiser) nur wenn gekauft und aktiv
-        if self.match_sound2_loaded and self.match_sound2 and self.sounds_owned and self.sounds_active:
-            try:
-                self.match_sound2.play(-1, fade_ms=2000)  # -1 = Dauerschleife, 2s Fade-In
-                print("[OK] Match-Sound-Layer-2 parallel gestartet (75% leiser, 2s Fade-In)")
-            except Exception as e:
-                print(f"[FEHLER] Fehler beim Starten von Sound-Layer-2: {e}")
-
-        self.run()
-        
-        # Add score to total score and save (unless in tutorial)
-        if not self.tutorial_mode:
-            self.total_score += self.score
-            self.save_total_score()
-            print(f"[DataManager] Match score {self.score} added to total score. Total: {self.total_score}")
-
-        # Fade-Out beider Match-Sounds nach Match-Ende (2 Sekunden)
-        pygame.mixer.music.fadeout(2000)  # 2000ms = 2 Sekunden
-        if self.match_sound2_loaded and self.match_sound2:
-            self.match_sound2.fadeout(2000)
-        print("[OK] Match-Musik und Sound-Layer-2 werden ausgeblendet (2s)...")
-        # Warte kurz, damit Fade-Out abgeschlossen wird
-        pygame.time.wait(2000)
-        # Menü-Musik wird in show_start_screen() wieder gestartet
 
     def spawn_weapons(self):
         for _ in range(WEAPON_SPAWN_COUNT):
@@ -410,7 +318,10 @@ class Game:
 
     def spawn_civilians(self):
         """Spawn peaceful civilians around the map"""
-        num_civilians = 40  # Spawn 40 civilians
+        # Simulate civilians as one array-backed crowd if numpy is available
+        if NUMPY_AVAILABLE:
+            self.civilian_crowd = CivilianCrowd(self, self.pathfinding_grid)
+        num_civilians = CIVILIAN_COUNT
         for _ in range(num_civilians):
             for attempt in range(100):  # Try up to 100 times to find valid position
                 x = random.randint(0, MAP_WIDTH - PLAYER_SIZE)
@@ -418,30 +329,20 @@ class Game:
                 rect = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
                 # Check if civilian would spawn inside a wall
                 if not any(wall.rect.colliderect(rect) for wall in self.walls):
-                    from sprites import Civilian
-                    Civilian(self, x, y)
+                    if self.civilian_crowd:
+                        self.civilian_crowd.spawn(x, y)
+                    else:
+                        from sprites import Civilian
+                        Civilian(self, x, y)
                     break  # Found valid position, move to next civilian
 
     def trigger_uprising(self, attacker, civilian_pos):
         """Trigger civilian uprising - spawn 40 angry civilians to eliminate all enemies"""
-        from sprites import UprisingCivilian, Enemy
-
         num_civilians = 40  # Unified uprising count
         print(f"[UPRISING] Civilian killed by {attacker}! Spawning {num_civilians} angry civilians!")
 
-        for i in range(num_civilians):
-            for attempt in range(100):  # Try up to 100 times per civilian
-                # Spawn around the killed civilian's position
-                offset_x = random.randint(-300, 300)
-                offset_y = random.randint(-300, 300)
-                x = max(0, min(MAP_WIDTH - PLAYER_SIZE, civilian_pos.x + offset_x))
-                y = max(0, min(MAP_HEIGHT - PLAYER_SIZE, civilian_pos.y + offset_y))
-                rect = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
-
-                # Check if position is valid (not in wall)
-                if not any(wall.rect.colliderect(rect) for wall in self.walls):
-                    UprisingCivilian(self, x, y, attacker)
-                    break  # Found valid position, move to next civilian
+        # Spawned over several frames around the killed civilian (see update)
+        self.uprising_waves.append(UprisingWave(self, attacker, civilian_pos, num_civilians))
 
     def run(self):
         # Game Loop
@@ -451,6 +352,7 @@ class Game:
             self.events()
             self.update()
             self.draw()
+            self.audio.update()
 
     def shoot(self, sprite, target_pos=None):
         # Get weapon stats
@@ -487,7 +389,6 @@ class Game:
                 from sprites import UprisingCivilian
                 if isinstance(sprite, UprisingCivilian):
                     owner = 'uprising_civilian'
-                    print(f"[DEBUG] UprisingCivilian shooting with owner: {owner}")
                 else:
                     owner = 'enemy'
             
@@ -528,6 +429,9 @@ class Game:
                 if self.playing:
                     self.playing = False
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Window contents were lost (e.g. after being covered) - repaint everything
+                self.all_sprites.full_redraw = True
 
     def shoot_at_building(self, sprite, target_pos):
         """Shoot at buildings with right-click"""
@@ -588,26 +492,50 @@ class Game:
             projectile_color = (50, 50, 255) if team == 'blue' else (255, 50, 50)
             owner = f'team_{team}'
 
-            print(f"DEBUG: shoot_team called by {team} team, owner={owner}, damage={damage}")
-
             # Create projectiles
             for _ in range(weapon_stats['count']):
                 spread = random.uniform(-weapon_stats['spread'], weapon_stats['spread'])
                 vel = dir.rotate(spread)
                 if weapon_name == 'grenade':
-                    proj = Grenade(self, sprite.rect.centerx, sprite.rect.centery, vel.x, vel.y, owner,
+                    Grenade(self, sprite.rect.centerx, sprite.rect.centery, vel.x, vel.y, owner,
                            damage, weapon_stats['speed'], weapon_stats['lifetime'], projectile_color, False, shooter=sprite)
                 else:
-                    proj = Projectile(self, sprite.rect.centerx, sprite.rect.centery, vel.x, vel.y, owner,
+                    Projectile(self, sprite.rect.centerx, sprite.rect.centery, vel.x, vel.y, owner,
                               damage, weapon_stats['speed'], weapon_stats['lifetime'], projectile_color, False, shooter=sprite)
-                print(f"DEBUG: Created projectile with owner={proj.owner}")
 
-    def schedule_team_respawn(self, team, x, y):
+    def team_formation(self, spawn_x, spawn_y, count, spacing=60):
+        """Formation slots around a team spawn point: closest free lattice points first"""
+        slots = []
+        ring = 0
+        max_ring = max(MAP_WIDTH, MAP_HEIGHT) // spacing
+        while len(slots) < count and ring <= max_ring:
+            # Lattice points on the square ring at distance `ring`, closest first
+            ring_points = [(dx, dy) for dx in range(-ring, ring + 1) for dy in range(-ring, ring + 1)
+                           if max(abs(dx), abs(dy)) == ring]
+            ring_points.sort(key=lambda p: p[0] * p[0] + p[1] * p[1])
+            for dx, dy in ring_points:
+                x = spawn_x + dx * spacing
+                y = spawn_y + dy * spacing
+                if not (50 <= x <= MAP_WIDTH - 50 - PLAYER_SIZE and 50 <= y <= MAP_HEIGHT - 50 - PLAYER_SIZE):
+                    continue
+                rect = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
+                if any(wall.rect.colliderect(rect) for wall in self.walls):
+                    continue
+                slots.append((x, y))
+                if len(slots) >= count:
+                    break
+            ring += 1
+        return slots
+
+    def schedule_team_respawn(self, team, member_index):
         """Schedule a team member to respawn after delay"""
-        respawn_time = pygame.time.get_ticks() + 5000  # 5 second respawn delay
-        self.team_respawn_queue.append((respawn_time, team, x, y))
+        respawn_time = pygame.time.get_ticks() + TEAM_RESPAWN_DELAY
+        self.team_respawn_queue.append((respawn_time, team, member_index))
 
     def update(self):
+        # Team members share a per-frame A* budget (slot changes would otherwise replan everyone at once)
+        self.team_replans_left = TEAM_REPLANS_PER_FRAME
+
         # Update Spatial Hash for dynamic entities
         # Clear dynamic entities from hash (only if we track them separately, 
         # but for simplicity we can just clear and rebuild or remove/add moving ones)
@@ -625,9 +553,31 @@ class Game:
             self.spatial_hash.add(sprite)
         for sprite in self.projectiles:
             self.spatial_hash.add(sprite)
+
+        # Rebuild nearest-neighbour index once per frame for AI target/ally selection
+        self.neighbor_index.rebuild({
+            'enemies': self.enemies,
+            'team_blue': self.team_allies,
+            'team_red': self.team_enemies,
+            'upgrade_items': self.upgrade_items,
+        })
+        self.squads.update(pygame.time.get_ticks())
+
+        # Batched civilian crowd step (crowd sprites have no per-sprite update)
+        if self.civilian_crowd:
+            self.civilian_crowd.update(self.dt, pygame.time.get_ticks())
             
         self.all_sprites.update()
 
+        # Expire and move short-lived effects
+        now = pygame.time.get_ticks()
+        self.effects.update(self.dt, now)
+
+        # Staged uprising spawns
+        for wave in self.uprising_waves:
+            wave.update(now)
+        self.uprising_waves = [wave for wave in self.uprising_waves if not wave.done]
+
         # Check for game over in survival mode
         if self.game_mode == 'survival' and self.player.hit_count >= 10:
             self.playing = False
@@ -645,13 +595,10 @@ class Game:
                 if not hasattr(self, 'player_respawn_time'):
                     self.player_respawn_time = pygame.time.get_ticks() + 5000
                 elif pygame.time.get_ticks() >= self.player_respawn_time:
-                    # Respawn player at blue spawn point
-                    blue_spawn_x = MAP_WIDTH - 200
-                    blue_spawn_y = MAP_HEIGHT - 200
-                    offset_x = random.randint(-100, 100)
-                    offset_y = random.randint(-100, 100)
-                    self.player.pos.x = max(50, min(MAP_WIDTH - 50, blue_spawn_x + offset_x))
-                    self.player.pos.y = max(50, min(MAP_HEIGHT - 50, blue_spawn_y + offset_y))
+                    # Respawn player at a random blue formation slot
+                    spawn_x, spawn_y = random.choice(self.team_spawn_slots['blue'])
+                    self.player.pos.x = spawn_x
+                    self.player.pos.y = spawn_y
                     self.player.rect.x = self.player.pos.x
                     self.player.rect.y = self.player.pos.y
                     self.player.hit_count = 0
@@ -659,16 +606,11 @@ class Game:
 
             # Process team respawn queue
             now = pygame.time.get_ticks()
-            for item in self.team_respawn_queue[:]:
-                respawn_time, team, x, y = item
-                if now >= respawn_time:
-                    # Respawn with random offset
-                    offset_x = random.randint(-100, 100)
-                    offset_y = random.randint(-100, 100)
-                    spawn_x = max(50, min(MAP_WIDTH - 50, x + offset_x))
-                    spawn_y = max(50, min(MAP_HEIGHT - 50, y + offset_y))
-                    TeamAI(self, spawn_x, spawn_y, team=team, member_index=random.randint(0, 4))
-                    self.team_respawn_queue.remove(item)
+            while self.team_respawn_queue and now >= self.team_respawn_queue[0][0]:
+                respawn_time, team, member_index = self.team_respawn_queue.pop(0)
+                # Respawn at a random formation slot of the team, keeping the member index
+                spawn_x, spawn_y = random.choice(self.team_spawn_slots[team])
+                TeamAI(self, spawn_x, spawn_y, team=team, member_index=member_index)
 
         if self.tutorial_mode:
             self.update_tutorial()
@@ -802,6 +744,7 @@ class Game:
                             enemy.fire_rate_bonus = 0
                         enemy.fire_rate_bonus += 100  # 100ms faster
                         self.enemy_upgrades[enemy.enemy_index]['fire_rate_bonus'] = enemy.fire_rate_bonus
+                        self.upgrade_totals['fire_rate'] += 1
                     elif upgrade.upgrade_type == 'enemy_count':
                         # Increase enemy count (max 10 pickups)
                         if self.enemy_count_pickups < 10:
@@ -827,6 +770,7 @@ class Game:
                             enemy.health_pickups = 0
                         enemy.health_pickups += 1
                         self.enemy_upgrades[enemy.enemy_index]['health_pickups'] = enemy.health_pickups
+                        self.upgrade_totals['health'] += 1
         
         # Obstacle Respawn Logic
         now = pygame.time.get_ticks()
@@ -925,21 +869,18 @@ class Game:
                 self.menu_manager.show_message_box("Tutorial Abgeschlossen", "Du bist bereit für das Spiel!")
 
     def draw(self):
-        self.screen.fill(DARK_GREY)
         self.all_sprites.custom_draw(self.player)
         
         # Tutorial Overlay
         if self.tutorial_mode:
             # Semi-transparent bar at bottom
-            s = pygame.Surface((SCREEN_WIDTH, 60))
-            s.set_alpha(180)
-            s.fill((0, 0, 0))
-            self.screen.blit(s, (0, SCREEN_HEIGHT - 60))
+            s = self.text_cache.panel((SCREEN_WIDTH, 60), (0, 0, 0), 180)
+            self.all_sprites.add_overlay(self.screen.blit(s, (0, SCREEN_HEIGHT - 60)))
             
             # Message
-            msg_surf = self.medium_font.render(self.tutorial_message, True, (255, 255, 0))
+            msg_surf = self.text_cache.render(self.medium_font, self.tutorial_message, (255, 255, 0))
             msg_rect = msg_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-            self.screen.blit(msg_surf, msg_rect)
+            self.all_sprites.add_overlay(self.screen.blit(msg_surf, msg_rect))
         
         # HUD
         if self.game_mode == 'team5v5':
@@ -950,16 +891,16 @@ class Game:
             minutes = remaining // 60000
             seconds = (remaining % 60000) // 1000
             timer_text = f"{minutes}:{seconds:02d}"
-            timer_surf = self.large_font.render(timer_text, True, WHITE)
-            self.screen.blit(timer_surf, (SCREEN_WIDTH // 2 - 50, 10))
+            timer_surf = self.text_cache.render(self.large_font, timer_text, WHITE)
+            self.all_sprites.add_overlay(self.screen.blit(timer_surf, (SCREEN_WIDTH // 2 - 50, 10)))
 
             # Team scores (top corners)
             blue_score_text = f"BLAU: {self.team_blue_score}"
             red_score_text = f"ROT: {self.team_red_score}"
-            blue_surf = self.font.render(blue_score_text, True, (50, 50, 255))
-            red_surf = self.font.render(red_score_text, True, (255, 50, 50))
-            self.screen.blit(blue_surf, (10, 10))
-            self.screen.blit(red_surf, (SCREEN_WIDTH - 150, 10))
+            blue_surf = self.text_cache.render(self.font, blue_score_text, (50, 50, 255))
+            red_surf = self.text_cache.render(self.font, red_score_text, (255, 50, 50))
+            self.all_sprites.add_overlay(self.screen.blit(blue_surf, (10, 10)))
+            self.all_sprites.add_overlay(self.screen.blit(red_surf, (SCREEN_WIDTH - 150, 10)))
 
             # Weapon and hits info
             self.draw_text(f"Weapon: {self.player.weapon.upper()}", 10, SCREEN_HEIGHT - 30)
@@ -978,69 +919,17 @@ class Game:
         if self.minimap_owned and self.minimap_active:
             self.draw_minimap()
         
-        pygame.display.flip()
+        self.all_sprites.present()
     
     def draw_minimap(self):
-        """Draw a mini-map in the top-right corner showing buildings, enemies, and player"""
-        # Mini-map dimensions and position
-        minimap_width = 200
-        minimap_height = int(minimap_width * (MAP_HEIGHT / MAP_WIDTH))  # Keep aspect ratio
-        minimap_x = SCREEN_WIDTH - minimap_width - 10  # 10px from right edge
-        minimap_y = 50  # Below the enemy upgrades display
-        
-        # Scaling factors
-        scale_x = minimap_width / MAP_WIDTH
-        scale_y = minimap_height / MAP_HEIGHT
-        
-        # Draw background and border
-        minimap_rect = pygame.Rect(minimap_x, minimap_y, minimap_width, minimap_height)
-        pygame.draw.rect(self.screen, (20, 20, 20), minimap_rect)  # Dark background
-        pygame.draw.rect(self.screen, WHITE, minimap_rect, 2)  # White border
-        
-        # Draw obstacles (buildings) on mini-map
-        for wall in self.walls:
-            scaled_x = minimap_x + int(wall.rect.x * scale_x)
-            scaled_y = minimap_y + int(wall.rect.y * scale_y)
-            scaled_w = max(2, int(wall.rect.width * scale_x))  # Minimum 2px width
-            scaled_h = max(2, int(wall.rect.height * scale_y))  # Minimum 2px height
-            pygame.draw.rect(self.screen, (80, 80, 80), (scaled_x, scaled_y, scaled_w, scaled_h))
-        
-        # Draw enemies on mini-map
-        if self.game_mode == 'team5v5':
-            # Draw red team (enemies)
-            for enemy in self.team_enemies:
-                scaled_x = minimap_x + int(enemy.pos.x * scale_x)
-                scaled_y = minimap_y + int(enemy.pos.y * scale_y)
-                pygame.draw.circle(self.screen, RED, (scaled_x, scaled_y), 3)
-            
-            # Draw blue team (allies) - excluding player which is drawn later
-            for ally in self.team_allies:
-                if ally != self.player:
-                    scaled_x = minimap_x + int(ally.pos.x * scale_x)
-                    scaled_y = minimap_y + int(ally.pos.y * scale_y)
-                    pygame.draw.circle(self.screen, (100, 100, 255), (scaled_x, scaled_y), 3) # Lighter blue
-        else:
-            for enemy in self.enemies:
-                scaled_x = minimap_x + int(enemy.pos.x * scale_x)
-                scaled_y = minimap_y + int(enemy.pos.y * scale_y)
-                pygame.draw.circle(self.screen, RED, (scaled_x, scaled_y), 3)  # 3px red circles
-        
-        # Draw player on mini-map
-        player_scaled_x = minimap_x + int(self.player.pos.x * scale_x)
-        player_scaled_y = minimap_y + int(self.player.pos.y * scale_y)
-        pygame.draw.circle(self.screen, GREEN, (player_scaled_x, player_scaled_y), 4)  # 4px green circle
+        """Draw the mini-map (cached building layer + dot overlay) in the top-right corner"""
+        self.all_sprites.add_overlay(self.minimap.draw(self.screen))
     
     def draw_enemy_upgrades(self):
         """Display enemy upgrade statistics at top of screen"""
-        # Count total upgrades for all enemies
-        total_fire_rate = 0
-        total_health_pickups = 0
-        
-        for enemy in self.enemies:
-            if hasattr(enemy, 'fire_rate_bonus'):
-                total_fire_rate += enemy.fire_rate_bonus // 100  # Convert ms to count
-            if hasattr(enemy, 'health_pickups'):
-                total_health_pickups += enemy.health_pickups
+        # Running totals, updated on pickup
+        total_fire_rate = self.upgrade_totals['fire_rate']
+        total_health_pickups = self.upgrade_totals['health']
         
         # Display at top center - always visible
         y_offset = 10
@@ -1059,8 +948,8 @@ class Game:
         self.draw_text(f"Heilung: {total_health_pickups}x", x_start + 390, y_offset, (50, 255, 50))
 
     def draw_text(self, text, x, y, color=WHITE):
-        surface = self.font.render(text, True, color)
-        self.screen.blit(surface, (x, y))
+        surface = self.text_cache.render(self.font, text, color)
+        self.all_sprites.add_overlay(self.screen.blit(surface, (x, y)))
     
     def schedule_obstacle_respawn(self, x, y, w, h):
         """Schedule an obstacle to respawn after 20 seconds"""
@@ -1070,6 +959,22 @@ class Game:
         destroyed_zone = pygame.Rect(x, y, w, h)
         self.destroyed_building_zones.append(destroyed_zone)
 
+    def walls_changed(self, rect):
+        """Called whenever an obstacle appears or disappears; refreshes wall-derived caches"""
+        los_cache = getattr(self, 'los_cache', None)
+        if los_cache:
+            los_cache.invalidate()
+        # Re-bake the building layer below the changed rect and the minimap buildings
+        self.all_sprites.rebake(rect)
+        self.minimap.invalidate()
+        # Keep navigation data in sync, but only for the cells around the changed building
+        if getattr(self, 'nav_ready', False):
+            self.pathfinding_grid.update_region(rect, self.walls)
+            if self.tactical_map:
+                self.tactical_map.update_region(rect)
+            if self.civilian_crowd:
+                self.civilian_crowd.refresh_occupancy()
+
     def start_multiplayer_game(self, client, is_host):
         """Start multiplayer match with level 20 weapons"""
         # Save original weapons
@@ -1091,7 +996,9 @@ class Game:
         from sprites import NetworkPlayer
         
         # Initialize game world
-        self.all_sprites = CameraGroup()
+        self.all_sprites = CameraGroup(self)
+        self.minimap = Minimap(self)
+        self.effects = EffectSystem(self.effect_templates, self.kill_animations)
         self.walls = pygame.sprite.Group()
         self.projectiles = pygame.sprite.Group()
         self.items = pygame.sprite.Group()
@@ -1101,6 +1008,9 @@ class Game:
         self.destroyed_building_zones = []
         self.obstacle_respawn_queue = []
         self.tutorial_mode = False
+        self.nav_ready = False  # No AI navigation in multiplayer
+        self.tactical_map = None
+        self.civilian_crowd = None
         
         # Create players
         # Host: Bottom-Right, Client: Top-Left
@@ -1164,6 +1074,9 @@ class Game:
                         self.playing = False
                         client.close()
                         return
+                    if event.type == pygame.WINDOWEXPOSED:
+                        # Window contents were lost (e.g. after being covered) - repaint everything
+                        self.all_sprites.full_redraw = True
                 
                 # Update local player
                 self.player.get_keys()
@@ -1245,6 +1158,7 @@ class Game:
 
                 # Update sprites
                 self.all_sprites.update()
+                self.effects.update(self.dt, pygame.time.get_ticks())
                 
                 # Weapon pickups for local player
                 hits = pygame.sprite.spritecollide(self.player, self.items, True)
@@ -1267,7 +1181,6 @@ class Game:
                     self.playing = False
                 
                 # Draw
-                self.screen.fill(DARK_GREY)
                 self.all_sprites.custom_draw(self.player)
                 
                 # HUD
@@ -1275,7 +1188,7 @@ class Game:
                 self.draw_text(f"Gegner Treffer: {self.network_player.hit_count}/10", 10, 40)
                 self.draw_text(f"Waffe: {self.player.weapon.upper()}", 10, SCREEN_HEIGHT - 30)
                 
-                pygame.display.flip()
+                self.all_sprites.present()
             
             # End of Round
             if not client.connected:
@@ -1313,6 +1226,7 @@ class Game:
         self.data_manager.set('ai_dodge_difficulty', self.ai_dodge_difficulty)
         self.data_manager.set('tutorial_completed', self.tutorial_completed)
         self.data_manager.set('game_mode', self.game_mode)
+        self.data_manager.set('team_size', self.team_size)
         self.data_manager.set('sounds_owned', self.sounds_owned)
         self.data_manager.set('sounds_active', self.sounds_active)
         self.data_manager.set('owned_designs', self.owned_designs)
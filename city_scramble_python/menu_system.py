@@ -7,6 +7,8 @@ import time
 from network import ensure_server, GameClient, get_local_ip
 from settings import *
 from sprites import *
+from widgets import WidgetScreen, Label, Button, Grid
+from shop_catalog import build_catalogs
 
 class MenuManager:
     def __init__(self, game):
@@ -19,6 +21,41 @@ class MenuManager:
         self.medium_font = game.medium_font
         self.large_font = game.large_font
         self.small_font = game.small_font
+        self.tiny_font = pygame.font.SysFont("Arial", 16)  # Sell buttons in the wardrobes
+        self.code_font = pygame.font.SysFont("Arial", 72, bold=True)  # Multiplayer room code
+        # Cosmetic shop/wardrobe catalogs, built from the game's item dictionaries
+        self.catalogs = build_catalogs(game)
+
+    # Events that change what a menu shows; everything else (mouse motion, focus...) is ignored
+    MENU_EVENTS = {
+        pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+        pygame.KEYDOWN, pygame.TEXTINPUT, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+    }
+
+    def wait_events(self, timeout=MENU_IDLE_MS):
+        """
+        Input for one menu iteration. Caps the loop at MENU_FPS, then sleeps in
+        pygame.event.wait until a relevant event arrives or `timeout` ms pass, so a
+        menu nobody touches costs almost no CPU. Returns the relevant events
+        (empty after a timeout); the caller redraws once per call.
+        """
+        self.clock.tick(MENU_FPS)
+        audio = self.game.audio
+        audio.update()  # Menu music waiting for the match music to fade out
+        deadline = pygame.time.get_ticks() + timeout
+        while True:
+            wait_ms = deadline - pygame.time.get_ticks()
+            if audio.pending:
+                wait_ms = min(wait_ms, audio.fading_until - pygame.time.get_ticks())
+            if wait_ms <= 0:
+                audio.update()
+                return []
+            event = pygame.event.wait(wait_ms)
+            if event.type == pygame.NOEVENT:
+                continue  # Timed out - loop once more to run audio.update and return
+            events = [e for e in [event] + pygame.event.get() if e.type in self.MENU_EVENTS]
+            if events:
+                return events
 
     def draw_text(self, text, x, y, color=WHITE, align="topleft"):
         text_surface = self.font.render(text, True, color)
@@ -30,8 +67,7 @@ class MenuManager:
         self.screen.blit(text_surface, text_rect)
 
     def show_start_screen(self):
-        if self.game.menu_music_loaded and self.game.menu_music and self.game.sounds_owned and self.game.sounds_active:
-            self.game.menu_music.play(-1)
+        self.game.audio.play('menu')  # Only if owned and active; keeps playing if already running
             
         # Button setup
         button_width = 300
@@ -56,6 +92,7 @@ class MenuManager:
         start_button = pygame.Rect(SCREEN_WIDTH // 2 - 140, buttons_start_y + (button_height + button_spacing) * 6 + 15, 280, 55)
         
         while True:
+            self.game.preloader.start()  # Next map is built in the background (restarts if settings change)
             self.screen.fill(DARK_GREY)
             # Title
             title_text = self.large_font.render(TITLE, True, WHITE)
@@ -72,7 +109,8 @@ class MenuManager:
             self.screen.blit(total_score_text, total_score_rect)
             
             # Game Mode button
-            mode_names = {'classic': 'Klassisch', 'survival': 'Überlebens-Modus', 'team5v5': '5vs5 Team'}
+            team_size = self.game.team_size
+            mode_names = {'classic': 'Klassisch', 'survival': 'Überlebens-Modus', 'team5v5': f'{team_size}vs{team_size} Team'}
             mode_colors = {'classic': (100, 200, 100), 'survival': (255, 100, 50), 'team5v5': (100, 100, 255)}
             current_mode_name = mode_names[self.game.game_mode]
             current_mode_color = mode_colors[self.game.game_mode]
@@ -83,10 +121,14 @@ class MenuManager:
             mode_text_rect = mode_text.get_rect(center=game_mode_button.center)
             self.screen.blit(mode_text, mode_text_rect)
 
-            # Enemy count button
+            # Enemy count button (team size in team mode)
             pygame.draw.rect(self.screen, LIGHT_GREY, enemy_button)
             pygame.draw.rect(self.screen, WHITE, enemy_button, 3)
-            enemy_text = self.medium_font.render(f"Gegner: {self.game.max_enemies}", True, WHITE)
+            if self.game.game_mode == 'team5v5':
+                enemy_label = f"Team-Größe: {team_size}"
+            else:
+                enemy_label = f"Gegner: {self.game.max_enemies}"
+            enemy_text = self.medium_font.render(enemy_label, True, WHITE)
             enemy_text_rect = enemy_text.get_rect(center=enemy_button.center)
             self.screen.blit(enemy_text, enemy_text_rect)
             
@@ -141,7 +183,7 @@ class MenuManager:
             self.screen.blit(start_text, start_text_rect)
             
             pygame.display.flip()
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -155,6 +197,12 @@ class MenuManager:
                         else:
                             self.game.game_mode = 'classic'
                         self.game.save_total_score()  # Save the setting
+                    elif enemy_button.collidepoint(event.pos) and self.game.game_mode == 'team5v5':
+                        # Ask for team size (1 - TEAM_SIZE_MAX per team)
+                        new_size = self.get_text_input(f"TEAM-GRÖSSE (1-{TEAM_SIZE_MAX}):", str(self.game.team_size), max_length=2)
+                        if new_size and new_size.isdigit():
+                            self.game.team_size = max(1, min(TEAM_SIZE_MAX, int(new_size)))
+                            self.game.save_total_score()  # Save the setting
                     elif enemy_button.collidepoint(event.pos):
                         # Ask for enemy count
                         new_count = self.get_text_input("ANZAHL GEGNER:", str(self.game.max_enemies), max_length=5)
@@ -252,7 +300,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -333,7 +381,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -413,7 +461,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -495,7 +543,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -519,739 +567,193 @@ class MenuManager:
 
     def show_character_shop(self):
         """Character shop screen for buying character colors"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid of color buttons (2 columns)
-        colors_per_row = 2
-        button_width = 220
-        button_height = 50
-        button_spacing = 20
-        start_x = SCREEN_WIDTH // 2 - (colors_per_row * button_width + (colors_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        color_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for colors not yet owned (excluding white which is default)
-        available_colors = {k: v for k, v in self.game.character_colors.items() 
-                           if k not in self.game.owned_colors and k != 'white'}
-        
-        for color_id, color_data in available_colors.items():
-            x = start_x + col * (button_width + button_spacing)
-            y = start_y + row * (button_height + button_spacing)
-            color_buttons[color_id] = pygame.Rect(x, y, button_width, button_height)
-            col += 1
-            if col >= colors_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("CHARAKTER-SHOP", True, (200, 100, 200))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 180, 40))
-            
-            # Current score
-            self.draw_text(f"Verfügbare Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 100, 100)
-            self.draw_text(f"Farbenpreis: 15.000 (Spezial teurer)", SCREEN_WIDTH // 2 - 120, 130)
-            
-            # Draw color buttons
-            for color_id, button_rect in color_buttons.items():
-                color_data = self.game.character_colors[color_id]
-                can_afford = self.game.total_score >= color_data['cost']
-                
-                # Button background
-                button_color = color_data['rgb'] if can_afford else (60, 60, 60)
-                pygame.draw.rect(self.screen, button_color, button_rect)
-                pygame.draw.rect(self.screen, WHITE, button_rect, 3)
-                
-                # Text
-                text_color = BLACK if sum(color_data['rgb']) > 400 else WHITE
-                name_surface = self.font.render(color_data['name'], True, text_color if can_afford else (120, 120, 120))
-                price_surface = self.font.render(f"{color_data['cost']:,} Punkte", True, text_color if can_afford else (120, 120, 120))
-                
-                self.screen.blit(name_surface, (button_rect.x + 10, button_rect.y + 5))
-                self.screen.blit(price_surface, (button_rect.x + 10, button_rect.y + 27))
-            
-            # If no colors available
-            if not color_buttons:
-                no_colors_text = self.large_font.render("Alle Farben bereits gekauft!", True, (100, 255, 100))
-                self.screen.blit(no_colors_text, (SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 - 30))
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
-                        return
-                    
-                    # Check color button clicks
-                    for color_id, button_rect in color_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            color_data = self.game.character_colors[color_id]
-                            if self.game.total_score >= color_data['cost']:
-                                # Purchase color
-                                self.game.total_score -= color_data['cost']
-                                self.game.owned_colors.append(color_id)
-                                self.game.save_total_score()
-                                message = f"{color_data['name']} gekauft!"
-                                message_color = (100, 255, 100)
-                                # Remove from available colors
-                                del color_buttons[color_id]
-                                
-                                # Rebuild buttons
-                                color_buttons.clear()
-                                row = 0
-                                col = 0
-                                available_colors = {k: v for k, v in self.game.character_colors.items() 
-                                                   if k not in self.game.owned_colors and k != 'white'}
-                                for new_color_id, new_color_data in available_colors.items():
-                                    x = start_x + col * (button_width + button_spacing)
-                                    y = start_y + row * (button_height + button_spacing)
-                                    color_buttons[new_color_id] = pygame.Rect(x, y, button_width, button_height)
-                                    col += 1
-                                    if col >= colors_per_row:
-                                        col = 0
-                                        row += 1
-                                break
-                            else:
-                                message = "Nicht genug Punkte!"
-                                message_color = (255, 100, 100)
+        self.show_catalog_shop('character')
 
     def show_wardrobe(self):
         """Wardrobe screen for selecting owned character colors"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid of color buttons (3 columns)
-        colors_per_row = 3
-        button_size = 100
-        sell_button_height = 30
-        button_spacing = 20
-        vertical_spacing = button_size + sell_button_height + 10  # Space for sell button
-        start_x = SCREEN_WIDTH // 2 - (colors_per_row * button_size + (colors_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        color_buttons = {}
-        sell_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for owned colors
-        for color_id in self.game.owned_colors:
-            x = start_x + col * (button_size + button_spacing)
-            y = start_y + row * vertical_spacing
-            color_buttons[color_id] = pygame.Rect(x, y, button_size, button_size)
-            
-            # Add sell button only for non-white colors
-            if color_id != 'white':
-                sell_buttons[color_id] = pygame.Rect(x, y + button_size + 5, button_size, sell_button_height)
-            
-            col += 1
-            if col >= colors_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("KLEIDERSCHRANK", True, (100, 150, 200))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 200, 40))
-            
-            # Current selection and points
-            current_color_name = self.game.character_colors[self.game.selected_color]['name']
-            self.draw_text(f"Aktuelle Farbe: {current_color_name}", SCREEN_WIDTH // 2 - 100, 100)
-            self.draw_text(f"Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 60, 130)
-            
-            # Draw color buttons
-            for color_id, button_rect in color_buttons.items():
-                color_data = self.game.character_colors[color_id]
-                
-                # Button background
-                pygame.draw.rect(self.screen, color_data['rgb'], button_rect)
-                
-                # Highlight selected color
-                border_width = 5 if color_id == self.game.selected_color else 2
-                border_color = (255, 215, 0) if color_id == self.game.selected_color else WHITE
-                pygame.draw.rect(self.screen, border_color, button_rect, border_width)
-                
-                # Text
-                text_color = BLACK if sum(color_data['rgb']) > 400 else WHITE
-                name_surface = self.font.render(color_data['name'], True, text_color)
-                # Center text
-                text_rect = name_surface.get_rect(center=button_rect.center)
-                self.screen.blit(name_surface, text_rect)
-            
-            # Draw sell buttons
-            for color_id, sell_button_rect in sell_buttons.items():
-                color_data = self.game.character_colors[color_id]
-                sell_price = color_data['cost'] // 2  # 50% of original price
-                
-                # Sell button
-                pygame.draw.rect(self.screen, (180, 50, 50), sell_button_rect)
-                pygame.draw.rect(self.screen, WHITE, sell_button_rect, 1)
-                
-                # Sell text
-                small_font = pygame.font.SysFont("Arial", 16)
-                sell_text = small_font.render(f"Verkauf: {sell_price:,}", True, WHITE)
-                text_rect = sell_text.get_rect(center=sell_button_rect.center)
-                self.screen.blit(sell_text, text_rect)
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
-                        return
-                    
-                    # Check sell button clicks first
-                    for color_id, sell_button_rect in sell_buttons.items():
-                        if sell_button_rect.collidepoint(event.pos):
-                            color_data = self.game.character_colors[color_id]
-                            sell_price = color_data['cost'] // 2
-                            
-                            # Sell the color
-                            self.game.total_score += sell_price
-                            self.game.owned_colors.remove(color_id)
-                            
-                            # If selling the currently selected color, switch to white
-                            if self.game.selected_color == color_id:
-                                self.game.selected_color = 'white'
-                            
-                            self.game.save_total_score()
-                            message = f"{color_data['name']} verkauft für {sell_price:,} Punkte!"
-                            message_color = (255, 215, 0)
-                            
-                            # Rebuild buttons
-                            color_buttons.clear()
-                            sell_buttons.clear()
-                            row = 0
-                            col = 0
-                            
-                            for new_color_id in self.game.owned_colors:
-                                x = start_x + col * (button_size + button_spacing)
-                                y = start_y + row * vertical_spacing
-                                color_buttons[new_color_id] = pygame.Rect(x, y, button_size, button_size)
-                                
-                                if new_color_id != 'white':
-                                    sell_buttons[new_color_id] = pygame.Rect(x, y + button_size + 5, button_size, sell_button_height)
-                                
-                                col += 1
-                                if col >= colors_per_row:
-                                    col = 0
-                                    row += 1
-                            break
-                    
-                    # Check color button clicks
-                    for color_id, button_rect in color_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            self.game.selected_color = color_id
-                            self.game.save_total_score()
-                            color_name = self.game.character_colors[color_id]['name']
-                            message = f"Farbe gewählt: {color_name}"
-                            message_color = (100, 255, 100)
-                            break
+        self.show_catalog_wardrobe('character')
 
     def show_bullet_shop(self):
         """Bullet shop screen for buying bullet colors"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid of color buttons (2 columns)
-        colors_per_row = 2
-        button_width = 220
-        button_height = 50
-        button_spacing = 20
-        start_x = SCREEN_WIDTH // 2 - (colors_per_row * button_width + (colors_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        color_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for colors not yet owned (excluding white which is default)
-        available_colors = {k: v for k, v in self.game.bullet_colors.items() 
-                           if k not in self.game.owned_bullet_colors and k != 'white'}
-        
-        for color_id, color_data in available_colors.items():
-            x = start_x + col * (button_width + button_spacing)
-            y = start_y + row * (button_height + button_spacing)
-            color_buttons[color_id] = pygame.Rect(x, y, button_width, button_height)
-            col += 1
-            if col >= colors_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("KUGEL-SHOP", True, (255, 150, 50))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 140, 40))
-            
-            # Current score
-            self.draw_text(f"Verfügbare Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 100, 100)
-            self.draw_text(f"Farbenpreise wie im Charakter-Shop", SCREEN_WIDTH // 2 - 140, 130)
-            
-            # Draw color buttons
-            for color_id, button_rect in color_buttons.items():
-                color_data = self.game.bullet_colors[color_id]
-                can_afford = self.game.total_score >= color_data['cost']
-                
-                # Button background
-                button_color = color_data['rgb'] if can_afford else (60, 60, 60)
-                pygame.draw.rect(self.screen, button_color, button_rect)
-                pygame.draw.rect(self.screen, WHITE, button_rect, 3)
-                
-                # Text
-                text_color = BLACK if sum(color_data['rgb']) > 400 else WHITE
-                name_surface = self.font.render(color_data['name'], True, text_color if can_afford else (120, 120, 120))
-                price_surface = self.font.render(f"{color_data['cost']:,} Punkte", True, text_color if can_afford else (120, 120, 120))
-                
-                self.screen.blit(name_surface, (button_rect.x + 10, button_rect.y + 5))
-                self.screen.blit(price_surface, (button_rect.x + 10, button_rect.y + 27))
-            
-            # If no colors available
-            if not color_buttons:
-                no_colors_text = self.large_font.render("Alle Farben bereits gekauft!", True, (100, 255, 100))
-                self.screen.blit(no_colors_text, (SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 - 30))
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
-                        return
-                    
-                    # Check color button clicks
-                    for color_id, button_rect in color_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            color_data = self.game.bullet_colors[color_id]
-                            if self.game.total_score >= color_data['cost']:
-                                # Purchase color
-                                self.game.total_score -= color_data['cost']
-                                self.game.owned_bullet_colors.append(color_id)
-                                self.game.save_total_score()
-                                message = f"{color_data['name']} gekauft!"
-                                message_color = (100, 255, 100)
-                                # Remove from available colors
-                                del color_buttons[color_id]
-                                
-                                # Rebuild buttons
-                                color_buttons.clear()
-                                row = 0
-                                col = 0
-                                available_colors = {k: v for k, v in self.game.bullet_colors.items() 
-                                                   if k not in self.game.owned_bullet_colors and k != 'white'}
-                                for new_color_id, new_color_data in available_colors.items():
-                                    x = start_x + col * (button_width + button_spacing)
-                                    y = start_y + row * (button_height + button_spacing)
-                                    color_buttons[new_color_id] = pygame.Rect(x, y, button_width, button_height)
-                                    col += 1
-                                    if col >= colors_per_row:
-                                        col = 0
-                                        row += 1
-                                break
-                            else:
-                                message = "Nicht genug Punkte!"
-                                message_color = (255, 100, 100)
+        self.show_catalog_shop('bullet')
 
     def show_bullet_wardrobe(self):
         """Bullet wardrobe screen for selecting owned bullet colors"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid of color buttons (3 columns)
-        colors_per_row = 3
-        button_size = 100
-        sell_button_height = 30
-        button_spacing = 20
-        vertical_spacing = button_size + sell_button_height + 10  # Space for sell button
-        start_x = SCREEN_WIDTH // 2 - (colors_per_row * button_size + (colors_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        color_buttons = {}
-        sell_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for owned colors
-        for color_id in self.game.owned_bullet_colors:
-            x = start_x + col * (button_size + button_spacing)
-            y = start_y + row * vertical_spacing
-            color_buttons[color_id] = pygame.Rect(x, y, button_size, button_size)
-            
-            # Add sell button only for non-white colors
-            if color_id != 'white':
-                sell_buttons[color_id] = pygame.Rect(x, y + button_size + 5, button_size, sell_button_height)
-            
-            col += 1
-            if col >= colors_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("KUGEL-FARBEN", True, (200, 200, 50))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 160, 40))
-            
-            # Current selection and points
-            current_color_name = self.game.bullet_colors[self.game.selected_bullet_color]['name']
-            self.draw_text(f"Aktuelle Farbe: {current_color_name}", SCREEN_WIDTH // 2 - 100, 100)
-            self.draw_text(f"Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 60, 130)
-            
-            # Draw color buttons
-            for color_id, button_rect in color_buttons.items():
-                color_data = self.game.bullet_colors[color_id]
-                
-                # Button background
-                pygame.draw.rect(self.screen, color_data['rgb'], button_rect)
-                
-                # Highlight selected color
-                border_width = 5 if color_id == self.game.selected_bullet_color else 2
-                border_color = (255, 215, 0) if color_id == self.game.selected_bullet_color else WHITE
-                pygame.draw.rect(self.screen, border_color, button_rect, border_width)
-                
-                # Text
-                text_color = BLACK if sum(color_data['rgb']) > 400 else WHITE
-                name_surface = self.font.render(color_data['name'], True, text_color)
-                # Center text
-                text_rect = name_surface.get_rect(center=button_rect.center)
-                self.screen.blit(name_surface, text_rect)
-            
-            # Draw sell buttons
-            for color_id, sell_button_rect in sell_buttons.items():
-                color_data = self.game.bullet_colors[color_id]
-                sell_price = color_data['cost'] // 2  # 50% of original price
-                
-                # Sell button
-                pygame.draw.rect(self.screen, (180, 50, 50), sell_button_rect)
-                pygame.draw.rect(self.screen, WHITE, sell_button_rect, 1)
-                
-                # Sell text
-                small_font = pygame.font.SysFont("Arial", 16)
-                sell_text = small_font.render(f"Verkauf: {sell_price:,}", True, WHITE)
-                text_rect = sell_text.get_rect(center=sell_button_rect.center)
-                self.screen.blit(sell_text, text_rect)
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
-                        return
-                    
-                    # Check sell button clicks first
-                    for color_id, sell_button_rect in sell_buttons.items():
-                        if sell_button_rect.collidepoint(event.pos):
-                            color_data = self.game.bullet_colors[color_id]
-                            sell_price = color_data['cost'] // 2
-                            
-                            # Sell the color
-                            self.game.total_score += sell_price
-                            self.game.owned_bullet_colors.remove(color_id)
-                            
-                            # If selling the currently selected color, switch to white
-                            if self.game.selected_bullet_color == color_id:
-                                self.game.selected_bullet_color = 'white'
-                            
-                            self.game.save_total_score()
-                            message = f"{color_data['name']} verkauft für {sell_price:,} Punkte!"
-                            message_color = (255, 215, 0)
-                            
-                            # Rebuild buttons
-                            color_buttons.clear()
-                            sell_buttons.clear()
-                            row = 0
-                            col = 0
-                            
-                            for new_color_id in self.game.owned_bullet_colors:
-                                x = start_x + col * (button_size + button_spacing)
-                                y = start_y + row * vertical_spacing
-                                color_buttons[new_color_id] = pygame.Rect(x, y, button_size, button_size)
-                                
-                                if new_color_id != 'white':
-                                    sell_buttons[new_color_id] = pygame.Rect(x, y + button_size + 5, button_size, sell_button_height)
-                                
-                                col += 1
-                                if col >= colors_per_row:
-                                    col = 0
-                                    row += 1
-                            break
-                    
-                    # Check color button clicks
-                    for color_id, button_rect in color_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            self.game.selected_bullet_color = color_id
-                            self.game.save_total_score()
-                            color_name = self.game.bullet_colors[color_id]['name']
-                            message = f"Farbe gewählt: {color_name}"
-                            message_color = (100, 255, 100)
-                            break
+        self.show_catalog_wardrobe('bullet')
 
     def show_kill_animation_shop(self):
         """Shop screen for buying kill animations"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid 
-        items_per_row = 2
-        button_width = 300
-        button_height = 60
-        button_spacing = 20
-        start_x = SCREEN_WIDTH // 2 - (items_per_row * button_width + (items_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        anim_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for animations not yet owned
-        available_anims = {k: v for k, v in self.game.kill_animations.items() 
-                          if k not in self.game.owned_kill_animations and k != 'none'}
-        
-        for anim_id, anim_data in available_anims.items():
-            x = start_x + col * (button_width + button_spacing)
-            y = start_y + row * (button_height + button_spacing)
-            anim_buttons[anim_id] = pygame.Rect(x, y, button_width, button_height)
-            col += 1
-            if col >= items_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
+        self.show_catalog_shop('kill_animation')
+
+    def show_kill_animation_wardrobe(self):
+        """Wardrobe screen for selecting kill animations"""
+        self.show_catalog_wardrobe('kill_animation')
+
+    def show_design_shop(self):
+        """Shop to buy different world designs"""
+        self.show_catalog_shop('design')
+
+    def show_design_wardrobe(self):
+        """Wardrobe to select world designs"""
+        self.show_catalog_wardrobe('design')
+
+    def _catalog_screen(self, title, title_color):
+        """Widget screen with the parts every shop/wardrobe shares: title, message line, back button"""
+        ui = WidgetScreen()
+        ui.add(Label((SCREEN_WIDTH // 2, 40), title, self.large_font, title_color))
+        message = ui.add(Label((SCREEN_WIDTH // 2, SCREEN_HEIGHT - 130), "", self.font))
+        # Above the item grid: with many items the last row reaches down to the back button
+        ui.add(Button((SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40), "Zurück", self.font,
+                      LIGHT_GREY, action='back', border_width=2), layer=1)
+        return ui, message
+
+    def _shop_item_state(self, catalog, item_id):
+        """Look of a shop item button (only re-rendered when this changes)"""
+        item = catalog.items[item_id]
+        cost = catalog.cost(item_id)
+        can_afford = self.game.total_score >= cost
+        if catalog.style == 'swatch':
+            text_color = BLACK if sum(item['rgb']) > 400 else WHITE
+            return {'fill': item['rgb'] if can_afford else (60, 60, 60),
+                    'text_color': text_color if can_afford else (120, 120, 120),
+                    'text': item['name'], 'detail': f"{cost:,} Punkte"}
+        if catalog.style == 'world':
+            if item_id in catalog.owned:
+                return {'fill': (100, 255, 100), 'text_color': BLACK, 'text': f"{item['name']} (Gekauft)"}
+            return {'fill': (255, 150, 50) if can_afford else (100, 100, 100), 'text_color': WHITE,
+                    'text': f"{item['name']} ({cost:,})"}
+        return {'fill': (100, 200, 100) if can_afford else (60, 60, 60),
+                'text_color': WHITE if can_afford else (120, 120, 120),
+                'text': item['name'], 'detail': f"{cost:,}"}
+
+    def _wardrobe_item_state(self, catalog, item_id):
+        """Look of a wardrobe item button (only re-rendered when this changes)"""
+        item = catalog.items[item_id]
+        is_selected = item_id == catalog.selected
+        if catalog.style == 'swatch':
+            return {'fill': item['rgb'], 'text_color': BLACK if sum(item['rgb']) > 400 else WHITE,
+                    'border_color': (255, 215, 0) if is_selected else WHITE,
+                    'border_width': 5 if is_selected else 2}
+        if catalog.style == 'world':
+            if item_id not in catalog.owned:
+                return {'fill': (50, 50, 50), 'text_color': (150, 150, 150),
+                        'text': f"{item['name']} (Nicht im Besitz)"}
+            if is_selected:
+                return {'fill': (100, 255, 100), 'text_color': BLACK, 'text': f"{item['name']} (AKTIV)"}
+            return {'fill': (100, 100, 100), 'text_color': WHITE, 'text': item['name']}
+        return {'fill': (100, 50, 100), 'text_color': WHITE,
+                'border_color': (255, 215, 0) if is_selected else WHITE,
+                'border_width': 4 if is_selected else 2}
+
+    def show_catalog_shop(self, key):
+        """Generic shop screen for a cosmetic catalog (see shop_catalog.build_catalogs)"""
+        catalog = self.catalogs[key]
+        spec = catalog.shop
+        grid = Grid(*spec['grid'])
+        layout = {'swatch': 'stacked', 'plain': 'split'}.get(catalog.style, 'center')
+
+        ui, message = self._catalog_screen(spec['title'], spec['color'])
+        points = ui.add(Label((SCREEN_WIDTH // 2, 100), "", self.font))
+        if spec.get('note'):
+            ui.add(Label((SCREEN_WIDTH // 2, 130), spec['note'], self.font))
+        empty = ui.add(Label((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), spec['empty'], self.large_font,
+                             (100, 255, 100), anchor='center'))
+        item_buttons = []
+
+        def build_items():
+            ui.remove(item_buttons)
+            item_buttons.clear()
+            item_ids = catalog.shop_ids()
+            for item_id, rect in zip(item_ids, grid.rects(len(item_ids))):
+                item_buttons.append(ui.add(Button(rect, "", self.font, DARK_GREY, action=('buy', item_id),
+                                                  layout=layout)))
+
+        build_items()
         while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("KILL-ANIMATIONEN SHOP", True, (150, 50, 150))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 250, 40))
-            
-            # Current score
-            self.draw_text(f"Verfügbare Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 100, 100)
-            
-            # Draw buttons
-            for anim_id, button_rect in anim_buttons.items():
-                anim_data = self.game.kill_animations[anim_id]
-                can_afford = self.game.total_score >= anim_data['cost']
-                
-                # Button background
-                button_color = (100, 200, 100) if can_afford else (60, 60, 60)
-                pygame.draw.rect(self.screen, button_color, button_rect)
-                pygame.draw.rect(self.screen, WHITE, button_rect, 3)
-                
-                # Text
-                name_surface = self.font.render(anim_data['name'], True, WHITE if can_afford else (120, 120, 120))
-                price_surface = self.font.render(f"{anim_data['cost']:,}", True, WHITE if can_afford else (120, 120, 120))
-                
-                self.screen.blit(name_surface, (button_rect.x + 10, button_rect.y + 15))
-                self.screen.blit(price_surface, (button_rect.right - price_surface.get_width() - 10, button_rect.y + 15))
-            
-            # If no animations available
-            if not anim_buttons:
-                no_anims_text = self.medium_font.render("Alle Animationen gekauft!", True, (100, 255, 100))
-                self.screen.blit(no_anims_text, (SCREEN_WIDTH // 2 - 180, SCREEN_HEIGHT // 2 - 30))
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
+            # Only widgets whose state differs from last frame are re-rendered
+            points.set(text=f"Verfügbare Punkte: {self.game.total_score:,}")
+            empty.set(visible=not item_buttons and bool(spec['empty']))
+            for button in item_buttons:
+                button.set(**self._shop_item_state(catalog, button.action[1]))
+            ui.present(self.screen)
+
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    ui.full_redraw = True
                 if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
+                    widget = ui.widget_at(event.pos)
+                    if widget is None:
+                        continue
+                    if widget.action == 'back':
                         return
-                    
-                    # Check button clicks
-                    for anim_id, button_rect in anim_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            anim_data = self.game.kill_animations[anim_id]
-                            if self.game.total_score >= anim_data['cost']:
-                                # Purchase
-                                self.game.total_score -= anim_data['cost']
-                                self.game.owned_kill_animations.append(anim_id)
-                                self.game.save_total_score()
-                                message = f"{anim_data['name']} gekauft!"
-                                message_color = (100, 255, 100)
-                                # Remove from available
-                                del anim_buttons[anim_id]
-                                
-                                # Rebuild buttons
-                                anim_buttons.clear()
-                                row = 0
-                                col = 0
-                                available_anims = {k: v for k, v in self.game.kill_animations.items() 
-                                                  if k not in self.game.owned_kill_animations and k != 'none'}
-                                for new_id, new_data in available_anims.items():
-                                    x = start_x + col * (button_width + button_spacing)
-                                    y = start_y + row * (button_height + button_spacing)
-                                    anim_buttons[new_id] = pygame.Rect(x, y, button_width, button_height)
-                                    col += 1
-                                    if col >= items_per_row:
-                                        col = 0
-                                        row += 1
-                                break
-                            else:
-                                message = "Nicht genug Punkte!"
-                                message_color = (255, 100, 100)
+                    item_id = widget.action[1]
+                    if item_id in catalog.owned:
+                        continue  # Bought items stay listed in 'keep_owned' catalogs
+                    if catalog.buy(item_id):
+                        message.set(text=f"{catalog.name(item_id)} gekauft!", color=(100, 255, 100))
+                        if not catalog.keep_owned:
+                            build_items()
+                    else:
+                        message.set(text="Nicht genug Punkte!", color=(255, 100, 100))
 
-    def show_kill_animation_wardrobe(self):
-        """Wardrobe screen for selecting kill animations"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Create a grid
-        items_per_row = 2
-        button_width = 300
-        button_height = 60
-        button_spacing = 20
-        start_x = SCREEN_WIDTH // 2 - (items_per_row * button_width + (items_per_row - 1) * button_spacing) // 2
-        start_y = 180
-        
-        anim_buttons = {}
-        row = 0
-        col = 0
-        
-        # Create buttons for owned animations
-        for anim_id in self.game.owned_kill_animations:
-            x = start_x + col * (button_width + button_spacing)
-            y = start_y + row * (button_height + button_spacing)
-            anim_buttons[anim_id] = pygame.Rect(x, y, button_width, button_height)
-            col += 1
-            if col >= items_per_row:
-                col = 0
-                row += 1
-        
-        message = ""
-        message_color = WHITE
-        
+    def show_catalog_wardrobe(self, key):
+        """Generic wardrobe screen: select owned items of a catalog (and sell them, if allowed)"""
+        catalog = self.catalogs[key]
+        spec = catalog.wardrobe
+        grid = Grid(*spec['grid'])
+
+        ui, message = self._catalog_screen(spec['title'], spec['color'])
+        current = ui.add(Label((SCREEN_WIDTH // 2, 100), "", self.font))
+        points = ui.add(Label((SCREEN_WIDTH // 2, 130), "", self.font)) if catalog.sellable else None
+        item_buttons = []
+
+        def build_items():
+            ui.remove(item_buttons)
+            item_buttons.clear()
+            item_ids = catalog.wardrobe_ids()
+            for item_id, rect in zip(item_ids, grid.rects(len(item_ids))):
+                item_buttons.append(ui.add(Button(rect, catalog.name(item_id), self.font, DARK_GREY,
+                                                  action=('select', item_id))))
+                if catalog.sellable and item_id != catalog.default:
+                    sell_rect = pygame.Rect(rect.x, rect.bottom + 5, rect.width, 30)
+                    item_buttons.append(ui.add(Button(
+                        sell_rect, f"Verkauf: {catalog.sell_price(item_id):,}", self.tiny_font, (180, 50, 50),
+                        action=('sell', item_id), border_width=1)))
+
+        build_items()
         while True:
-            self.screen.fill(DARK_GREY)
-            
-            # Title
-            title_text = self.large_font.render("KILL-ANIMATIONEN", True, (200, 100, 150))
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 200, 40))
-            
-            # Current selection
-            current_name = self.game.kill_animations[self.game.selected_kill_animation]['name']
-            self.draw_text(f"Aktuell: {current_name}", SCREEN_WIDTH // 2 - 100, 100)
-            
-            # Draw buttons
-            for anim_id, button_rect in anim_buttons.items():
-                anim_data = self.game.kill_animations[anim_id]
-                
-                # Check if selected
-                is_selected = (anim_id == self.game.selected_kill_animation)
-                
-                # Button background
-                pygame.draw.rect(self.screen, (100, 50, 100), button_rect)
-                border_color = (255, 215, 0) if is_selected else WHITE
-                border_width = 4 if is_selected else 2
-                pygame.draw.rect(self.screen, border_color, button_rect, border_width)
-                
-                # Text
-                name_surface = self.font.render(anim_data['name'], True, WHITE)
-                text_rect = name_surface.get_rect(center=button_rect.center)
-                self.screen.blit(name_surface, text_rect)
-            
-            # Back button
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            # Message
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 130, message_color)
-            
-            pygame.display.flip()
-            
-            for event in pygame.event.get():
+            current.set(text=f"{spec['current']}: {catalog.name(catalog.selected)}")
+            if points:
+                points.set(text=f"Punkte: {self.game.total_score:,}")
+            for button in item_buttons:
+                if button.action[0] == 'select':
+                    button.set(**self._wardrobe_item_state(catalog, button.action[1]))
+            ui.present(self.screen)
+
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    ui.full_redraw = True
                 if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos):
+                    widget = ui.widget_at(event.pos)
+                    if widget is None:
+                        continue
+                    if widget.action == 'back':
                         return
-                    
-                    # Check button clicks
-                    for anim_id, button_rect in anim_buttons.items():
-                        if button_rect.collidepoint(event.pos):
-                            self.game.selected_kill_animation = anim_id
-                            self.game.save_total_score()
-                            message = f"Animation gewählt: {self.game.kill_animations[anim_id]['name']}"
-                            message_color = (100, 255, 100)
-                            break
+                    kind, item_id = widget.action
+                    if kind == 'sell':
+                        price = catalog.sell(item_id)
+                        message.set(text=f"{catalog.name(item_id)} verkauft für {price:,} Punkte!",
+                                    color=(255, 215, 0))
+                        build_items()
+                    elif item_id in catalog.owned:
+                        catalog.select(item_id)
+                        message.set(text=f"{spec['chosen']}: {catalog.name(item_id)}", color=(100, 255, 100))
 
     def show_special_shop(self):
         """Shop for special items like Minimap and Sounds"""
@@ -1335,7 +837,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -1436,7 +938,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -1450,140 +952,14 @@ class MenuManager:
                         self.game.sounds_active = not self.game.sounds_active
                         self.game.save_total_score()
                         # Immediately update menu music state
-                        if self.game.sounds_active and self.game.menu_music_loaded:
-                            self.game.menu_music.play(-1)
-                        elif not self.game.sounds_active and self.game.menu_music_loaded:
-                            self.game.menu_music.stop()
+                        if self.game.sounds_active:
+                            self.game.audio.play('menu')
+                        else:
+                            self.game.audio.stop()
                     
                     if select_design_button.collidepoint(event.pos):
                         self.show_design_wardrobe()
 
-    def show_design_shop(self):
-        """Shop to buy different world designs"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        
-        # Grid setup for designs
-        design_ids = ['desert', 'grass', 'winter']
-        button_width = 300
-        button_height = 80
-        start_y = 180
-        spacing = 100
-        
-        message = ""
-        message_color = WHITE
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            title = self.large_font.render("DESIGN-SHOP", True, (200, 200, 50))
-            self.screen.blit(title, (SCREEN_WIDTH // 2 - 150, 50))
-            self.draw_text(f"Punkte: {self.game.total_score:,}", SCREEN_WIDTH // 2 - 80, 120)
-            
-            buttons = []
-            for i, d_id in enumerate(design_ids):
-                rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, start_y + i * spacing, button_width, button_height)
-                buttons.append((rect, d_id))
-                
-                owned = d_id in self.game.owned_designs
-                name = self.game.designs[d_id]['name']
-                cost = self.game.special_design_cost
-                
-                if owned:
-                    color = (100, 255, 100)
-                    btn_text = f"{name} (Gekauft)"
-                else:
-                    can_afford = self.game.total_score >= cost
-                    color = (255, 150, 50) if can_afford else (100, 100, 100)
-                    btn_text = f"{name} ({cost:,})"
-                
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, WHITE, rect, 3)
-                txt = self.font.render(btn_text, True, BLACK if owned else WHITE)
-                txt_rect = txt.get_rect(center=rect.center)
-                self.screen.blit(txt, txt_rect)
-
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            if message:
-                self.draw_text(message, SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT - 130, message_color)
-                
-            pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos): return
-                    for rect, d_id in buttons:
-                        if rect.collidepoint(event.pos) and d_id not in self.game.owned_designs:
-                            if self.game.total_score >= self.game.special_design_cost:
-                                self.game.total_score -= self.game.special_design_cost
-                                self.game.owned_designs.append(d_id)
-                                self.game.save_total_score()
-                                message = "Design gekauft!"
-                                message_color = (100, 255, 100)
-                            else:
-                                message = "Zu wenig Punkte!"
-                                message_color = (255, 100, 100)
-
-    def show_design_wardrobe(self):
-        """Wardrobe to select world designs"""
-        back_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 40)
-        design_ids = ['classic', 'desert', 'grass', 'winter']
-        button_width = 300
-        button_height = 60
-        start_y = 150
-        spacing = 80
-        
-        while True:
-            self.screen.fill(DARK_GREY)
-            title = self.large_font.render("WELT-DESIGNS", True, (200, 200, 50))
-            self.screen.blit(title, (SCREEN_WIDTH // 2 - 150, 50))
-            
-            buttons = []
-            for i, d_id in enumerate(design_ids):
-                rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, start_y + i * spacing, button_width, button_height)
-                buttons.append((rect, d_id))
-                
-                owned = d_id in self.game.owned_designs
-                active = self.game.selected_design == d_id
-                name = self.game.designs[d_id]['name']
-                
-                if not owned:
-                    color = (50, 50, 50)
-                    btn_text = f"{name} (Nicht im Besitz)"
-                    txt_color = (150, 150, 150)
-                elif active:
-                    color = (100, 255, 100)
-                    btn_text = f"{name} (AKTIV)"
-                    txt_color = BLACK
-                else:
-                    color = (100, 100, 100)
-                    btn_text = name
-                    txt_color = WHITE
-                
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, WHITE, rect, 3)
-                txt = self.font.render(btn_text, True, txt_color)
-                txt_rect = txt.get_rect(center=rect.center)
-                self.screen.blit(txt, txt_rect)
-
-            pygame.draw.rect(self.screen, LIGHT_GREY, back_button)
-            pygame.draw.rect(self.screen, WHITE, back_button, 2)
-            self.draw_text("Zurück", back_button.x + 60, back_button.y + 10)
-            
-            pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if back_button.collidepoint(event.pos): return
-                    for rect, d_id in buttons:
-                        if rect.collidepoint(event.pos) and d_id in self.game.owned_designs:
-                            self.game.selected_design = d_id
-                            self.game.save_total_score()
-                            # Ground texture is re-loaded when starting a new game (CameraGroup init)
-
     def show_go_screen(self):
         """Game Over screen"""
         # Buttons
@@ -1592,6 +968,7 @@ class MenuManager:
         shop_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 170, 200, 50)
         
         while True:
+            self.game.preloader.start()
             self.screen.fill(BLACK)
             self.draw_text("GAME OVER", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4, RED, align="center")
             self.draw_text(f"Punkte: {self.game.score}", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, WHITE, align="center")
@@ -1612,7 +989,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -1670,7 +1047,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -1691,21 +1068,6 @@ class MenuManager:
         active = True
         
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        return text
-                    elif event.key == pygame.K_ESCAPE:
-                        return None
-                    elif event.key == pygame.K_BACKSPACE:
-                        text = text[:-1]
-                    else:
-                        if len(text) < max_length:
-                            text += event.unicode
-            
             # Draw
             # Overlay
             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
@@ -1725,6 +1087,21 @@ class MenuManager:
             
             pygame.display.flip()
 
+            for event in self.wait_events():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        return text
+                    elif event.key == pygame.K_ESCAPE:
+                        return None
+                    elif event.key == pygame.K_BACKSPACE:
+                        text = text[:-1]
+                    else:
+                        if len(text) < max_length:
+                            text += event.unicode
+
 
     def show_multiplayer_menu(self):
         """Multiplayer host/join selection menu"""
@@ -1761,7 +1138,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -1793,8 +1170,7 @@ class MenuManager:
             title = self.large_font.render("WARTE AUF GEGNER...", True, WHITE)
             self.screen.blit(title, (SCREEN_WIDTH // 2 - 200, 150))
             
-            code_font = pygame.font.SysFont("Arial", 72, bold=True)
-            code_text = code_font.render(room_code, True, (255, 255, 100))
+            code_text = self.code_font.render(room_code, True, (255, 255, 100))
             code_rect = code_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             pygame.draw.rect(self.screen, (50, 50, 50), (code_rect.x - 20, code_rect.y - 20, code_rect.width + 40, code_rect.height + 40))
             pygame.draw.rect(self.screen, (255, 255, 100), (code_rect.x - 20, code_rect.y - 20, code_rect.width + 40, code_rect.height + 40), 3)
@@ -1820,7 +1196,7 @@ class MenuManager:
                     other_joined = True
                     waiting = False
             
-            for event in pygame.event.get():
+            for event in self.wait_events(timeout=100):  # Keep polling the server
                 if event.type == pygame.QUIT:
                     client.close()
                     pygame.quit()
@@ -1894,7 +1270,7 @@ class MenuManager:
             pygame.display.flip()
             
             # Events
-            for event in pygame.event.get():
+            for event in self.wait_events(timeout=100):  # Keep polling the server
                 if event.type == pygame.QUIT:
                     return 'menu'
                 if event.type == pygame.MOUSEBUTTONUP:
@@ -1934,7 +1310,7 @@ class MenuManager:
             
             pygame.display.flip()
             
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -0,0 +1,89 @@
+import pygame
+from settings import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Minimap:
+    """
+    Mini-map in the top-right corner showing buildings, enemies and the player.
+    The buildings are a cached base surface that is rebuilt only after an obstacle
+    changes; the entity dots are composed on top of it at a reduced refresh rate.
+    """
+
+    def __init__(self, game, width=200, refresh_interval=MINIMAP_REFRESH_MS):
+        self.game = game
+        self.width = width
+        self.height = int(width * (MAP_HEIGHT / MAP_WIDTH))  # Keep aspect ratio
+        self.x = SCREEN_WIDTH - width - 10  # 10px from right edge
+        self.y = 50  # Below the enemy upgrades display
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.scale_x = width / MAP_WIDTH
+        self.scale_y = self.height / MAP_HEIGHT
+        self.refresh_interval = refresh_interval  # ms between dot overlay refreshes
+
+        self.base = None  # Background + buildings
+        self.surface = None  # Base + dots, blitted every frame
+        self.last_refresh = 0
+
+    def invalidate(self):
+        """Rebuild the building layer on the next draw (called when walls change)"""
+        self.base = None
+
+    def _wall_rect(self, wall):
+        x = int(wall.rect.x * self.scale_x)
+        y = int(wall.rect.y * self.scale_y)
+        w = max(2, int(wall.rect.width * self.scale_x))  # Minimum 2px width
+        h = max(2, int(wall.rect.height * self.scale_y))  # Minimum 2px height
+        return x, y, w, h
+
+    def _build_base(self):
+        base = pygame.Surface((self.width, self.height))
+        base.fill((20, 20, 20))  # Dark background
+        if np is not None:
+            # Occupancy array at minimap resolution, written into the surface in one go
+            occupancy = np.zeros((self.width, self.height), dtype=bool)  # surfarray is indexed [x, y]
+            for wall in self.game.walls:
+                x, y, w, h = self._wall_rect(wall)
+                occupancy[x:x + w, y:y + h] = True
+            pixels = pygame.surfarray.pixels3d(base)
+            pixels[occupancy] = (80, 80, 80)
+            del pixels  # Unlock the surface
+        else:
+            for wall in self.game.walls:
+                pygame.draw.rect(base, (80, 80, 80), self._wall_rect(wall))
+        pygame.draw.rect(base, WHITE, base.get_rect(), 2)  # White border
+        self.base = base
+
+    def _dot(self, surface, pos, color, radius):
+        pygame.draw.circle(surface, color, (int(pos.x * self.scale_x), int(pos.y * self.scale_y)), radius)
+
+    def _refresh(self):
+        surface = self.base.copy()
+        game = self.game
+        if game.game_mode == 'team5v5':
+            # Red team (enemies)
+            for enemy in game.team_enemies:
+                self._dot(surface, enemy.pos, RED, 3)
+            # Blue team (allies) - excluding player which is drawn last
+            for ally in game.team_allies:
+                if ally != game.player:
+                    self._dot(surface, ally.pos, (100, 100, 255), 3)  # Lighter blue
+        else:
+            for enemy in game.enemies:
+                self._dot(surface, enemy.pos, RED, 3)  # 3px red circles
+        self._dot(surface, game.player.pos, GREEN, 4)  # 4px green circle
+        self.surface = surface
+
+    def draw(self, screen):
+        now = pygame.time.get_ticks()
+        if self.base is None:
+            self._build_base()
+            self.surface = None
+        if self.surface is None or now - self.last_refresh >= self.refresh_interval:
+            self._refresh()
+            self.last_refresh = now
+        return screen.blit(self.surface, self.rect)
@@ -0,0 +1,140 @@
+class NeighborIndex:
+    """
+    Per-frame nearest-neighbour index for AI target and ally selection.
+    Entities are bucketed per category into a uniform grid that is rebuilt once
+    per frame, so nearest / k-nearest / radius queries only visit the cells around
+    the query point instead of scanning whole sprite groups (O(N log N) instead of O(N^2)).
+    """
+    def __init__(self, cell_size=200):
+        self.cell_size = cell_size
+        self.categories = {}  # category -> {(x, y): [(px, py, obj), ...]}
+        self.bounds = {}  # category -> (min_cx, min_cy, max_cx, max_cy)
+
+    def _get_cell_coords(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def rebuild(self, groups):
+        """
+        Rebuild the index from a dict of category -> iterable of sprites.
+        Entities are indexed by their rect center.
+        """
+        self.categories = {}
+        self.bounds = {}
+        for category, sprites in groups.items():
+            cells = {}
+            min_cx = min_cy = None
+            max_cx = max_cy = None
+            for obj in sprites:
+                px, py = obj.rect.center
+                cell = self._get_cell_coords(px, py)
+                if cell not in cells:
+                    cells[cell] = []
+                cells[cell].append((px, py, obj))
+                if min_cx is None:
+                    min_cx, min_cy, max_cx, max_cy = cell[0], cell[1], cell[0], cell[1]
+                else:
+                    min_cx = min(min_cx, cell[0])
+                    min_cy = min(min_cy, cell[1])
+                    max_cx = max(max_cx, cell[0])
+                    max_cy = max(max_cy, cell[1])
+            self.categories[category] = cells
+            if min_cx is not None:
+                self.bounds[category] = (min_cx, min_cy, max_cx, max_cy)
+
+    def count(self, category):
+        """Number of indexed entities in a category."""
+        return sum(len(entries) for entries in self.categories.get(category, {}).values())
+
+    def _ring_cells(self, cx, cy, ring):
+        """Yield the cell coordinates forming the square ring at distance `ring` around (cx, cy)."""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - ring, cx + ring + 1):
+            yield (x, cy - ring)
+            yield (x, cy + ring)
+        for y in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, y)
+            yield (cx + ring, y)
+
+    def k_nearest(self, pos, category, k, exclude=None, max_distance=None):
+        """
+        Return up to k live entities of a category closest to pos, nearest first.
+        Searches outward ring by ring and stops once no closer entity can exist.
+        """
+        cells = self.categories.get(category)
+        if not cells or k <= 0:
+            return []
+
+        px, py = pos[0], pos[1]
+        cx, cy = self._get_cell_coords(px, py)
+        min_cx, min_cy, max_cx, max_cy = self.bounds[category]
+        max_ring = max(abs(cx - min_cx), abs(cx - max_cx), abs(cy - min_cy), abs(cy - max_cy))
+        max_dist_sq = max_distance * max_distance if max_distance is not None else None
+
+        found = []  # (dist_sq, obj)
+        for ring in range(max_ring + 1):
+            # Everything beyond this ring is at least (ring - 1) cells away
+            ring_min_dist = (ring - 1) * self.cell_size
+            if ring_min_dist > 0:
+                if max_dist_sq is not None and ring_min_dist * ring_min_dist > max_dist_sq:
+                    break
+                if len(found) >= k and found[k - 1][0] <= ring_min_dist * ring_min_dist:
+                    break
+
+            for cell in self._ring_cells(cx, cy, ring):
+                entries = cells.get(cell)
+                if not entries:
+                    continue
+                for ex, ey, obj in entries:
+                    if obj is exclude or not obj.alive():
+                        continue
+                    dist_sq = (ex - px) ** 2 + (ey - py) ** 2
+                    if max_dist_sq is not None and dist_sq >= max_dist_sq:
+                        continue
+                    found.append((dist_sq, obj))
+            found.sort(key=lambda entry: entry[0])
+
+        return [obj for _, obj in found[:k]]
+
+    def nearest(self, pos, category, exclude=None, max_distance=None):
+        """Return the closest live entity of a category to pos, or None."""
+        result = self.k_nearest(pos, category, 1, exclude, max_distance)
+        return result[0] if result else None
+
+    def within_radius(self, pos, category, radius, exclude=None):
+        """Return all live entities of a category within radius of pos, nearest first."""
+        cells = self.categories.get(category)
+        if not cells:
+            return []
+
+        px, py = pos[0], pos[1]
+        radius_sq = radius * radius
+        start_x, start_y = self._get_cell_coords(px - radius, py - radius)
+        end_x, end_y = self._get_cell_coords(px + radius, py + radius)
+
+        found = []
+        for x in range(start_x, end_x + 1):
+            for y in range(start_y, end_y + 1):
+                entries = cells.get((x, y))
+                if not entries:
+                    continue
+                for ex, ey, obj in entries:
+                    if obj is exclude or not obj.alive():
+                        continue
+                    dist_sq = (ex - px) ** 2 + (ey - py) ** 2
+                    if dist_sq < radius_sq:
+                        found.append((dist_sq, obj))
+        found.sort(key=lambda entry: entry[0])
+        return [obj for _, obj in found]
+
+    def colliding(self, rect, category, reach=100):
+        """
+        Return the live entities of a category whose rect overlaps rect, nearest first.
+        The index is only rebuilt once per frame, so entities killed earlier in the
+        frame (e.g. by another pellet of the same volley) are skipped here.
+        Only entities indexed within reach of rect's center are tested, so reach must
+        cover both half-sizes plus how far an entity can move between rebuilds.
+        """
+        return [obj for obj in self.within_radius(rect.center, category, reach)
+                if obj.rect.colliderect(rect) and obj.alive()]
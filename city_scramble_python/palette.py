@@ -0,0 +1,25 @@
+import colorsys
+import pygame
+
+# 360-entry hue -> RGB lookup table (full saturation and brightness)
+RAINBOW_RGB = [tuple(int(c * 255) for c in colorsys.hsv_to_rgb(hue / 360.0, 1.0, 1.0)) for hue in range(360)]
+
+
+def rainbow_hue(ms, degrees_per_second):
+    """Hue (0-359) of the global rainbow clock after `ms` milliseconds"""
+    return int(ms * degrees_per_second // 1000) % 360
+
+
+class RainbowSurfaces:
+    """Pre-filled surfaces of one size for a fixed number of hue phases, shared by all rainbow projectiles"""
+
+    def __init__(self, size, phases=36):
+        self.step = 360 // phases
+        self.surfaces = []
+        for phase in range(phases):
+            surface = pygame.Surface(size)
+            surface.fill(RAINBOW_RGB[phase * self.step])
+            self.surfaces.append(surface)
+
+    def get(self, hue):
+        return self.surfaces[hue // self.step]
@@ -22,10 +22,7 @@ class PathfindingGrid:
         # Mark cells occupied by obstacles as blocked
         for obstacle in obstacles:
             # Get grid coordinates for obstacle bounds
-            x1 = max(0, obstacle.rect.left // self.cell_size)
-            y1 = max(0, obstacle.rect.top // self.cell_size)
-            x2 = min(self.grid_width - 1, obstacle.rect.right // self.cell_size)
-            y2 = min(self.grid_height - 1, obstacle.rect.bottom // self.cell_size)
+            x1, y1, x2, y2 = self.cell_bounds(obstacle.rect)
             
             # Mark all cells within obstacle as blocked
             for y in range(y1, y2 + 1):
@@ -36,6 +33,28 @@ class PathfindingGrid:
     def rebuild(self, obstacles):
         """Rebuild grid when obstacles change"""
         self.build_grid(obstacles)
+
+    def cell_bounds(self, rect):
+        """Inclusive grid cell range (x1, y1, x2, y2) covered by a world rect, clamped to the grid"""
+        x1 = max(0, rect.left // self.cell_size)
+        y1 = max(0, rect.top // self.cell_size)
+        x2 = min(self.grid_width - 1, rect.right // self.cell_size)
+        y2 = min(self.grid_height - 1, rect.bottom // self.cell_size)
+        return x1, y1, x2, y2
+
+    def update_region(self, rect, obstacles):
+        """Recompute only the cells covered by rect (e.g. after a building is destroyed or respawns)"""
+        x1, y1, x2, y2 = self.cell_bounds(rect)
+        for y in range(y1, y2 + 1):
+            for x in range(x1, x2 + 1):
+                self.grid[y][x] = 0
+
+        # Re-block cells of every obstacle that overlaps the region
+        for obstacle in obstacles:
+            ox1, oy1, ox2, oy2 = self.cell_bounds(obstacle.rect)
+            for y in range(max(y1, oy1), min(y2, oy2) + 1):
+                for x in range(max(x1, ox1), min(x2, ox2) + 1):
+                    self.grid[y][x] = 1
     
     def world_to_grid(self, x, y):
         """Convert world coordinates to grid coordinates"""
@@ -57,7 +76,25 @@ class PathfindingGrid:
         if grid_x < 0 or grid_x >= self.grid_width or grid_y < 0 or grid_y >= self.grid_height:
             return False
         return self.grid[grid_y][grid_x] == 0
-    
+
+    def line_walkable(self, start, end):
+        """Check if the straight line between two world positions only crosses walkable cells"""
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        steps = int(max(abs(dx), abs(dy)) / (self.cell_size / 2)) + 1
+        for i in range(steps + 1):
+            t = i / steps
+            if not self.is_walkable(*self.world_to_grid(start[0] + dx * t, start[1] + dy * t)):
+                return False
+        return True
+
+    def walkable_cells(self):
+        """World coordinates (cell centers) of every walkable cell - free-space spawn samples"""
+        return [self.grid_to_world(x, y)
+                for y in range(self.grid_height)
+                for x in range(self.grid_width)
+                if self.grid[y][x] == 0]
+
     def get_neighbors(self, grid_x, grid_y):
         """Get walkable neighbors (8 directions including diagonals)"""
         neighbors = []
@@ -119,7 +156,9 @@ def find_path(start_pos, goal_pos, pathfinding_grid):
     f_score = {start: heuristic(start, goal)}
     
     while open_set:
-        current = heapq.heappop(open_set)[1]
+        f, current = heapq.heappop(open_set)
+        if f > f_score[current]:
+            continue  # Stale entry: current was pushed again with a better score since
         
         if current == goal:
             # Reconstruct path
@@ -149,3 +188,68 @@ def find_path(start_pos, goal_pos, pathfinding_grid):
     
     # No path found
     return []
+
+
+class FlowField:
+    """
+    Shared navigation field towards one goal (e.g. the attacker of an uprising).
+    One Dijkstra pass from the goal gives every walkable cell its distance to the goal,
+    so any number of agents can ask for their next waypoint without running A* each.
+    With `targets` (the agents' cells) the pass stops once all of them are settled
+    plus `margin` cells, instead of covering the whole map.
+    """
+
+    def __init__(self, pathfinding_grid, goal_pos, targets=None, margin=4):
+        self.grid = pathfinding_grid
+        self.goal = pathfinding_grid.world_to_grid(goal_pos[0], goal_pos[1])
+        self.targets = set(targets) if targets else None
+        self.margin = margin
+        self.distances = {}
+        self.build()
+
+    def build(self):
+        """Dijkstra from the goal cell over walkable cells (same move costs as A*)"""
+        self.distances = {}
+        if not self.grid.is_walkable(self.goal[0], self.goal[1]):
+            return
+        self.distances[self.goal] = 0
+        open_set = [(0, self.goal)]
+        remaining = set(self.targets) if self.targets else None
+        stop_at = None  # Distance at which the search may end (all targets settled + margin)
+        while open_set:
+            dist, current = heapq.heappop(open_set)
+            if dist > self.distances[current]:
+                continue
+            if stop_at is not None and dist > stop_at:
+                break
+            if remaining:
+                remaining.discard(current)
+                if not remaining:
+                    stop_at = dist + self.margin
+            for neighbor in self.grid.get_neighbors(current[0], current[1]):
+                dx = abs(neighbor[0] - current[0])
+                dy = abs(neighbor[1] - current[1])
+                move_cost = 1.4 if (dx + dy == 2) else 1.0
+                new_dist = dist + move_cost
+                if neighbor not in self.distances or new_dist < self.distances[neighbor]:
+                    self.distances[neighbor] = new_dist
+                    heapq.heappush(open_set, (new_dist, neighbor))
+
+    def next_waypoint(self, pos):
+        """
+        World position of the neighbouring cell that is closest to the goal,
+        or None if pos is in the goal cell or cannot reach the goal.
+        """
+        cell = self.grid.world_to_grid(pos[0], pos[1])
+        if cell == self.goal or cell not in self.distances:
+            return None
+        best = None
+        best_dist = self.distances[cell]
+        for neighbor in self.grid.get_neighbors(cell[0], cell[1]):
+            dist = self.distances.get(neighbor)
+            if dist is not None and dist < best_dist:
+                best_dist = dist
+                best = neighbor
+        if best is None:
+            return None
+        return self.grid.grid_to_world(best[0], best[1])
@@ -0,0 +1,59 @@
+class LineOfSightCache:
+    """
+    Short-lived cache for AI line-of-sight raycasts.
+    Results are keyed by (check kind, shooter cell, target cell) so pairs that are clearly
+    visible or clearly occluded are not re-tested on every shot. Entries expire after `ttl` ms
+    (civilians move, so visibility can change without walls changing) and the whole cache
+    is invalidated whenever a wall appears or disappears.
+    """
+    def __init__(self, cell_size=40, ttl=250, max_entries=4096):
+        self.cell_size = cell_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = {}  # (kind, shooter_cell, target_cell) -> (visible, expires_at)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _get_cell_coords(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def check(self, kind, start, end, now, raycast):
+        """
+        Return cached visibility between start and end, or run `raycast()` and cache its result.
+        `kind` separates checks that ignore different blockers (e.g. uprising civilians).
+        """
+        key = (kind, self._get_cell_coords(start[0], start[1]), self._get_cell_coords(end[0], end[1]))
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] > now:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        visible = raycast()
+        if len(self.entries) >= self.max_entries:
+            self.prune(now)
+        self.entries[key] = (visible, now + self.ttl)
+        return visible
+
+    def prune(self, now):
+        """Drop expired entries (or everything if the cache is still full)"""
+        self.entries = {key: entry for key, entry in self.entries.items() if entry[1] > now}
+        if len(self.entries) >= self.max_entries:
+            self.entries.clear()
+
+    def invalidate(self):
+        """Forget all cached results (called when walls change)"""
+        self.entries.clear()
+        self.invalidations += 1
+
+    def stats(self):
+        """Hit-rate statistics for profiling"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+            'invalidations': self.invalidations,
+        }
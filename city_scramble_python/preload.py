@@ -0,0 +1,169 @@
+import random
+import threading
+import pygame
+from settings import *
+from assets import assets
+from ground import preload_ground
+from pathfinding import PathfindingGrid
+from tactical_map import TacticalMap
+
+
+class Footprint:
+    """Stand-in for an Obstacle while the layout is generated (only the rect is needed)"""
+    __slots__ = ('rect',)
+
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class MatchLayout:
+    """
+    Everything about a match that doesn't need sprites: building rects, the
+    navigation grid built from them, the tactical map and enemy spawn points.
+    Generated from a seed, so it can be built on a worker thread ahead of time.
+    A layout is used by exactly one match (the nav grid is modified while playing).
+    """
+
+    def __init__(self, seed, game_mode, tutorial_mode, max_enemies, player_pos):
+        self.seed = seed
+        self.key = (game_mode, tutorial_mode, max_enemies)
+        rng = random.Random(seed)
+
+        if game_mode == 'team5v5':
+            self.obstacles = self._team_obstacles()
+        else:
+            self.obstacles = self._random_obstacles(rng, tutorial_mode, player_pos)
+
+        footprints = [Footprint(*obstacle) for obstacle in self.obstacles]
+        self.pathfinding_grid = PathfindingGrid(MAP_WIDTH, MAP_HEIGHT, footprints, cell_size=40)
+        # Free-space samples for fast spawn point selection
+        self.free_space_samples = self.pathfinding_grid.walkable_cells()
+        # Baked cover/exposure map for TeamAI encirclement slots
+        self.tactical_map = None
+        if game_mode == 'team5v5' and not tutorial_mode:
+            self.tactical_map = TacticalMap(self.pathfinding_grid)
+
+        self.enemy_spawns = []
+        if not tutorial_mode and game_mode != 'team5v5':
+            self.enemy_spawns = self._enemy_spawns(rng, max_enemies, footprints)
+
+    def _team_obstacles(self):
+        """FIXED MAP LAYOUT FOR 5VS5"""
+        obstacles = []
+        # Create defensive cover around Blue spawn (Bottom-Right)
+        blue_base_x = MAP_WIDTH - 200
+        blue_base_y = MAP_HEIGHT - 200
+
+        # Defensive walls (U-shape pointing towards center)
+        obstacles.append((blue_base_x - 300, blue_base_y - 200, 400, 50))  # Top wall
+        obstacles.append((blue_base_x - 300, blue_base_y - 200, 50, 400))  # Left wall
+        obstacles.append((blue_base_x - 300, blue_base_y + 150, 400, 50))  # Bottom wall
+
+        # Some scattered cover in the middle field
+        obstacles.append((MAP_WIDTH // 2 - 100, MAP_HEIGHT // 2 - 100, 200, 200))  # Center block
+        obstacles.append((MAP_WIDTH // 2 - 400, MAP_HEIGHT // 2 + 200, 100, 100))
+        obstacles.append((MAP_WIDTH // 2 + 300, MAP_HEIGHT // 2 - 300, 100, 100))
+
+        # Create defensive cover around Red spawn (Top-Left)
+        red_base_x = 100
+        red_base_y = 100
+
+        # Defensive walls (U-shape pointing towards center)
+        obstacles.append((red_base_x + 100, red_base_y + 300, 400, 50))  # Bottom wall
+        obstacles.append((red_base_x + 450, red_base_y + 100, 50, 400))  # Right wall
+        obstacles.append((red_base_x + 100, red_base_y - 100, 400, 50))  # Top wall
+        return obstacles
+
+    def _random_obstacles(self, rng, tutorial_mode, player_pos):
+        """Randomly scattered buildings (fewer in the tutorial, none next to the player)"""
+        obstacles = []
+        num_obstacles = 5 if tutorial_mode else 20
+        for _ in range(num_obstacles):
+            x = rng.randint(0, MAP_WIDTH - 100)
+            y = rng.randint(0, MAP_HEIGHT - 100)
+            w = rng.randint(50, 200)
+            h = rng.randint(50, 200)
+            # Ensure not spawning on player in tutorial
+            if tutorial_mode:
+                if abs(x - player_pos[0]) < 300 and abs(y - player_pos[1]) < 300:
+                    continue
+            obstacles.append((x, y, w, h))
+        return obstacles
+
+    def _enemy_spawns(self, rng, count, footprints):
+        """Free spawn points in the top-left corner area, one per enemy"""
+        spawns = []
+        for _ in range(count):
+            for attempt in range(100):
+                x = rng.randint(0, MAP_WIDTH // 4)
+                y = rng.randint(0, MAP_HEIGHT // 4)
+                rect = pygame.Rect(x, y, ENEMY_SIZE, ENEMY_SIZE)
+                if not any(footprint.rect.colliderect(rect) for footprint in footprints):
+                    break
+            spawns.append((x, y))
+        return spawns
+
+
+class MatchPreloader:
+    """
+    Builds the next MatchLayout on a worker thread while the player is in the menus,
+    and decodes the images of the selected design at the same time.
+    The menus call start() every frame; it only starts work when the settings that
+    shape the layout (mode, enemy count) differ from the layout being prepared.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.lock = threading.Lock()
+        self.key = None  # Key of the layout being prepared / ready
+        self.layout = None
+        self.thread = None
+
+    def current_key(self, tutorial_mode=False):
+        return (self.game.game_mode, tutorial_mode, self.game.max_enemies)
+
+    def start(self, tutorial_mode=False):
+        """Prepare a layout for the current settings in the background (no-op if already done)"""
+        key = self.current_key(tutorial_mode)
+        with self.lock:
+            if key == self.key:
+                return
+            self.key = key
+            self.layout = None
+        design_id = self.game.selected_design
+        design_info = self.game.designs.get(design_id, self.game.designs['classic'])
+        seed = random.getrandbits(32)
+        self.thread = threading.Thread(target=self._work, args=(key, seed, design_id, design_info), daemon=True)
+        self.thread.start()
+
+    def _work(self, key, seed, design_id, design_info):
+        game_mode, tutorial_mode, max_enemies = key
+        player_pos = (MAP_WIDTH - 100, MAP_HEIGHT - 100)
+        layout = MatchLayout(seed, game_mode, tutorial_mode, max_enemies, player_pos)
+        # Decode images now so Game.new only has to convert and scale them
+        preload_ground(design_id, design_info)
+        assets.decode(design_info['house'])
+        with self.lock:
+            if self.key == key:  # Settings may have changed while we were working
+                self.layout = layout
+
+    def take(self, tutorial_mode=False):
+        """
+        The prepared layout for the current settings (waits for a worker that is
+        still busy with it), or a freshly generated one if nothing matches.
+        """
+        key = self.current_key(tutorial_mode)
+        with self.lock:
+            thread = self.thread if key == self.key else None
+        if thread is not None:
+            thread.join()
+        with self.lock:
+            layout = self.layout if key == self.key else None
+            self.key = None
+            self.layout = None
+        if layout is None:
+            player_pos = (MAP_WIDTH - 100, MAP_HEIGHT - 100)
+            layout = MatchLayout(random.getrandbits(32), *key, player_pos)
+        else:
+            print(f"[PRELOAD] Vorbereitete Karte (Seed {layout.seed}) uebernommen")
+        return layout
@@ -4,11 +4,27 @@ import pygame
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+MENU_FPS = 30  # Redraw cap for menus (they only redraw after input)
+MENU_IDLE_MS = 1000  # Longest a menu sleeps without input before running its loop again
+DIRTY_RECT_RENDERING = True  # Only push changed screen regions while the camera stands still
 TITLE = "City Scramble"
+DEBUG_STATS = False  # Print profiling statistics (e.g. line-of-sight cache hit rate) after each match
 
 # Map settings
 MAP_WIDTH = 3200
 MAP_HEIGHT = 1800
+GROUND_CHUNK_SIZE = 256  # Ground texture is stored and blitted in chunks of this size
+GROUND_DISK_CACHE = True  # Keep decoded design textures as raw pixels in .ground_cache/ (skips PNG/WebP decoding)
+
+# Render layers (drawn bottom to top). Every sprite in all_sprites declares its
+# render_layer, health_bar ('hits', 'hp' or None) and render_static (never moves).
+# Decals and effects are drawn by the EffectSystem below / above all sprites.
+LAYER_DECALS = 0  # Kill animations on the ground
+LAYER_ITEMS = 1
+LAYER_AGENTS = 2
+LAYER_PROJECTILES = 3
+LAYER_EFFECTS = 4  # Hit markers, explosion particles
+RENDER_CELL_SIZE = 200  # Cell size of the render culling index
 
 # Colors (R, G, B)
 WHITE = (255, 255, 255)
@@ -35,6 +51,29 @@ PLAYER_SIZE = 40
 PLAYER_COLOR = WHITE
 PLAYER_HEALTH = 4000
 
+# Civilian settings
+CIVILIAN_COUNT = 40  # Simulated as a batched crowd when numpy is installed
+
+# Minimap: entity dots are refreshed at ~12 Hz instead of every frame
+MINIMAP_REFRESH_MS = 80
+
+# Sound effects: mixer channels reserved for hits, kills and explosions
+SFX_CHANNELS = 6
+
+# Rainbow skin / bullets: hue speed in degrees per second
+RAINBOW_PLAYER_SPEED = 120
+RAINBOW_PROJECTILE_SPEED = 300
+
+# Team mode settings
+TEAM_SIZE_DEFAULT = 5  # Members per team (the player counts for blue)
+TEAM_SIZE_MAX = 50
+TEAM_RESPAWN_DELAY = 5000  # ms
+TEAM_REPLANS_PER_FRAME = 2  # A* replans per frame for members that already follow a path
+TEAM_SPAWNS = {
+    'blue': (MAP_WIDTH - 200, MAP_HEIGHT - 200),  # Bottom-right
+    'red': (100, 100)  # Top-left
+}
+
 # Enemy settings
 ENEMY_SPEED = 120
 ENEMY_SIZE = 40
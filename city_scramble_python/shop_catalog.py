@@ -0,0 +1,120 @@
+class ShopCatalog:
+    """
+    One cosmetic category (character colors, bullet colors, kill animations, designs).
+    Items, owned ids and the current selection live on the Game under the attribute
+    names given here, so the generic shop and wardrobe screens always read the live
+    state and new entries in e.g. game.kill_animations show up without UI code.
+    """
+
+    def __init__(self, game, items, owned, selected, default, style, shop, wardrobe,
+                 price=None, keep_owned=False, sellable=False):
+        self.game = game
+        self.items_attr = items  # Game attribute: item id -> {'name', 'cost', ...}
+        self.owned_attr = owned  # Game attribute: list of owned item ids
+        self.selected_attr = selected  # Game attribute: selected item id
+        self.default = default  # Free item that is always owned and can't be sold
+        self.style = style  # 'swatch' (item color as background), 'plain' or 'world'
+        self.shop = shop  # Shop screen texts and grid
+        self.wardrobe = wardrobe  # Wardrobe screen texts and grid
+        self.price_attr = price  # Game attribute with one price for every item (None = item['cost'])
+        self.keep_owned = keep_owned  # Shop keeps owned items (marked as bought) instead of hiding them
+        self.sellable = sellable  # Wardrobe offers selling items back for half the price
+
+    @property
+    def items(self):
+        return getattr(self.game, self.items_attr)
+
+    @property
+    def owned(self):
+        return getattr(self.game, self.owned_attr)
+
+    @property
+    def selected(self):
+        return getattr(self.game, self.selected_attr)
+
+    @selected.setter
+    def selected(self, item_id):
+        setattr(self.game, self.selected_attr, item_id)
+
+    def name(self, item_id):
+        return self.items[item_id]['name']
+
+    def cost(self, item_id):
+        if self.price_attr:
+            return getattr(self.game, self.price_attr)
+        return self.items[item_id]['cost']
+
+    def sell_price(self, item_id):
+        return self.cost(item_id) // 2  # 50% of original price
+
+    def shop_ids(self):
+        """Items offered in the shop (never the free default)"""
+        return [item_id for item_id in self.items
+                if item_id != self.default and (self.keep_owned or item_id not in self.owned)]
+
+    def wardrobe_ids(self):
+        """Items shown in the wardrobe; 'world' catalogs also list locked items"""
+        if self.style == 'world':
+            return list(self.items)
+        return [item_id for item_id in self.owned if item_id in self.items]
+
+    def buy(self, item_id):
+        """Buy an item; False if the player can't afford it"""
+        cost = self.cost(item_id)
+        if self.game.total_score < cost:
+            return False
+        self.game.total_score -= cost
+        self.owned.append(item_id)
+        self.game.save_total_score()
+        return True
+
+    def sell(self, item_id):
+        """Sell an item for half its price (falls back to the default if it was selected)"""
+        price = self.sell_price(item_id)
+        self.game.total_score += price
+        self.owned.remove(item_id)
+        if self.selected == item_id:
+            self.selected = self.default
+        self.game.save_total_score()
+        return price
+
+    def select(self, item_id):
+        self.selected = item_id
+        self.game.save_total_score()
+
+
+def build_catalogs(game):
+    """All cosmetic catalogs, keyed by name. Grids are (columns, width, height, gap_x, row_pitch, top)."""
+    return {
+        'character': ShopCatalog(
+            game, 'character_colors', 'owned_colors', 'selected_color', 'white', 'swatch', sellable=True,
+            shop={'title': "CHARAKTER-SHOP", 'color': (200, 100, 200),
+                  'note': "Farbenpreis: 15.000 (Spezial teurer)",
+                  'grid': (2, 220, 50, 20, 70, 180), 'empty': "Alle Farben bereits gekauft!"},
+            wardrobe={'title': "KLEIDERSCHRANK", 'color': (100, 150, 200),
+                      'current': "Aktuelle Farbe", 'chosen': "Farbe gewählt",
+                      'grid': (3, 100, 100, 20, 140, 180)}),
+        'bullet': ShopCatalog(
+            game, 'bullet_colors', 'owned_bullet_colors', 'selected_bullet_color', 'white', 'swatch', sellable=True,
+            shop={'title': "KUGEL-SHOP", 'color': (255, 150, 50),
+                  'note': "Farbenpreise wie im Charakter-Shop",
+                  'grid': (2, 220, 50, 20, 70, 180), 'empty': "Alle Farben bereits gekauft!"},
+            wardrobe={'title': "KUGEL-FARBEN", 'color': (200, 200, 50),
+                      'current': "Aktuelle Farbe", 'chosen': "Farbe gewählt",
+                      'grid': (3, 100, 100, 20, 140, 180)}),
+        'kill_animation': ShopCatalog(
+            game, 'kill_animations', 'owned_kill_animations', 'selected_kill_animation', 'none', 'plain',
+            shop={'title': "KILL-ANIMATIONEN SHOP", 'color': (150, 50, 150),
+                  'grid': (2, 300, 60, 20, 80, 180), 'empty': "Alle Animationen gekauft!"},
+            wardrobe={'title': "KILL-ANIMATIONEN", 'color': (200, 100, 150),
+                      'current': "Aktuell", 'chosen': "Animation gewählt",
+                      'grid': (2, 300, 60, 20, 80, 180)}),
+        'design': ShopCatalog(
+            game, 'designs', 'owned_designs', 'selected_design', 'classic', 'world',
+            price='special_design_cost', keep_owned=True,
+            shop={'title': "DESIGN-SHOP", 'color': (200, 200, 50),
+                  'grid': (1, 300, 80, 0, 100, 180), 'empty': ""},
+            wardrobe={'title': "WELT-DESIGNS", 'color': (200, 200, 50),
+                      'current': "Aktuelles Design", 'chosen': "Design gewählt",
+                      'grid': (1, 300, 60, 0, 80, 150)}),
+    }
@@ -8,6 +8,7 @@ class SpatialHash:
     def __init__(self, cell_size=100):
         self.cell_size = cell_size
         self.contents = {}  # Map (x, y) -> set([objects])
+        self.object_cells = {}  # Map object -> list of cells it is stored in
 
     def _get_cell_coords(self, x, y):
         return int(x // self.cell_size), int(y // self.cell_size)
@@ -34,24 +35,29 @@ class SpatialHash:
                 self.contents[cell] = set()
             self.contents[cell].add(obj)
             
-        # Store current cells on object for fast updates
-        obj._spatial_hash_cells = cells
+        # Remember current cells for fast updates
+        self.object_cells[obj] = cells
 
     def remove(self, obj):
         """Remove an object from the spatial hash."""
-        if hasattr(obj, '_spatial_hash_cells'):
-            for cell in obj._spatial_hash_cells:
+        cells = self.object_cells.pop(obj, None)
+        if cells is not None:
+            for cell in cells:
                 if cell in self.contents:
                     self.contents[cell].discard(obj)
                     if not self.contents[cell]:  # Clean up empty cells
                         del self.contents[cell]
-            del obj._spatial_hash_cells
 
     def update(self, obj):
         """Update an object's position in the spatial hash."""
         self.remove(obj)
         self.add(obj)
 
+    def move(self, obj):
+        """Re-index an object only if it has crossed into different cells."""
+        if self.object_cells.get(obj) != self._get_cells_for_rect(obj.rect):
+            self.update(obj)
+
     def get_nearby(self, rect):
         """
         Get all objects in the same cells as the given rect.
@@ -1,7 +1,12 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
 from settings import *
+from ground import get_ground
+from spatial_hash import SpatialHash
+from palette import RAINBOW_RGB, rainbow_hue
+from assets import assets
 vec = pygame.math.Vector2
 
 class CameraGroup(pygame.sprite.Group):
@@ -13,33 +18,110 @@ class CameraGroup(pygame.sprite.Group):
         self.half_w = self.display_surface.get_size()[0] // 2
         self.half_h = self.display_surface.get_size()[1] // 2
         
-        # Create a map surface (optional, but good for performance if static)
-        self.ground_surf = pygame.Surface((MAP_WIDTH, MAP_HEIGHT))
-        
-        # Load texture based on selected design
+        # Chunked ground of the selected design (shared across matches)
         design_id = game.selected_design
         design_info = game.designs.get(design_id, game.designs['classic'])
-        img_file = design_info['img']
-        fallback_color = design_info['color']
-        
-        if img_file:
-            try:
-                import os
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                file_path = os.path.join(script_dir, img_file)
-                ground_img = pygame.image.load(file_path).convert()
-                # Tile the texture
-                for x in range(0, MAP_WIDTH, ground_img.get_width()):
-                    for y in range(0, MAP_HEIGHT, ground_img.get_height()):
-                        self.ground_surf.blit(ground_img, (x, y))
-                print(f"[OK] Design-Textur '{file_path}' erfolgreich geladen")
-            except Exception as e:
-                print(f"[FEHLER] Konnte {img_file} nicht laden: {e}")
-                self.ground_surf.fill(fallback_color)
-        else:
-            self.ground_surf.fill(fallback_color)
-            
-        self.ground_rect = self.ground_surf.get_rect(topleft=(0, 0))
+        self.ground = get_ground(design_id, design_info)
+        self.ground_rect = pygame.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
+
+        # Static layer: ground chunks with the buildings baked in (buildings are not drawn as sprites)
+        self.static_chunks = {}  # (chunk_x, chunk_y) -> Surface, created when first seen
+        self.static_dirty = []  # World rects re-baked since the last frame
+
+        # Render culling index: static sprites are indexed once, moving ones re-indexed per frame
+        self.render_index = SpatialHash(cell_size=RENDER_CELL_SIZE)
+        self.moving = set()
+        self.unindexed = set()  # Added since the last frame (rects are set after Sprite.__init__)
+        self.add_order = {}  # sprite -> sequence number (stable draw order inside a layer)
+        self.next_order = 0
+
+        # Dirty-rect rendering state
+        self.last_offset = None  # Camera offset of the previous frame (None = never drawn)
+        self.full_redraw = True
+        self.drawn = {}  # sprite -> (screen rect incl. health bar, draw key) of the previous frame
+        self.marked = set()  # Sprites whose image changed in place
+        self.overlay_rects = []  # HUD rects drawn on top of the world this frame
+        self.effect_rects = []  # Screen rects of the effects drawn last frame
+        self.dirty_rects = []
+
+    def _bake_walls(self, surface, surface_rect, rect):
+        """Draw ground and buildings inside world rect onto a surface covering surface_rect"""
+        surface.set_clip(rect.move(-surface_rect.x, -surface_rect.y))
+        ground = self.ground.get(surface_rect.x // self.ground.chunk_size, surface_rect.y // self.ground.chunk_size)
+        surface.blit(ground, (0, 0))
+        for wall in self.game.walls:
+            if wall.rect.colliderect(rect):
+                surface.blit(wall.image, wall.rect.move(-surface_rect.x, -surface_rect.y))
+        surface.set_clip(None)
+
+    def _static_chunk(self, chunk_x, chunk_y):
+        """Ground chunk with the buildings baked in, created on first use"""
+        chunk = self.static_chunks.get((chunk_x, chunk_y))
+        if chunk is None:
+            chunk_rect = self.ground.chunk_rect(chunk_x, chunk_y)
+            chunk = pygame.Surface(chunk_rect.size).convert()
+            self._bake_walls(chunk, chunk_rect, chunk_rect)
+            self.static_chunks[(chunk_x, chunk_y)] = chunk
+        return chunk
+
+    def _blit_static(self, screen_rect):
+        """Blit the static layer below a screen rect, touching only the chunks it overlaps"""
+        ox, oy = int(self.offset.x), int(self.offset.y)
+        world_rect = screen_rect.move(ox, oy)
+        for chunk_x, chunk_y in self.ground.chunks_in(world_rect):
+            chunk_rect = self.ground.chunk_rect(chunk_x, chunk_y)
+            area = world_rect.clip(chunk_rect)
+            self.display_surface.blit(self._static_chunk(chunk_x, chunk_y), (area.x - ox, area.y - oy),
+                                      area.move(-chunk_rect.x, -chunk_rect.y))
+
+    def rebake(self, rect):
+        """Re-render ground and buildings inside a world rect into the static layer"""
+        rect = pygame.Rect(rect).clip(self.ground_rect)
+        if not rect.width or not rect.height:
+            return
+        # Chunks that were never seen are baked completely when they first come into view
+        for chunk_pos in self.ground.chunks_in(rect):
+            chunk = self.static_chunks.get(chunk_pos)
+            if chunk is not None:
+                chunk_rect = self.ground.chunk_rect(*chunk_pos)
+                self._bake_walls(chunk, chunk_rect, rect.clip(chunk_rect))
+        self.static_dirty.append(rect)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.unindexed.add(sprite)
+        if not sprite.render_static:
+            self.moving.add(sprite)
+        self.add_order[sprite] = self.next_order
+        self.next_order += 1
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.render_index.remove(sprite)
+        self.unindexed.discard(sprite)
+        self.moving.discard(sprite)
+        self.add_order.pop(sprite, None)
+
+    def _draw_order(self, sprite):
+        return sprite.render_layer, self.add_order[sprite]
+
+    def mark_dirty(self, sprite):
+        """Force a redraw of a sprite whose image was changed in place (e.g. fill)"""
+        self.marked.add(sprite)
+
+    def add_overlay(self, rect):
+        """Register a screen rect drawn on top of the world this frame (HUD, minimap, ...)"""
+        self.overlay_rects.append(pygame.Rect(rect))
+
+    def _screen_rect(self, sprite):
+        """Screen area covered by a sprite including the health bar strip above it"""
+        return pygame.Rect(sprite.rect.x - int(self.offset.x), sprite.rect.y - int(self.offset.y) - 10,
+                           sprite.rect.width, sprite.rect.height + 10)
+
+    def _draw_key(self, sprite):
+        """Everything that changes how a sprite looks on screen (besides in-place image edits)"""
+        return (tuple(sprite.rect), id(sprite.image), sprite.image.get_alpha(),
+                getattr(sprite, 'hit_count', None), getattr(sprite, 'hp', None))
 
     def custom_draw(self, player):
         # Calculate offset
@@ -50,61 +132,115 @@ class CameraGroup(pygame.sprite.Group):
         self.offset.x = max(0, min(self.offset.x, MAP_WIDTH - SCREEN_WIDTH))
         self.offset.y = max(0, min(self.offset.y, MAP_HEIGHT - SCREEN_HEIGHT))
 
-        # Draw ground
-        ground_offset = self.ground_rect.topleft - self.offset
-        self.display_surface.blit(self.ground_surf, ground_offset)
-
-        # Draw sprites
         # Define camera view rect for culling (add margin to avoid pop-in)
-        camera_view = pygame.Rect(self.offset.x - 50, self.offset.y - 50, 
+        camera_view = pygame.Rect(self.offset.x - 50, self.offset.y - 50,
                                  SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100)
-        
-        for sprite in self.sprites():
-            if camera_view.colliderect(sprite.rect):
-                offset_pos = sprite.rect.topleft - self.offset
-                self.display_surface.blit(sprite.image, offset_pos)
-            else:
-                continue # Skip drawing and health bars if off-screen
-            
-            # Health bars logic continues... (indented)
-            # Player / NetworkPlayer (use hit_count)
-            if hasattr(sprite, 'hit_count'):
-                # Max hits 10. Current Health = 10 - hit_count
-                max_hp = 10
-                current_hp = max(0, max_hp - sprite.hit_count)
-                
-                bar_width = sprite.rect.width
-                bar_height = 5
-                bar_x = offset_pos[0]
-                bar_y = offset_pos[1] - 10
-                
-                # Background (Red)
-                pygame.draw.rect(self.display_surface, (200, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-                # Foreground (Green)
-                if current_hp > 0:
-                    health_width = int(bar_width * (current_hp / max_hp))
-                    pygame.draw.rect(self.display_surface, (0, 200, 0), (bar_x, bar_y, health_width, bar_height))
-            
-            # Enemy (uses hp) - Only if not a wall (Obstacle has hp too but we don't want bars on walls)
-            elif hasattr(sprite, 'hp') and hasattr(sprite, 'vel'): # Simple check to distinguish enemies from walls
-                max_hp = 3 # Default enemy HP
-                if hasattr(sprite, 'max_hp'):
-                    max_hp = sprite.max_hp
-                current_hp = max(0, sprite.hp)
-                
-                bar_width = sprite.rect.width
-                bar_height = 5
-                bar_x = offset_pos[0]
-                bar_y = offset_pos[1] - 10
-                
-                # Background (Red)
-                pygame.draw.rect(self.display_surface, (200, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-                # Foreground (Green)
-                if current_hp > 0:
-                    health_width = int(bar_width * (current_hp / max_hp))
-                    pygame.draw.rect(self.display_surface, (0, 200, 0), (bar_x, bar_y, health_width, bar_height))
+        for sprite in self.unindexed:
+            self.render_index.add(sprite)
+        self.unindexed.clear()
+        for sprite in self.moving:
+            self.render_index.move(sprite)
+        visible = [sprite for sprite in self.render_index.get_nearby(camera_view)
+                   if camera_view.colliderect(sprite.rect)]
+        visible.sort(key=self._draw_order)
+
+        drawn = {sprite: (self._screen_rect(sprite), self._draw_key(sprite)) for sprite in visible}
+        self.full_redraw = (not DIRTY_RECT_RENDERING or self.full_redraw
+                            or self.last_offset is None or self.offset != self.last_offset)
+
+        view_rect = self.display_surface.get_rect()
+        effect_rects = [rect for rect in self.game.effects.screen_rects(int(self.offset.x), int(self.offset.y))
+                        if view_rect.colliderect(rect)]
+
+        if self.full_redraw:
+            # Camera scrolled: redraw everything
+            self.display_surface.fill(DARK_GREY)
+            self._blit_static(view_rect)
+            self._draw_layers(visible)
+            self.dirty_rects = []
+        else:
+            # Static camera: collect screen regions that changed since the last frame
+            dirty = list(self.overlay_rects)  # Last frame's HUD has to be erased
+            dirty.extend(rect.move(-int(self.offset.x), -int(self.offset.y)) for rect in self.static_dirty)
+            # Effects fade every frame: their previous and current areas are always dirty
+            dirty.extend(self.effect_rects)
+            dirty.extend(effect_rects)
+            for sprite, (screen_rect, key) in drawn.items():
+                previous = self.drawn.get(sprite)
+                if previous is None:
+                    dirty.append(screen_rect)
+                elif previous[1] != key or sprite in self.marked:
+                    dirty.append(previous[0])
+                    dirty.append(screen_rect)
+            for sprite, (screen_rect, key) in self.drawn.items():
+                if sprite not in drawn:
+                    dirty.append(screen_rect)  # Killed or left the view
+
+            # Every sprite touching a dirty region is redrawn completely, so its area becomes dirty too
+            redraw = set()
+            grown = True
+            while grown:
+                grown = False
+                for sprite in visible:
+                    if sprite not in redraw and drawn[sprite][0].collidelist(dirty) != -1:
+                        redraw.add(sprite)
+                        dirty.append(drawn[sprite][0])
+                        grown = True
+
+            # Restore ground and buildings below the dirty regions, then redraw in layer order
+            for rect in dirty:
+                self._blit_static(rect)
+            self._draw_layers([sprite for sprite in visible if sprite in redraw])
+            self.dirty_rects = dirty
+
+        self.drawn = drawn
+        self.effect_rects = effect_rects
+        self.static_dirty = []
+        self.marked.clear()
+        self.overlay_rects = []
+        self.last_offset = self.offset.copy()
+
+    def _draw_layers(self, sprites):
+        """Ground effects, then sprites in layer order, then effects on top"""
+        ox, oy = int(self.offset.x), int(self.offset.y)
+        now = pygame.time.get_ticks()
+        self.game.effects.draw(self.display_surface, ox, oy, LAYER_DECALS, now)
+        for sprite in sprites:
+            self._draw_sprite(sprite)
+        self.game.effects.draw(self.display_surface, ox, oy, LAYER_EFFECTS, now)
+
+    def present(self):
+        """Push the frame to the display: only the dirty regions unless a full redraw happened"""
+        if self.full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty_rects + self.overlay_rects)
+        self.full_redraw = False
+
+    def _draw_sprite(self, sprite):
+        offset_pos = sprite.rect.topleft - self.offset
+        self.display_surface.blit(sprite.image, offset_pos)
+
+        if sprite.health_bar is None:
+            return
+        if sprite.health_bar == 'hits':
+            # Player / NetworkPlayer: max hits 10. Current Health = 10 - hit_count
+            max_hp = 10
+            current_hp = max(0, max_hp - sprite.hit_count)
+        else:
+            # Agents with hp / max_hp
+            max_hp = sprite.max_hp
+            current_hp = max(0, sprite.hp)
+
+        # Pre-rendered bar for (width, filled pixels)
+        bar = self.game.health_bars.get(sprite.rect.width, current_hp, max_hp)
+        self.display_surface.blit(bar, (offset_pos[0], offset_pos[1] - 10))
 
 class Player(pygame.sprite.Sprite):
+    render_layer = LAYER_AGENTS
+    health_bar = 'hits'
+    render_static = False
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -195,14 +331,13 @@ class Player(pygame.sprite.Sprite):
                     self.hit_count -= 1
                     self.last_regen_time = now
         
-        # Rainbow color animation
+        # Rainbow color animation (global hue clock + lookup table)
         if self.game.selected_color == 'rainbow':
-            self.rainbow_hue = (self.rainbow_hue + 2) % 360  # Cycle through hues
-            # Convert HSV to RGB
-            import colorsys
-            rgb = colorsys.hsv_to_rgb(self.rainbow_hue / 360.0, 1.0, 1.0)
-            color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-            self.image.fill(color)
+            hue = rainbow_hue(pygame.time.get_ticks(), RAINBOW_PLAYER_SPEED)
+            if hue != self.rainbow_hue:
+                self.rainbow_hue = hue
+                self.image.fill(RAINBOW_RGB[hue])
+                self.game.all_sprites.mark_dirty(self)
 
     def collide_with_walls(self, dir):
         if dir == 'x':
@@ -226,48 +361,80 @@ class Player(pygame.sprite.Sprite):
 
 
 
+# Damage tint levels per building look and size: (source, w, h) -> surfaces indexed by remaining HP.
+# LRU-bounded: random building sizes rarely repeat, and every building keeps a reference to its own
+# list, so evicting an entry only stops sharing it (enough entries for one match plus respawns).
+_damage_tint_cache = OrderedDict()
+_DAMAGE_TINT_CACHE_SIZE = 32
+
+
+def damage_tints(source, original_image, max_hp):
+    """Darkened variants of a building image for every HP level, shared by buildings of the same size"""
+    key = (source, original_image.get_width(), original_image.get_height())
+    tints = _damage_tint_cache.get(key)
+    if tints is not None:
+        _damage_tint_cache.move_to_end(key)
+    else:
+        tints = []
+        for hp in range(max_hp + 1):
+            tinted = original_image.copy()
+            dark_value = int(255 * hp / max_hp)
+            # Multiply blend to darken the image
+            tinted.fill((dark_value, dark_value, dark_value), special_flags=pygame.BLEND_RGB_MULT)
+            tints.append(tinted)
+        _damage_tint_cache[key] = tints
+        if len(_damage_tint_cache) > _DAMAGE_TINT_CACHE_SIZE:
+            _damage_tint_cache.popitem(last=False)  # Drop least recently used
+    return tints
+
+
 class Obstacle(pygame.sprite.Sprite):
     def __init__(self, game, x, y, w, h):
-        self.groups = game.walls, game.all_sprites
+        self.groups = game.walls  # Drawn through the static layer of CameraGroup, not as a sprite
         pygame.sprite.Sprite.__init__(self, self.groups)
         self.game = game
-        self.image = pygame.Surface((w, h))
+        self.hp = 10  # Buildings have 10 HP
+        self.max_hp = 10
         
-        # Load and scale house image
+        # House image of the selected design, decoded and scaled once per size (shared)
+        design_info = game.designs.get(game.selected_design, game.designs['classic'])
+        house_file = design_info['house']
         try:
-            import os
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            house_path = os.path.join(script_dir, "haus.jpg")
-            house_img = pygame.image.load(house_path).convert()
-            self.original_image = pygame.transform.scale(house_img, (w, h))
-            self.image.blit(self.original_image, (0, 0))
+            self.original_image = assets.scaled_image(house_file, w, h)
+            source = house_file
         except Exception as e:
-            print(f"[FEHLER] Konnte haus.jpg nicht laden: {e}")
-            self.image.fill(SANDSTONE)
-            self.original_image = self.image.copy()
+            print(f"[FEHLER] Konnte {house_file} nicht laden: {e}")
+            self.original_image = pygame.Surface((w, h))
+            self.original_image.fill(SANDSTONE)
+            source = None
+
+        # Tinted variants for every HP level (a hit only swaps the image)
+        self.tints = damage_tints(source, self.original_image, self.max_hp)
+        self.image = self.tints[self.max_hp]
 
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
-        self.hp = 10  # Buildings have 10 HP
-        self.max_hp = 10
         # Store original position and size for respawning
         self.original_x = x
         self.original_y = y
         self.original_w = w
         self.original_h = h
+        self.game.walls_changed(self.rect)
+
+    def kill(self):
+        """Remove the building and let wall-dependent caches know"""
+        was_alive = self.alive()
+        super().kill()
+        if was_alive:
+            self.game.walls_changed(self.rect)
     
     def take_damage(self, amount):
         """Take damage and destroy if HP reaches 0"""
         self.hp -= amount
-        # Visual feedback - darken when damaged
-        damage_percent = self.hp / self.max_hp
-        
-        # Redraw original and apply darkening filter
-        self.image.blit(self.original_image, (0, 0))
-        dark_value = int(255 * damage_percent)
-        # Multiply blend to darken the image
-        self.image.fill((dark_value, dark_value, dark_value), special_flags=pygame.BLEND_RGB_MULT)
+        # Visual feedback - darken when damaged (precomputed tint for the remaining HP)
+        self.image = self.tints[max(0, min(self.max_hp, int(self.hp)))]
+        self.game.all_sprites.rebake(self.rect)
         
         if self.hp <= 0:
             # Schedule respawn
@@ -282,6 +449,10 @@ class Obstacle(pygame.sprite.Sprite):
             self.kill()
 
 class Projectile(pygame.sprite.Sprite):
+    render_layer = LAYER_PROJECTILES
+    health_bar = None
+    render_static = False
+
     def __init__(self, game, x, y, dir_x, dir_y, owner, damage, speed, lifetime, color, is_rainbow=False, shooter=None):
         self.groups = game.all_sprites, game.projectiles
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -297,7 +468,13 @@ class Projectile(pygame.sprite.Sprite):
         self.spawn_time = pygame.time.get_ticks()
         self.lifetime = lifetime
         self.is_rainbow = is_rainbow
-        self.rainbow_hue = 0
+        if is_rainbow:
+            self.update_rainbow()
+
+    def update_rainbow(self):
+        """Switch to the shared pre-filled surface for the current hue (cycles with projectile age)"""
+        hue = rainbow_hue(pygame.time.get_ticks() - self.spawn_time, RAINBOW_PROJECTILE_SPEED)
+        self.image = self.game.rainbow_projectiles.get(hue)
 
     def update(self):
         self.rect.center += self.vel * self.game.dt
@@ -308,20 +485,14 @@ class Projectile(pygame.sprite.Sprite):
 
         # Rainbow animation
         if self.is_rainbow:
-            self.rainbow_hue = (self.rainbow_hue + 5) % 360
-            import colorsys
-            rgb = colorsys.hsv_to_rgb(self.rainbow_hue / 360.0, 1.0, 1.0)
-            color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-            self.image.fill(color)
+            self.update_rainbow()
 
-        # Team mode collision handling
+        # Team mode collision handling (candidates come from the per-frame neighbour index)
         if self.owner == 'team_blue':
             # Blue team projectiles hit red team
-            hits = pygame.sprite.spritecollide(self, self.game.team_enemies, False)
+            hits = self.game.neighbor_index.colliding(self.rect, 'team_red')
             if hits:
-                print(f"DEBUG: Blue projectile hit {len(hits)} red team members!")
                 for hit in hits:
-                    print(f"DEBUG: Dealing {self.damage} damage to red TeamAI with {hit.hp} HP")
                     hit.take_damage(self.damage)
                     # Award points to blue team
                     if hasattr(self.game, 'team_blue_score'):
@@ -347,7 +518,7 @@ class Projectile(pygame.sprite.Sprite):
 
         elif self.owner == 'team_red':
             # Red team projectiles hit blue team
-            hits = pygame.sprite.spritecollide(self, self.game.team_allies, False)
+            hits = self.game.neighbor_index.colliding(self.rect, 'team_blue')
             for hit in hits:
                 if hasattr(hit, 'hit_count'):
                     hit.hit_count += 1
@@ -389,7 +560,7 @@ class Projectile(pygame.sprite.Sprite):
             hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
             # FALLBACK: Also check team enemies in 5v5 mode
             if not hits and hasattr(self.game, 'game_mode') and self.game.game_mode == 'team5v5':
-                 hits = pygame.sprite.spritecollide(self, self.game.team_enemies, False)
+                 hits = self.game.neighbor_index.colliding(self.rect, 'team_red')
 
             if hits:
                 for hit in hits:
@@ -452,7 +623,6 @@ class Projectile(pygame.sprite.Sprite):
                 self.game.player.hit_count += 1
                 self.game.player.last_action_time = pygame.time.get_ticks()
                 self.game.player.last_regen_time = pygame.time.get_ticks()
-                print(f"[DEBUG] Uprising civilian projectile hit player! Damage: 1, Total hits: {self.game.player.hit_count}")
                 self.kill()
                 return
 
@@ -463,9 +633,8 @@ class Projectile(pygame.sprite.Sprite):
                     # Deal 10 damage per hit (5 hits to kill = 50 HP)
                     damage = 10
                     enemy.hp -= damage  # Direct HP reduction, bypass score system
-                    print(f"[DEBUG] Uprising civilian projectile hit enemy! Damage: {damage}, Enemy HP: {enemy.hp}/{enemy.max_hp}")
                     # Show hit marker
-                    HitMarker(self.game, enemy.rect.centerx, enemy.rect.centery)
+                    self.game.effects.hit_marker(enemy.rect.centerx, enemy.rect.centery)
 
                     # Check if enemy died
                     if enemy.hp <= 0:
@@ -478,6 +647,10 @@ class Projectile(pygame.sprite.Sprite):
 
 class BuildingProjectile(pygame.sprite.Sprite):
     """Special projectile for destroying buildings"""
+    render_layer = LAYER_PROJECTILES
+    health_bar = None
+    render_static = False
+
     def __init__(self, game, x, y, dir_x, dir_y, damage, speed, lifetime, color):
         self.groups = game.all_sprites, game.projectiles
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -518,11 +691,7 @@ class Grenade(Projectile):
         
         # Rainbow animation
         if self.is_rainbow:
-            self.rainbow_hue = (self.rainbow_hue + 5) % 360
-            import colorsys
-            rgb = colorsys.hsv_to_rgb(self.rainbow_hue / 360.0, 1.0, 1.0)
-            color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-            self.image.fill(color)
+            self.update_rainbow()
             
             # Check collision with enemies for direct hit
         if self.owner == 'player':
@@ -545,12 +714,12 @@ class Grenade(Projectile):
                 return
         elif self.owner == 'team_blue':
             # Player is part of team_blue
-            hits = pygame.sprite.spritecollide(self, self.game.team_enemies, False)
+            hits = self.game.neighbor_index.colliding(self.rect, 'team_red')
             if hits:
                 self.explode()
                 self.kill()
         elif self.owner == 'team_red':
-            hits = pygame.sprite.spritecollide(self, self.game.team_allies, False)
+            hits = self.game.neighbor_index.colliding(self.rect, 'team_blue')
             if hits:
                 self.explode()
                 self.kill()
@@ -586,6 +755,9 @@ class Grenade(Projectile):
                 self.kill()
     
     def explode(self):
+        # Explosion particles
+        self.game.effects.explosion(self.rect.centerx, self.rect.centery, self.explosion_radius)
+        self.game.sfx.play('explosion')
         # Deal area damage to all enemies within explosion radius
         if self.owner == 'team_blue':
             # Blue team grenade hits red team
@@ -681,9 +853,8 @@ class Grenade(Projectile):
                     # Fixed 10 damage per grenade hit (5 hits to kill)
                     damage = 10
                     enemy.hp -= damage  # Direct HP reduction
-                    print(f"[DEBUG] Uprising civilian grenade hit enemy! Damage: {damage}, Enemy HP: {enemy.hp}/{enemy.max_hp}")
                     # Show hit marker
-                    HitMarker(self.game, enemy.rect.centerx, enemy.rect.centery)
+                    self.game.effects.hit_marker(enemy.rect.centerx, enemy.rect.centery)
 
                     # Check if enemy died
                     if enemy.hp <= 0:
@@ -691,45 +862,11 @@ class Grenade(Projectile):
                         enemy.kill()
 
 
-class HitMarker(pygame.sprite.Sprite):
-    def __init__(self, game, x, y):
-        self.groups = game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-        self.game = game
-        # Larger surface for better visibility
-        self.image = pygame.Surface((60, 40))
-        self.image.fill(DARK_GREY)  # Background color (transparent effect)
-        self.image.set_colorkey(DARK_GREY)  # Make background transparent
-        
-        # Draw white background circle for contrast
-        pygame.draw.circle(self.image, WHITE, (30, 20), 25)  # White background
-        pygame.draw.circle(self.image, BLACK, (30, 20), 25, 2)  # Black border
-        
-        # Draw "HIT!" text - larger and bolder
-        font = pygame.font.SysFont("Arial", 24, bold=True)
-        text = font.render("HIT!", True, RED)
-        text_rect = text.get_rect(center=(30, 20))
-        self.image.blit(text, text_rect)
-        
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime = 400  # Show for 400ms (slightly longer)
-        self.alpha = 255  # Start fully opaque
-        
-    def update(self):
-        # Fade out effect
-        now = pygame.time.get_ticks()
-        elapsed = now - self.spawn_time
-        
-        if elapsed > self.lifetime:
-            self.kill()
-        else:
-            # Calculate alpha based on time remaining
-            self.alpha = int(255 * (1 - elapsed / self.lifetime))
-            self.image.set_alpha(self.alpha)
-
 class Enemy(pygame.sprite.Sprite):
+    render_layer = LAYER_AGENTS
+    health_bar = 'hp'
+    render_static = False
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites, game.enemies
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -809,9 +946,15 @@ class Enemy(pygame.sprite.Sprite):
         """Update enemy color to match current weapon color"""
         weapon_color = WEAPONS[self.weapon]['color']
         self.image.fill(weapon_color)
+        self.game.all_sprites.mark_dirty(self)
 
     def has_line_of_sight(self, target_pos):
         """Check if there's a clear line of sight to target position (no walls blocking)"""
+        return self.game.los_cache.check('enemy', self.rect.center, target_pos, pygame.time.get_ticks(),
+                                         lambda: self._raycast_line_of_sight(target_pos))
+
+    def _raycast_line_of_sight(self, target_pos):
+        """Uncached raycast behind has_line_of_sight"""
         # Simple raycast - check points along the line between enemy and target
         start = vec(self.rect.centerx, self.rect.centery)
         end = vec(target_pos[0], target_pos[1])
@@ -1259,49 +1402,21 @@ class Enemy(pygame.sprite.Sprite):
             if not target_pos: # Only if not flanking or rerouting
                 
                 # Check for nearby upgrades (priority over combat)
-                closest_upgrade = None
-                closest_distance = 300  # Detection range
-                
-                for upgrade in self.game.upgrade_items:
-                    dist = (vec(upgrade.rect.centerx, upgrade.rect.centery) - self.pos).length()
-                    if dist < closest_distance:
-                        closest_distance = dist
-                        closest_upgrade = upgrade
+                # 300px detection range, answered by the per-frame neighbour index
+                closest_upgrade = self.game.neighbor_index.nearest(
+                    self.rect.center, 'upgrade_items', max_distance=300)
                 
                 if closest_upgrade:
                     # Priority 1: Pick up upgrade
                     target_pos = vec(closest_upgrade.rect.centerx, closest_upgrade.rect.centery)
                 else:
                     # Priority 2: Regrouping Logic (Teamwork)
-                    # Check if isolated (no teammates within 100px)
-                    # Use spatial hash for efficiency
-                    nearby_objects = self.game.spatial_hash.get_nearby(self.rect.inflate(200, 200))
-                    ally_count = 0
-                    for obj in nearby_objects:
-                        if isinstance(obj, Enemy) and obj != self:
-                            dist = (self.pos - obj.pos).length()
-                            if dist < 150: # Check 150px radius for allies
-                                ally_count += 1
-                                
-                    if ally_count == 0:
-                        # ISOLATED! Find nearest ally to regroup
-                        nearest_ally = None
-                        min_ally_dist = 99999
-                        
-                        # Find nearest ally (iterating all enemies - usually < 50, so cheap)
-                        # Skip this frame if too many enemies to save CPU? No, 50 is fine.
-                        for ally in self.game.enemies:
-                            if ally != self:
-                                d = (self.pos - ally.pos).length_squared()
-                                if d < min_ally_dist:
-                                    min_ally_dist = d
-                                    nearest_ally = ally
-                                    
-                        if nearest_ally:
-                            # Move towards ally
-                            target_pos = nearest_ally.pos
-                            # Optional: Don't shoot while regrouping to focus on movement? 
-                            # self.last_shot = now # Suppress fire? Maybe not, keep shooting.
+                    # The squad coordinator decides once per think tick whether we are
+                    # isolated (no teammates within 150px) and where our squad regroups
+                    regroup_target = self.game.squads.get_regroup_target(self)
+                    if regroup_target:
+                        # Move towards the nearest squad
+                        target_pos = regroup_target
                     
                     if not target_pos:
                         # Priority 3: Attack Player
@@ -1324,12 +1439,18 @@ class Enemy(pygame.sprite.Sprite):
                 should_recalc = True
             
             if should_recalc and target_pos and hasattr(self.game, 'pathfinding_grid'):
-                from pathfinding import find_path
-                self.path = find_path((self.pos.x, self.pos.y), (target_pos.x, target_pos.y), 
-                                     self.game.pathfinding_grid)
+                # Squad members share one path per squad; only plan alone if there is none
+                shared = self.game.squads.get_shared_path(self, target_pos, now)
+                if shared:
+                    self.path, start_index = shared
+                else:
+                    from pathfinding import find_path
+                    self.path = find_path((self.pos.x, self.pos.y), (target_pos.x, target_pos.y), 
+                                         self.game.pathfinding_grid)
+                    start_index = 0
                 self.path_target_pos = target_pos.copy() if hasattr(target_pos, 'copy') else vec(target_pos[0], target_pos[1])
                 self.path_recalc_timer = now
-                self.current_waypoint_index = 0
+                self.current_waypoint_index = start_index
             
             # Follow path if it exists
             if self.path and len(self.path) > 0:
@@ -1444,7 +1565,8 @@ class Enemy(pygame.sprite.Sprite):
         self.hp -= amount
         self.game.score += amount
         # Show hit marker
-        HitMarker(self.game, self.rect.centerx, self.rect.centery)
+        self.game.effects.hit_marker(self.rect.centerx, self.rect.centery)
+        self.game.sfx.play('hit')
 
         # Trigger dodge reaction when hit (if dodge difficulty allows)
         dodge_difficulty = self.game.ai_dodge_difficulty
@@ -1495,16 +1617,16 @@ class Enemy(pygame.sprite.Sprite):
             # Spawn kill animation
             anim_type = self.game.selected_kill_animation
             if anim_type != 'none':
-                KillAnimation(self.game, self.rect.centerx, self.rect.centery, anim_type)
+                self.game.effects.kill_animation(self.rect.centerx, self.rect.centery, anim_type)
             # Play kill sound
-            if self.game.sounds_enabled:
-                try:
-                    self.game.winsound.Beep(400, 100)  # 400 Hz, 100ms - kill sound
-                except:
-                    pass
+            self.game.sfx.play('kill')
             self.kill()
 
 class WeaponItem(pygame.sprite.Sprite):
+    render_layer = LAYER_ITEMS
+    health_bar = None
+    render_static = True
+
     def __init__(self, game, x, y, weapon_type=None):
         self.groups = game.all_sprites, game.items
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -1519,6 +1641,10 @@ class WeaponItem(pygame.sprite.Sprite):
 
 class UpgradeItem(pygame.sprite.Sprite):
     """Upgrade items that AI enemies can pick up"""
+    render_layer = LAYER_ITEMS
+    health_bar = None
+    render_static = True
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites, game.upgrade_items
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -1550,75 +1676,12 @@ class UpgradeItem(pygame.sprite.Sprite):
         if pygame.time.get_ticks() - self.spawn_time > self.lifetime:
             self.kill()
 
-class KillAnimation(pygame.sprite.Sprite):
-    """Death animation sprite for killed enemies"""
-    def __init__(self, game, x, y, anim_type):
-        self.groups = game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-        self.game = game
-        self.anim_type = anim_type
-        
-        # Get animation data
-        anim_data = game.kill_animations[anim_type]
-        self.lifetime = anim_data['duration']
-        
-        # Create visual based on type
-        size = 50
-        self.image = pygame.Surface((size, size))
-        self.image.set_colorkey((0, 0, 0))  # Make black transparent
-        
-        if anim_type == 'bloodsplat':
-            # Red splat
-            self.image.fill((0, 0, 0))
-            pygame.draw.circle(self.image, (180, 0, 0), (size//2, size//2), size//2)
-            # Add some irregular spots
-            pygame.draw.circle(self.image, (150, 0, 0), (size//3, size//3), size//4)
-            pygame.draw.circle(self.image, (200, 20, 20), (size*2//3, size*2//3), size//5)
-            
-        elif anim_type == 'flowers':
-            # Colorful flowers
-            self.image.fill((0, 0, 0))
-            # Draw several flowers
-            colors = [(255, 100, 200), (255, 255, 100), (100, 200, 255), (200, 100, 255)]
-            positions = [(15, 15), (35, 15), (15, 35), (35, 35), (25, 25)]
-            for pos, color in zip(positions, colors):
-                pygame.draw.circle(self.image, color, pos, 8)
-                pygame.draw.circle(self.image, (255, 255, 0), pos, 3)  # Yellow center
-            
-        elif anim_type == 'gravestone':
-            # Gray gravestone
-            self.image.fill((0, 0, 0))
-            # Draw tombstone shape
-            pygame.draw.rect(self.image, (100, 100, 100), (12, 15, 26, 30))
-            pygame.draw.ellipse(self.image, (100, 100, 100), (12, 10, 26, 20))
-            # Add "RIP" text
-            font = pygame.font.SysFont("Arial", 10, bold=True)
-            rip_text = font.render("RIP", True, (50, 50, 50))
-            self.image.blit(rip_text, (17, 25))
-        
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.spawn_time = pygame.time.get_ticks()
-        self.alpha = 255
-        
-    def update(self):
-        # Fade out effect over lifetime
-        now = pygame.time.get_ticks()
-        elapsed = now - self.spawn_time
-        
-        if elapsed > self.lifetime:
-            self.kill()
-        else:
-            # Calculate alpha based on time remaining (fade out in last 30%)
-            fade_start = self.lifetime * 0.7
-            if elapsed > fade_start:
-                fade_progress = (elapsed - fade_start) / (self.lifetime - fade_start)
-                self.alpha = int(255 * (1 - fade_progress))
-                self.image.set_alpha(self.alpha)
-
-
 class NetworkPlayer(pygame.sprite.Sprite):
     """Remote player in multiplayer game"""
+    render_layer = LAYER_AGENTS
+    health_bar = 'hits'
+    render_static = False
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -1648,6 +1711,10 @@ class NetworkPlayer(pygame.sprite.Sprite):
 
 class TeamAI(pygame.sprite.Sprite):
     """AI teammate for 5v5 team mode"""
+    render_layer = LAYER_AGENTS
+    health_bar = 'hp'
+    render_static = False
+
     def __init__(self, game, x, y, team='blue', member_index=0):
         self.groups = game.all_sprites, game.team_allies if team == 'blue' else game.team_enemies
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -1694,8 +1761,17 @@ class TeamAI(pygame.sprite.Sprite):
         self.path_recalc_timer = 0  # Timer to limit path recalculations
         self.current_waypoint_index = 0  # Index of current waypoint in path
 
+        # Encirclement slot snapped to the tactical map
+        self.tactical_slot_raw = None
+        self.tactical_slot = None
+
     def has_line_of_sight(self, target_pos):
         """Check if there's a clear line of sight to target position"""
+        return self.game.los_cache.check('team', self.rect.center, target_pos, pygame.time.get_ticks(),
+                                         lambda: self._raycast_line_of_sight(target_pos))
+
+    def _raycast_line_of_sight(self, target_pos):
+        """Uncached raycast behind has_line_of_sight"""
         start = vec(self.rect.centerx, self.rect.centery)
         end = vec(target_pos[0], target_pos[1])
 
@@ -1728,19 +1804,9 @@ class TeamAI(pygame.sprite.Sprite):
 
     def find_closest_enemy(self):
         """Find the closest enemy from the opposing team"""
-        closest_enemy = None
-        closest_distance = float('inf')
-
-        # Get the opposing team group
-        enemy_group = self.game.team_enemies if self.team == 'blue' else self.game.team_allies
-
-        for enemy in enemy_group:
-            dist = (vec(enemy.rect.centerx, enemy.rect.centery) - self.pos).length()
-            if dist < closest_distance:
-                closest_distance = dist
-                closest_enemy = enemy
-
-        return closest_enemy
+        # Get the opposing team category
+        enemy_category = 'team_red' if self.team == 'blue' else 'team_blue'
+        return self.game.neighbor_index.nearest(self.rect.center, enemy_category)
 
     def calculate_predicted_target(self, target):
         """Calculate where to aim based on target movement"""
@@ -1828,12 +1894,23 @@ class TeamAI(pygame.sprite.Sprite):
             # Move towards target with tactical positioning
             target_pos = target.pos
             
-            # TACTICAL: Calculate encirclement offset based on member_index
-            # Each unit (0-4) takes a different angle around the target
-            angle = self.member_index * (360 / 5)
+            # TACTICAL: Encirclement slot assigned by the squad coordinator
+            # Fallback: each unit takes a different angle based on member_index
+            angle = self.game.squads.get_slot_angle(self)
+            if angle is None:
+                angle = self.member_index * (360 / self.game.team_size)
             offset_dist = 250 # Distance to maintain from target
             tactical_offset = vec(offset_dist, 0).rotate(angle)
             tactical_target = target_pos + tactical_offset
+
+            # Snap the slot to a walkable high-cover cell (re-snapped once the raw slot moves a cell)
+            tactical_map = self.game.tactical_map
+            if tactical_map:
+                if self.tactical_slot_raw is None or (tactical_target - self.tactical_slot_raw).length() > tactical_map.grid.cell_size:
+                    self.tactical_slot_raw = tactical_target
+                    self.tactical_slot = tactical_map.find_slot(target_pos, tactical_target)
+                if self.tactical_slot:
+                    tactical_target = vec(self.tactical_slot)
             
             # Direction towards the tactical spot
             # Use pathfinding to navigate to tactical target
@@ -1845,8 +1922,12 @@ class TeamAI(pygame.sprite.Sprite):
                 should_recalc = True
             elif now - self.path_recalc_timer > 1000:  # Recalc every 1 second
                 should_recalc = True
+            # Members that still have a path keep following it if this frame's replans are used up
+            if should_recalc and self.path and self.game.team_replans_left <= 0:
+                should_recalc = False
             
             if should_recalc and hasattr(self.game, 'pathfinding_grid'):
+                self.game.team_replans_left -= 1
                 from pathfinding import find_path
                 self.path = find_path((self.pos.x, self.pos.y), (tactical_target.x, tactical_target.y),
                                      self.game.pathfinding_grid)
@@ -1881,18 +1962,11 @@ class TeamAI(pygame.sprite.Sprite):
                 # Fallback to direct movement
                 dir = tactical_target - self.pos
             
-            # SPACING: Avoid crowding other teammates
-            teammates = self.game.team_allies if self.team == 'blue' else self.game.team_enemies
-            spacing_force = vec(0, 0)
-            for teammate in teammates:
-                if teammate != self:
-                    dist_to_teammate = (self.pos - teammate.pos).length()
-                    if 0 < dist_to_teammate < 80: # Too close
-                        # Push away from teammate
-                        spacing_force += (self.pos - teammate.pos).normalize() * (80 - dist_to_teammate)
+            # SPACING: Avoid crowding other teammates (force precomputed per think tick)
+            spacing_force = self.game.squads.get_spacing_force(self)
             
             # Combine direct interest with spacing
-            if spacing_force.length() > 0:
+            if spacing_force.length() > 0 and dir.length() > 0:
                 dir = (dir.normalize() + spacing_force.normalize() * 0.5).normalize()
 
             # Avoid last stuck position if recent (within 5 seconds)
@@ -1960,20 +2034,19 @@ class TeamAI(pygame.sprite.Sprite):
                 self.rect.y = self.pos.y
 
     def take_damage(self, amount):
-        print(f"DEBUG: {self.team} TeamAI.take_damage called! Amount: {amount}, HP before: {self.hp}")
         self.hp -= amount
-        print(f"DEBUG: {self.team} TeamAI HP after: {self.hp}")
         if self.hp <= 0:
-            print(f"DEBUG: {self.team} TeamAI died! Scheduling respawn...")
             # Schedule respawn instead of permanent death
-            spawn_x = MAP_WIDTH - 200 if self.team == 'blue' else 100
-            spawn_y = MAP_HEIGHT - 200 if self.team == 'blue' else 100
-            self.game.schedule_team_respawn(self.team, spawn_x, spawn_y)
+            self.game.schedule_team_respawn(self.team, self.member_index)
             self.kill()
 
 
 class Civilian(pygame.sprite.Sprite):
     """Peaceful civilian that wanders around. Triggers uprising if hit."""
+    render_layer = LAYER_AGENTS
+    health_bar = 'hp'
+    render_static = False
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites, game.civilians
         pygame.sprite.Sprite.__init__(self, self.groups)
@@ -2071,7 +2144,7 @@ class Civilian(pygame.sprite.Sprite):
         
         if self.hp <= 0:
             # Show hit marker
-            HitMarker(self.game, self.rect.centerx, self.rect.centery)
+            self.game.effects.hit_marker(self.rect.centerx, self.rect.centery)
 
             # TRIGGER UPRISING: Spawn 20 aggressive civilians
             print(f"[UPRISING] Civilian killed by {attacker}! Spawning 20 aggressive civilians!")
@@ -2082,11 +2155,16 @@ class Civilian(pygame.sprite.Sprite):
 
 class UprisingCivilian(pygame.sprite.Sprite):
     """Aggressive civilian spawned during uprising. Attacks the perpetrator."""
-    def __init__(self, game, x, y, target):
+    render_layer = LAYER_AGENTS
+    health_bar = 'hp'
+    render_static = False
+
+    def __init__(self, game, x, y, target, wave=None):
         self.groups = game.all_sprites, game.uprising_civilians
         pygame.sprite.Sprite.__init__(self, self.groups)
         self.game = game
         self.target = target  # Who to attack (player or enemy)
+        self.wave = wave  # UprisingWave sharing a flow field towards the original target
 
         # Visual: White with red dot (angry civilian)
         self.image = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE))
@@ -2121,6 +2199,11 @@ class UprisingCivilian(pygame.sprite.Sprite):
 
     def has_line_of_sight(self, target_pos):
         """Check if there's a clear line of sight to target"""
+        return self.game.los_cache.check('uprising', self.rect.center, target_pos, pygame.time.get_ticks(),
+                                         lambda: self._raycast_line_of_sight(target_pos))
+
+    def _raycast_line_of_sight(self, target_pos):
+        """Uncached raycast behind has_line_of_sight"""
         start = vec(self.rect.centerx, self.rect.centery)
         end = vec(target_pos[0], target_pos[1])
 
@@ -2156,17 +2239,10 @@ class UprisingCivilian(pygame.sprite.Sprite):
             from sprites import Enemy
             if isinstance(self.target, Enemy) or not isinstance(self.target, Player):
                 # Find nearest enemy as new target
-                nearest_enemy = None
-                nearest_dist = float('inf')
-                for enemy in self.game.enemies:
-                    dist = (enemy.pos - self.pos).length()
-                    if dist < nearest_dist:
-                        nearest_dist = dist
-                        nearest_enemy = enemy
+                nearest_enemy = self.game.neighbor_index.nearest(self.rect.center, 'enemies')
 
                 if nearest_enemy:
                     self.target = nearest_enemy
-                    print(f"[UPRISING] Civilian switched to new enemy target!")
                 else:
                     # No more enemies, mission accomplished
                     self.kill()
@@ -2179,10 +2255,17 @@ class UprisingCivilian(pygame.sprite.Sprite):
         now = pygame.time.get_ticks()
         target_pos = self.target.pos
 
+        # Wave members chasing the original attacker share the wave's flow field
+        flow_field = None
+        if self.wave and self.target is self.wave.attacker:
+            flow_field = self.wave.flow_field
+
         # Pathfinding-based movement towards target
         should_recalc = False
 
-        if self.path_target_pos is None:
+        if flow_field:
+            pass  # No individual path needed
+        elif self.path_target_pos is None:
             should_recalc = True
         elif (target_pos - self.path_target_pos).length() > 100:
             should_recalc = True
@@ -2197,8 +2280,14 @@ class UprisingCivilian(pygame.sprite.Sprite):
             self.path_recalc_timer = now
             self.current_waypoint_index = 0
 
-        # Follow path
-        if self.path and len(self.path) > 0:
+        # Follow flow field or path
+        if flow_field:
+            waypoint = flow_field.next_waypoint((self.pos.x, self.pos.y))
+            if waypoint:
+                dir = vec(waypoint[0], waypoint[1]) - self.pos
+            else:
+                dir = target_pos - self.pos
+        elif self.path and len(self.path) > 0:
             if self.current_waypoint_index < len(self.path):
                 waypoint = self.path[self.current_waypoint_index]
                 waypoint_vec = vec(waypoint[0], waypoint[1])
@@ -2254,7 +2343,6 @@ class UprisingCivilian(pygame.sprite.Sprite):
 
             if self.has_line_of_sight(predicted_target):
                 self.game.shoot(self, predicted_target)
-                print(f"[DEBUG] UprisingCivilian shooting at target! Weapon: {self.weapon}")
 
     def collide_with_walls(self, dir):
         if dir == 'x':
@@ -2282,7 +2370,7 @@ class UprisingCivilian(pygame.sprite.Sprite):
 
         if self.hp <= 0:
             # Show hit marker
-            HitMarker(self.game, self.rect.centerx, self.rect.centery)
+            self.game.effects.hit_marker(self.rect.centerx, self.rect.centery)
             # Give score
             if hasattr(self.game, 'score'):
                 self.game.score += 50
@@ -0,0 +1,195 @@
+import pygame
+from pathfinding import find_path
+vec = pygame.math.Vector2
+
+
+class Squad:
+    """A cluster of AI agents that shares one regroup point and one path per target (planned on first request)"""
+
+    def __init__(self, members):
+        self.members = members
+        self.centroid = vec(0, 0)
+        for member in members:
+            self.centroid += vec(member.rect.center)
+        self.centroid /= len(members)
+
+        # Shared paths towards the squad objectives: target cell -> (path, ticks when planned)
+        self.paths = {}
+
+    def inherit_paths(self, other):
+        """Keep the paths of the squad these members formed at the previous think tick"""
+        self.paths = other.paths
+
+    def entry_index(self, path, pos, grid):
+        """
+        Index of the waypoint where a member at pos joins the path: the closest one it
+        can walk to in a straight line, or None if no waypoint is reachable like that.
+        """
+        by_distance = sorted(range(len(path)),
+                             key=lambda i: (path[i][0] - pos[0]) ** 2 + (path[i][1] - pos[1]) ** 2)
+        for i in by_distance:
+            if grid.line_walkable(pos, path[i]):
+                return i
+        return None
+
+
+class SquadCoordinator:
+    """
+    Makes group-level AI decisions once per squad per think tick instead of once per agent per frame.
+    - Enemy squads: clusters enemies by proximity, gives isolated enemies a regroup point
+      and lets squad members with the same target share one A* path. A path is planned
+      only when a member asks for one, at most once per replan_interval per squad and target.
+    - Team squads: groups TeamAI members by their target and assigns encirclement slots
+      plus a precomputed teammate spacing force, so members only steer locally.
+    """
+
+    def __init__(self, game, think_interval=250, link_radius=150, spacing_radius=80, replan_interval=1000):
+        self.game = game
+        self.think_interval = think_interval  # ms between group decisions
+        self.replan_interval = replan_interval  # ms a shared path stays valid (same cadence as a lone enemy)
+        self.link_radius = link_radius  # Agents closer than this belong to the same squad
+        self.spacing_radius = spacing_radius  # Teammates closer than this push each other away
+        self.last_think = -think_interval
+
+        self.enemy_squads = []
+        self.squad_of = {}  # Enemy -> Squad
+        self.regroup_targets = {}  # Enemy -> vec (only isolated enemies)
+        self.slot_angles = {}  # TeamAI -> encirclement angle in degrees
+        self.spacing_forces = {}  # TeamAI -> vec
+
+    def update(self, now):
+        """Run one think tick if the interval has elapsed"""
+        if now - self.last_think < self.think_interval:
+            return
+        self.last_think = now
+
+        self._think_enemy_squads()
+        if self.game.game_mode == 'team5v5':
+            self._think_team_squads()
+
+    def _cluster(self, agents, category):
+        """Group agents into squads by linking everyone within link_radius (union-find)"""
+        parent = {agent: agent for agent in agents}
+
+        def find(agent):
+            while parent[agent] is not agent:
+                parent[agent] = parent[parent[agent]]
+                agent = parent[agent]
+            return agent
+
+        neighbor_index = self.game.neighbor_index
+        for agent in agents:
+            for other in neighbor_index.within_radius(agent.rect.center, category, self.link_radius, exclude=agent):
+                if other in parent:
+                    root_a, root_b = find(agent), find(other)
+                    if root_a is not root_b:
+                        parent[root_b] = root_a
+
+        clusters = {}
+        for agent in agents:
+            clusters.setdefault(find(agent), []).append(agent)
+        return [Squad(members) for members in clusters.values()]
+
+    def _think_enemy_squads(self):
+        enemies = self.game.enemies.sprites()
+        previous_squad_of = self.squad_of
+        self.enemy_squads = self._cluster(enemies, 'enemies') if enemies else []
+        self.squad_of = {}
+        for squad in self.enemy_squads:
+            for member in squad.members:
+                self.squad_of[member] = squad
+            # Re-clustering every tick must not throw away a still valid shared path
+            previous = previous_squad_of.get(squad.members[0])
+            if previous and previous.paths and (squad.centroid - previous.centroid).length() < self.link_radius:
+                squad.inherit_paths(previous)
+
+        # Regroup point: isolated enemies head for the centroid of the squad of their nearest ally
+        self.regroup_targets = {}
+        neighbor_index = self.game.neighbor_index
+        for squad in self.enemy_squads:
+            if len(squad.members) != 1:
+                continue
+            enemy = squad.members[0]
+            nearest_ally = neighbor_index.nearest(enemy.rect.center, 'enemies', exclude=enemy)
+            if nearest_ally in self.squad_of:
+                self.regroup_targets[enemy] = self.squad_of[nearest_ally].centroid
+
+    def _think_team_squads(self):
+        from sprites import TeamAI
+
+        self.slot_angles = {}
+        self.spacing_forces = {}
+        neighbor_index = self.game.neighbor_index
+
+        for team, group, category in (('blue', self.game.team_allies, 'team_blue'),
+                                      ('red', self.game.team_enemies, 'team_red')):
+            # Group members by the enemy they are going after
+            by_target = {}
+            for member in group:
+                if not isinstance(member, TeamAI):
+                    continue
+                target = member.find_closest_enemy()
+                if target:
+                    by_target.setdefault(target, []).append(member)
+
+                # Spacing force from teammates within spacing_radius (includes the player)
+                spacing_force = vec(0, 0)
+                for teammate in neighbor_index.within_radius(member.rect.center, category,
+                                                             self.spacing_radius, exclude=member):
+                    away = member.pos - teammate.pos
+                    dist = away.length()
+                    if 0 < dist < self.spacing_radius:
+                        spacing_force += away.normalize() * (self.spacing_radius - dist)
+                self.spacing_forces[member] = spacing_force
+
+            # Encirclement: spread the members evenly around their target, keeping their current order
+            for target, members in by_target.items():
+                target_center = vec(target.rect.center)
+                members.sort(key=lambda m: (vec(m.rect.center) - target_center).as_polar()[1])
+                base_angle = (vec(members[0].rect.center) - target_center).as_polar()[1]
+                step = 360 / len(members)
+                for i, member in enumerate(members):
+                    self.slot_angles[member] = base_angle + i * step
+
+    def get_regroup_target(self, enemy):
+        """Regroup point for an isolated enemy, or None if it already belongs to a squad"""
+        return self.regroup_targets.get(enemy)
+
+    def get_shared_path(self, enemy, target_pos, now):
+        """
+        Shared squad path towards target_pos as (path, start_index), or None if the enemy
+        should plan its own path (no squad, far from the squad, or no waypoint it can walk
+        to directly). Members heading for the same target cell share one path, which is
+        planned by the first member asking and replanned once older than replan_interval.
+        """
+        squad = self.squad_of.get(enemy)
+        if squad is None or len(squad.members) < 2:
+            return None
+        if (vec(enemy.rect.center) - squad.centroid).length() > self.link_radius * 2:
+            return None
+        grid = getattr(self.game, 'pathfinding_grid', None)
+        if grid is None:
+            return None
+        key = grid.world_to_grid(target_pos.x, target_pos.y)
+        entry = squad.paths.get(key)
+        if entry is None or now - entry[1] > self.replan_interval:
+            # The first member asking plans from its own position; squadmates join that path
+            squad.paths = {k: e for k, e in squad.paths.items() if now - e[1] <= self.replan_interval}
+            path = find_path(enemy.rect.center, (target_pos.x, target_pos.y), grid)
+            squad.paths[key] = (path, now)
+            return path, 0  # Empty if there is no way; planning it again alone would not help
+        path = entry[0]
+        if not path:
+            return None
+        start_index = squad.entry_index(path, enemy.rect.center, grid)
+        if start_index is None:
+            return None
+        return path, start_index
+
+    def get_slot_angle(self, member):
+        """Encirclement angle assigned to a TeamAI member, or None"""
+        return self.slot_angles.get(member)
+
+    def get_spacing_force(self, member):
+        """Precomputed push away from crowding teammates"""
+        return self.spacing_forces.get(member, vec(0, 0))
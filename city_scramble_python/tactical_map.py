@@ -0,0 +1,100 @@
+import math
+
+# 8 directions in the same order as PathfindingGrid.get_neighbors: N, NE, E, SE, S, SW, W, NW
+DIRECTIONS = [
+    (0, -1), (1, -1), (1, 0), (1, 1),
+    (0, 1), (-1, 1), (-1, 0), (-1, -1)
+]
+
+
+class TacticalMap:
+    """
+    Baked tactical data per navigation cell for TeamAI positioning.
+    For every cell of the PathfindingGrid it stores:
+    - cover: 8-bit mask, bit d set if a wall is within `cover_range` cells in direction d
+    - exposure: number of directions with an open view of at least `exposure_range` cells
+    Walkability comes from the pathfinding grid itself. Only cells near a changed
+    obstacle are recomputed (update_region), so the map stays valid all match long.
+    """
+
+    def __init__(self, pathfinding_grid, cover_range=2, exposure_range=6):
+        self.grid = pathfinding_grid
+        self.cover_range = cover_range
+        self.exposure_range = exposure_range
+        self.cover = [[0] * self.grid.grid_width for _ in range(self.grid.grid_height)]
+        self.exposure = [[0] * self.grid.grid_width for _ in range(self.grid.grid_height)]
+        self.build()
+
+    def _is_blocked(self, grid_x, grid_y):
+        """Walls block, map edges do not (they give no cover)"""
+        if grid_x < 0 or grid_x >= self.grid.grid_width or grid_y < 0 or grid_y >= self.grid.grid_height:
+            return False
+        return self.grid.grid[grid_y][grid_x] == 1
+
+    def _compute_cell(self, grid_x, grid_y):
+        cover = 0
+        exposure = 0
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            open_cells = 0
+            for step in range(1, self.exposure_range + 1):
+                nx, ny = grid_x + dx * step, grid_y + dy * step
+                if self._is_blocked(nx, ny):
+                    if step <= self.cover_range:
+                        cover |= 1 << d
+                    break
+                open_cells += 1
+            if open_cells >= self.exposure_range:
+                exposure += 1
+        self.cover[grid_y][grid_x] = cover
+        self.exposure[grid_y][grid_x] = exposure
+
+    def build(self):
+        """Bake the whole map (once per match)"""
+        for grid_y in range(self.grid.grid_height):
+            for grid_x in range(self.grid.grid_width):
+                self._compute_cell(grid_x, grid_y)
+
+    def update_region(self, rect):
+        """Recompute cells whose cover or exposure can be affected by a change inside rect"""
+        x1, y1, x2, y2 = self.grid.cell_bounds(rect)
+        margin = self.exposure_range
+        for grid_y in range(max(0, y1 - margin), min(self.grid.grid_height - 1, y2 + margin) + 1):
+            for grid_x in range(max(0, x1 - margin), min(self.grid.grid_width - 1, x2 + margin) + 1):
+                self._compute_cell(grid_x, grid_y)
+
+    def direction_index(self, from_pos, to_pos):
+        """Index into DIRECTIONS closest to the direction from from_pos to to_pos"""
+        angle = math.degrees(math.atan2(to_pos[1] - from_pos[1], to_pos[0] - from_pos[0]))
+        return int(round((angle + 90) / 45)) % 8
+
+    def cover_towards(self, grid_x, grid_y, threat_pos):
+        """Cover score (0-2) of a cell against a threat: 2 = wall directly between, 1 = diagonal cover"""
+        cell_pos = self.grid.grid_to_world(grid_x, grid_y)
+        d = self.direction_index(cell_pos, threat_pos)
+        mask = self.cover[grid_y][grid_x]
+        if mask & (1 << d):
+            return 2
+        if mask & (1 << ((d + 1) % 8)) or mask & (1 << ((d - 1) % 8)):
+            return 1
+        return 0
+
+    def find_slot(self, threat_pos, desired_pos, search_radius=3):
+        """
+        Snap a desired position to the best nearby walkable cell: prefers cover against
+        threat_pos, low exposure and staying close to desired_pos.
+        Returns world coordinates of the cell center, or None if nothing walkable is near.
+        """
+        center_x, center_y = self.grid.world_to_grid(desired_pos[0], desired_pos[1])
+        best_pos = None
+        best_score = -float('inf')
+        for grid_y in range(center_y - search_radius, center_y + search_radius + 1):
+            for grid_x in range(center_x - search_radius, center_x + search_radius + 1):
+                if not self.grid.is_walkable(grid_x, grid_y):
+                    continue
+                score = (self.cover_towards(grid_x, grid_y, threat_pos) * 2
+                         - self.exposure[grid_y][grid_x] * 0.5
+                         - max(abs(grid_x - center_x), abs(grid_y - center_y)))
+                if score > best_score:
+                    best_score = score
+                    best_pos = self.grid.grid_to_world(grid_x, grid_y)
+        return best_pos
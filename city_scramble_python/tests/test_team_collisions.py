@@ -0,0 +1,41 @@
+import pygame
+from neighbor_index import NeighborIndex
+from sprites import Projectile, TeamAI
+
+
+class TeamMatchStub:
+    """Just the Game attributes team projectiles and TeamAI touch"""
+
+    def __init__(self):
+        self.all_sprites = pygame.sprite.Group()
+        self.projectiles = pygame.sprite.Group()
+        self.walls = pygame.sprite.Group()
+        self.civilians = pygame.sprite.Group()
+        self.uprising_civilians = pygame.sprite.Group()
+        self.team_allies = pygame.sprite.Group()
+        self.team_enemies = pygame.sprite.Group()
+        self.neighbor_index = NeighborIndex(cell_size=200)
+        self.team_respawn_queue = []
+        self.team_blue_score = 0
+        self.dt = 0
+
+    def schedule_team_respawn(self, team, member_index):
+        self.team_respawn_queue.append((0, team, member_index))
+
+
+def test_volley_kills_team_member_once():
+    game = TeamMatchStub()
+    target = TeamAI(game, 500, 500, team='red', member_index=3)
+    game.neighbor_index.rebuild({'team_blue': game.team_allies, 'team_red': game.team_enemies})
+
+    # Two overlapping pellets, each lethal on its own, resolved in the same frame
+    pellets = [Projectile(game, *target.rect.center, 1, 0, 'team_blue', target.max_hp, 0, 1000, (255, 255, 255))
+               for _ in range(2)]
+    for pellet in pellets:
+        pellet.update()
+
+    assert not target.alive()
+    assert game.team_respawn_queue == [(0, 'red', 3)]
+    assert game.team_blue_score == target.max_hp
+    # The second pellet finds nobody left to hit and keeps flying
+    assert not pellets[0].alive() and pellets[1].alive()
@@ -5,6 +5,10 @@ vec = pygame.math.Vector2
 
 class UpgradeItem(pygame.sprite.Sprite):
     """Upgrade items that AI enemies can pick up"""
+    render_layer = LAYER_ITEMS
+    health_bar = None
+    render_static = True
+
     def __init__(self, game, x, y):
         self.groups = game.all_sprites, game.upgrade_items
         pygame.sprite.Sprite.__init__(self, self.groups)
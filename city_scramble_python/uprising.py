@@ -0,0 +1,60 @@
+import random
+from settings import *
+from pathfinding import FlowField
+
+
+class UprisingWave:
+    """
+    A civilian uprising spawned as a staged wave instead of all at once.
+    Spawn points are drawn from the precomputed free-space samples around the killed
+    civilian, a few civilians appear per frame, and the whole wave shares one flow field
+    towards the attacker instead of every civilian running its own A* search.
+    """
+
+    def __init__(self, game, attacker, origin, count, spawn_radius=300, per_frame=8, field_interval=500):
+        self.game = game
+        self.attacker = attacker
+        self.per_frame = per_frame  # Civilians spawned per frame
+        self.field_interval = field_interval  # ms between flow field refreshes
+        self.members = []
+        self.flow_field = None
+        self.field_goal_cell = None
+        self.last_field_time = 0
+
+        # Pick spawn points from free-space samples within spawn_radius of the killed civilian
+        ox, oy = origin[0], origin[1]
+        nearby = [(x - PLAYER_SIZE // 2, y - PLAYER_SIZE // 2) for x, y in game.free_space_samples
+                  if abs(x - ox) <= spawn_radius and abs(y - oy) <= spawn_radius]
+        if not nearby:
+            nearby = [(ox, oy)]  # The civilian was standing there, so it is free
+        self.pending = [random.choice(nearby) for _ in range(count)]
+
+    @property
+    def done(self):
+        return not self.pending and not any(member.alive() for member in self.members)
+
+    def update(self, now):
+        from sprites import UprisingCivilian
+
+        # Staged spawning
+        batch, self.pending = self.pending[:self.per_frame], self.pending[self.per_frame:]
+        for x, y in batch:
+            x = max(0, min(MAP_WIDTH - PLAYER_SIZE, x))
+            y = max(0, min(MAP_HEIGHT - PLAYER_SIZE, y))
+            self.members.append(UprisingCivilian(self.game, x, y, self.attacker, wave=self))
+
+        # Shared flow field towards the attacker, rebuilt when the attacker changes cell.
+        # The search only reaches as far as the wave members, not the whole map.
+        if self.attacker.alive() and hasattr(self.game, 'pathfinding_grid'):
+            grid = self.game.pathfinding_grid
+            goal_cell = grid.world_to_grid(self.attacker.pos.x, self.attacker.pos.y)
+            member_cells = [grid.world_to_grid(m.pos.x, m.pos.y) for m in self.members if m.alive()]
+            if not member_cells:
+                return
+            # Newly spawned members may still be outside the bounded field
+            stale = (goal_cell != self.field_goal_cell or
+                     any(cell not in self.flow_field.distances for cell in member_cells))
+            if stale and now - self.last_field_time > self.field_interval:
+                self.flow_field = FlowField(grid, (self.attacker.pos.x, self.attacker.pos.y), targets=member_cells)
+                self.field_goal_cell = goal_cell
+                self.last_field_time = now
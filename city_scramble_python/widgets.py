@@ -0,0 +1,187 @@
+from abc import ABC, abstractmethod
+import pygame
+from settings import *
+
+
+class Widget(ABC):
+    """
+    Base class of the retained-mode menu widgets.
+    A widget keeps its rendered surface and only renders it again after its
+    state actually changed (see set); WidgetScreen then redraws just that area.
+    """
+
+    def __init__(self, rect, action=None):
+        self.rect = pygame.Rect(rect)
+        self.action = action  # Returned by WidgetScreen.widget_at when clicked (None = not clickable)
+        self.visible = True
+        self.surface = None
+        self.changed = True
+        self.drawn_rect = None  # Screen area covered by the last blit
+        self.layer = 0  # Set by WidgetScreen.add
+
+    def set(self, **state):
+        """Update attributes; re-render only if one of them really changed"""
+        for name, value in state.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                self.surface = None
+                self.changed = True
+
+    @abstractmethod
+    def render(self):
+        """Build the widget's surface (may also resize self.rect)"""
+
+    def draw(self, screen):
+        if self.surface is None:
+            self.surface = self.render()
+        return screen.blit(self.surface, self.rect)
+
+
+class Label(Widget):
+    """Single line of text anchored at a point (e.g. anchor='midtop' centers it horizontally)"""
+
+    def __init__(self, pos, text, font, color=WHITE, anchor='midtop'):
+        super().__init__((0, 0, 0, 0))
+        self.pos = pos
+        self.text = text
+        self.font = font
+        self.color = color
+        self.anchor = anchor
+
+    def render(self):
+        surface = self.font.render(self.text, True, self.color)
+        self.rect = surface.get_rect(**{self.anchor: self.pos})
+        return surface
+
+
+class Button(Widget):
+    """
+    Filled rect with border and text. Layouts:
+    'center' - text centered
+    'stacked' - text top-left, detail below it (shop color swatches)
+    'split' - text left, detail right-aligned (name / price)
+    """
+
+    def __init__(self, rect, text, font, fill, action=None, text_color=WHITE, border_color=WHITE,
+                 border_width=3, detail="", layout='center'):
+        super().__init__(rect, action)
+        self.text = text
+        self.font = font
+        self.fill = fill
+        self.text_color = text_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.detail = detail
+        self.layout = layout
+
+    def render(self):
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(self.fill)
+        pygame.draw.rect(surface, self.border_color, surface.get_rect(), self.border_width)
+
+        text = self.font.render(self.text, True, self.text_color)
+        if self.layout == 'stacked':
+            surface.blit(text, (10, 5))
+            surface.blit(self.font.render(self.detail, True, self.text_color), (10, 27))
+        elif self.layout == 'split':
+            surface.blit(text, (10, 15))
+            detail = self.font.render(self.detail, True, self.text_color)
+            surface.blit(detail, (self.rect.width - detail.get_width() - 10, 15))
+        else:
+            surface.blit(text, text.get_rect(center=surface.get_rect().center))
+        return surface
+
+
+class Grid:
+    """Cell rects for a number of items, `columns` per row, centered horizontally on center_x"""
+
+    def __init__(self, columns, cell_width, cell_height, gap_x, row_pitch, top, center_x=SCREEN_WIDTH // 2):
+        self.columns = columns
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.gap_x = gap_x
+        self.row_pitch = row_pitch  # Distance from one row's top to the next
+        self.top = top
+        self.left = center_x - (columns * cell_width + (columns - 1) * gap_x) // 2
+
+    def rects(self, count):
+        return [pygame.Rect(self.left + (i % self.columns) * (self.cell_width + self.gap_x),
+                            self.top + (i // self.columns) * self.row_pitch,
+                            self.cell_width, self.cell_height)
+                for i in range(count)]
+
+
+class WidgetScreen:
+    """
+    A menu screen made of widgets.
+    The first present() draws everything and flips; later calls only clear and
+    redraw widgets whose state changed (plus the widgets they overlap) and update
+    those rects on the display.
+    Adding or removing widgets (or a window expose) forces a full redraw.
+    """
+
+    def __init__(self, background=DARK_GREY):
+        self.background = background
+        self.widgets = []
+        self.full_redraw = True
+
+    def add(self, widget, layer=0):
+        """Add a widget; higher layers are drawn above (and clicked before) lower ones"""
+        widget.layer = layer
+        self.widgets.append(widget)
+        self.widgets.sort(key=lambda w: w.layer)  # Stable: same layer keeps insertion order
+        self.full_redraw = True
+        return widget
+
+    def remove(self, widgets):
+        removed = set(widgets)
+        self.widgets = [w for w in self.widgets if w not in removed]
+        self.full_redraw = True
+
+    def widget_at(self, pos):
+        """Topmost visible clickable widget at a screen position"""
+        for widget in reversed(self.widgets):
+            if widget.visible and widget.action is not None and widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def present(self, screen):
+        if self.full_redraw:
+            screen.fill(self.background)
+            for widget in self.widgets:
+                widget.drawn_rect = widget.draw(screen) if widget.visible else None
+                widget.changed = False
+            pygame.display.flip()
+            self.full_redraw = False
+            return
+
+        redraw = {widget for widget in self.widgets if widget.changed}
+        if not redraw:
+            return
+        # Areas that get cleared or painted over: old and new rects of the changed widgets
+        areas = []
+        for widget in redraw:
+            if widget.drawn_rect:
+                areas.append(widget.drawn_rect)
+            if widget.visible:
+                if widget.surface is None:
+                    widget.surface = widget.render()  # Render now so self.rect is final
+                areas.append(widget.rect)
+        # Unchanged widgets overlapping those areas are redrawn as well (and may pull in more)
+        grown = True
+        while grown:
+            grown = False
+            for widget in self.widgets:
+                if widget not in redraw and widget.drawn_rect and widget.drawn_rect.collidelist(areas) != -1:
+                    redraw.add(widget)
+                    areas.append(widget.drawn_rect)
+                    grown = True
+
+        for widget in self.widgets:
+            if widget in redraw and widget.drawn_rect:
+                screen.fill(self.background, widget.drawn_rect)
+        for widget in self.widgets:
+            if widget in redraw:
+                widget.drawn_rect = widget.draw(screen) if widget.visible else None
+                widget.changed = False
+        pygame.display.update(areas)